@@ -0,0 +1,7 @@
+"""Helpers shared by the benchmark scripts."""
+
+from chess_action_space._testing import random_boards
+
+__all__ = [
+    'random_boards',
+]
@@ -0,0 +1,36 @@
+"""
+Measure the throughput of `VectorEnv` in steps per second, playing uniformly random legal actions.
+
+Usage: `python benchmarks/bench_env.py [--num-envs N] [--steps S]`
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from chess_action_space import VectorEnv
+
+
+def bench_env(num_envs: int, steps: int, seed: int = 0) -> float:
+    """Return the number of game steps per second (summed over all games)."""
+    rng = np.random.default_rng(seed)
+    env = VectorEnv()
+    result = env.reset(num_envs)
+    start = time.perf_counter()
+    for _ in range(steps):
+        # Pick a uniformly random legal action per game
+        scores = np.where(result.masks, rng.random(result.masks.shape), -1.0)
+        result = env.step(scores.argmax(axis=1))
+    elapsed = time.perf_counter() - start
+    return num_envs * steps / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--num-envs', type=int, default=256)
+    parser.add_argument('--steps', type=int, default=200)
+    args = parser.parse_args()
+
+    steps_per_second = bench_env(args.num_envs, args.steps)
+    print(f'{args.num_envs} envs: {steps_per_second:,.0f} steps/s')
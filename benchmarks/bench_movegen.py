@@ -0,0 +1,82 @@
+"""
+Break the throughput of `get_legal_masks_vectorized` down by stage, in positions per second, next to the bare
+NumPy gather of one byte per action that building `(N, ACTION_SPACE_SIZE)` masks requires at least.
+
+Usage: `python benchmarks/bench_movegen.py [--positions N] [--repeat R]`
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+from _common import random_boards
+
+from chess_action_space import (
+    ACTION_SPACE_SIZE,
+    DEFAULT_ORDERING,
+    get_boards_array,
+    get_legal_masks_vectorized,
+)
+from chess_action_space.movegen import (
+    _destinations_to_masks,
+    _filter_legal_destinations,
+    _get_action_bits,
+    _get_king_safety,
+    _get_pseudo_legal_destinations,
+    _Positions,
+)
+
+
+def bench(fn: Callable[[], object], num_positions: int, repeat: int) -> float:
+    """Return the number of positions per second of `fn` (best of `repeat` runs)."""
+    fn()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return num_positions / best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--positions', type=int, default=8192)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    positions = get_boards_array(random_boards(args.positions))
+    n = len(positions)
+    out = np.empty((n, ACTION_SPACE_SIZE), dtype=np.bool_)
+    p = _Positions.from_array(positions)
+    safety = _get_king_safety(p)
+    pieces = _filter_legal_destinations(p, safety, _get_pseudo_legal_destinations(p))
+    destinations = np.zeros((n, 128), dtype='<u8')
+    action_byte, _ = _get_action_bits(DEFAULT_ORDERING)
+    gathered = np.empty((n, ACTION_SPACE_SIZE), dtype=np.uint8)
+
+    stages: list[tuple[str, Callable[[], object]]] = [
+        (
+            'get_legal_masks_vectorized',
+            lambda: get_legal_masks_vectorized(positions, out),
+        ),
+        ('king safety', lambda: _get_king_safety(p)),
+        ('pseudo-legal destinations', lambda: _get_pseudo_legal_destinations(p)),
+        (
+            'legal destinations',
+            lambda: _filter_legal_destinations(p, safety, pieces),
+        ),
+        (
+            'destinations to masks',
+            lambda: _destinations_to_masks(n, pieces, out, DEFAULT_ORDERING),
+        ),
+        (
+            'bare byte gather',
+            lambda: np.take(
+                destinations.view(np.uint8), action_byte, axis=1, out=gathered
+            ),
+        ),
+        ('np.packbits of the masks', lambda: np.packbits(out, axis=1)),
+    ]
+    for name, fn in stages:
+        print(f'{name:<28} {bench(fn, n, args.repeat):>12,.0f} positions/s')
@@ -0,0 +1,61 @@
+"""
+Measure how `get_legal_masks_parallel` scales with the number of threads, on GIL and free-threaded builds.
+
+Usage: `python benchmarks/bench_parallel.py [--positions N] [--threads 1 2 4 ...]`
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import chess
+from _common import random_boards
+
+from chess_action_space import get_legal_masks, get_legal_masks_parallel
+
+
+def bench_parallel(
+    boards: list[chess.Board], num_threads: int, repeat: int = 3
+) -> float:
+    """Return the number of masks built per second with `num_threads` threads (best of `repeat` runs)."""
+    best = float('inf')
+    with ThreadPoolExecutor(num_threads) as executor:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            get_legal_masks_parallel(boards, executor=executor)
+            best = min(best, time.perf_counter() - start)
+    return len(boards) / best
+
+
+def bench_serial(boards: list[chess.Board], repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        get_legal_masks(boards)
+        best = min(best, time.perf_counter() - start)
+    return len(boards) / best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--positions', type=int, default=20_000)
+    parser.add_argument(
+        '--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(
+        f'Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}, {os.cpu_count()} CPUs'
+    )
+    boards = random_boards(args.positions)
+    serial = bench_serial(boards)
+    print(f'serial: {serial:,.0f} masks/s')
+    for num_threads in args.threads:
+        masks_per_second = bench_parallel(boards, num_threads)
+        print(
+            f'{num_threads} threads: {masks_per_second:,.0f} masks/s'
+            f' ({masks_per_second / serial:.2f}x)'
+        )
@@ -0,0 +1,268 @@
+"""
+Benchmark every hot path of the package and compare the results with stored baselines.
+
+Each benchmark reports operations per second (best of several timed runs) and the memory allocated by one call,
+measured separately with `tracemalloc`: the number of blocks still allocated after the call and the peak traced
+size during it.
+
+Usage:
+
+- `python benchmarks/run.py` runs every benchmark and compares it with `benchmarks/baselines.json`
+- `python benchmarks/run.py -k masks` only runs benchmarks whose name contains `masks`
+- `python benchmarks/run.py --save` stores the results as the new baselines
+- `python benchmarks/run.py --tolerance 0.5` fails (exit code 1) if a benchmark is more than 50% slower than its
+  baseline (30% by default)
+
+Timings depend on the machine, so baselines should be saved and compared on the same one.
+"""
+
+import argparse
+import gc
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import chess
+import numpy as np
+from _common import random_boards
+
+from chess_action_space import (
+    ACTION_SPACE,
+    ACTION_UCI,
+    get_action,
+    get_action_index,
+    get_board_move,
+    get_boards_array,
+    get_legal_mask,
+    get_legal_masks,
+    get_possible_to_squares_mask,
+    index_to_uci,
+    iter_action_space,
+    parse_fens,
+    uci_to_index,
+)
+from chess_action_space.generate import build_artifacts
+
+BASELINES_PATH = Path(__file__).parent / 'baselines.json'
+
+_Benchmark = Callable[[], tuple[Callable[[], object], int]]
+"""Set up a benchmark and return the function to time and the number of operations per call."""
+
+_BENCHMARKS: dict[str, _Benchmark] = {}
+
+
+def _benchmark(name: str) -> Callable[[_Benchmark], _Benchmark]:
+    def register(setup: _Benchmark) -> _Benchmark:
+        _BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@_benchmark('import')
+def _bench_import() -> tuple[Callable[[], object], int]:
+    # `import chess_action_space` alone loads no table (see its `__getattr__`), so import the modules that do
+    code = 'import chess_action_space.encoding, chess_action_space.movegen'
+
+    def fn() -> None:
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    return fn, 1
+
+
+@_benchmark('iter_action_space_fast')
+def _bench_iter_action_space_fast() -> tuple[Callable[[], object], int]:
+    return lambda: list(iter_action_space(fast=True)), len(ACTION_SPACE)
+
+
+@_benchmark('iter_action_space_slow')
+def _bench_iter_action_space_slow() -> tuple[Callable[[], object], int]:
+    return lambda: list(iter_action_space(fast=False)), len(ACTION_SPACE)
+
+
+@_benchmark('get_possible_to_squares_mask')
+def _bench_possible_to_squares_mask() -> tuple[Callable[[], object], int]:
+    return lambda: [
+        get_possible_to_squares_mask(square) for square in chess.SQUARES
+    ], 64
+
+
+@_benchmark('get_action_index')
+def _bench_get_action_index() -> tuple[Callable[[], object], int]:
+    moves = list(ACTION_SPACE)
+    return lambda: [get_action_index(move) for move in moves], len(moves)
+
+
+@_benchmark('get_action')
+def _bench_get_action() -> tuple[Callable[[], object], int]:
+    indices = list(range(len(ACTION_SPACE)))
+    return lambda: [get_action(index) for index in indices], len(indices)
+
+
+@_benchmark('get_board_move')
+def _bench_get_board_move() -> tuple[Callable[[], object], int]:
+    boards = random_boards(256)
+    pairs = [
+        (board, get_action_index(move))
+        for board in boards
+        for move in list(board.legal_moves)[:4]
+    ]
+    return lambda: [get_board_move(board, index) for board, index in pairs], len(pairs)
+
+
+@_benchmark('uci_to_index')
+def _bench_uci_to_index() -> tuple[Callable[[], object], int]:
+    ucis = np.tile(ACTION_UCI, 64)
+    return lambda: uci_to_index(ucis), len(ucis)
+
+
+@_benchmark('index_to_uci')
+def _bench_index_to_uci() -> tuple[Callable[[], object], int]:
+    indices = np.tile(np.arange(len(ACTION_SPACE)), 64)
+    return lambda: index_to_uci(indices), len(indices)
+
+
+@_benchmark('get_legal_mask')
+def _bench_get_legal_mask() -> tuple[Callable[[], object], int]:
+    boards = random_boards(256)
+    return lambda: [get_legal_mask(board) for board in boards], len(boards)
+
+
+@_benchmark('get_legal_masks_boards')
+def _bench_get_legal_masks_boards() -> tuple[Callable[[], object], int]:
+    boards = random_boards(1024)
+    return lambda: get_legal_masks(boards), len(boards)
+
+
+@_benchmark('get_legal_masks_arrays')
+def _bench_get_legal_masks_arrays() -> tuple[Callable[[], object], int]:
+    positions = get_boards_array(random_boards(4096))
+    return lambda: get_legal_masks(positions), len(positions)
+
+
+@_benchmark('parse_fens')
+def _bench_parse_fens() -> tuple[Callable[[], object], int]:
+    fens = [board.fen() for board in random_boards(4096)]
+    return lambda: parse_fens(fens), len(fens)
+
+
+@_benchmark('build_artifacts')
+def _bench_build_artifacts() -> tuple[Callable[[], object], int]:
+    return build_artifacts, 1
+
+
+class Result(NamedTuple):
+    ops_per_second: float
+    allocated_blocks: int
+    """The number of memory blocks allocated by one call and still alive after it."""
+    peak_bytes: int
+    """The peak size of the memory traced during one call."""
+
+
+def run_benchmark(setup: _Benchmark, repeat: int = 5) -> Result:
+    fn, ops = setup()
+    fn()  # Warm up caches and lazily built state
+
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    allocated_blocks = sum(
+        stat.count_diff for stat in after.compare_to(before, 'filename')
+    )
+    return Result(ops / best, allocated_blocks, peak_bytes)
+
+
+def load_baselines() -> dict[str, Result]:
+    if not BASELINES_PATH.exists():
+        return {}
+    with open(BASELINES_PATH) as f:
+        data = json.load(f)
+    return {name: Result(**result) for name, result in data['results'].items()}
+
+
+def save_baselines(results: dict[str, Result]) -> None:
+    data = {
+        'machine': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'chess': chess.__version__,
+            'numpy': np.__version__,
+            'chess_action_space': importlib.metadata.version('chess-action-space'),
+            'date': time.strftime('%Y-%m-%d'),
+        },
+        'results': {name: result._asdict() for name, result in results.items()},
+    }
+    with open(BASELINES_PATH, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        '-k', default='', help='only run benchmarks whose name contains this'
+    )
+    parser.add_argument(
+        '--save', action='store_true', help='store the results as baselines'
+    )
+    parser.add_argument('--tolerance', type=float, default=0.3)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    baselines = load_baselines()
+    results: dict[str, Result] = {}
+    regressions = []
+    print(
+        f'{"benchmark":<30} {"ops/s":>14} {"blocks":>8} {"peak KiB":>10} {"vs baseline":>12}'
+    )
+    for name, setup in _BENCHMARKS.items():
+        if args.k not in name:
+            continue
+        result = results[name] = run_benchmark(setup, args.repeat)
+        comparison = ''
+        baseline = baselines.get(name)
+        if baseline is not None:
+            ratio = result.ops_per_second / baseline.ops_per_second
+            comparison = f'{ratio:.2f}x'
+            if ratio < 1 - args.tolerance:
+                regressions.append(name)
+                comparison += ' !'
+        print(
+            f'{name:<30} {result.ops_per_second:>14,.0f} {result.allocated_blocks:>8} '
+            f'{result.peak_bytes / 1024:>10,.1f} {comparison:>12}'
+        )
+
+    if args.save:
+        save_baselines({**baselines, **results})
+        print(f'Saved baselines to "{BASELINES_PATH}"')
+    if regressions:
+        print(f'Regressions beyond {args.tolerance:.0%}: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,224 @@
+import importlib
 from collections.abc import Iterable
-from copy import copy
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import chess
 
-from chess_action_space.explicit import ACTION_SPACE, ACTION_SPACE_SIZE
 from chess_action_space.utils import (
+    MOVE_KEY_SPACE_SIZE,
+    ActionCategory,
     can_be_pawn_promotion,
+    get_move_key,
     get_possible_to_squares_mask,
     get_underpromotion_action_space_size,
 )
 
+if TYPE_CHECKING:
+    from chess_action_space.analytics import ActionStatistics
+    from chess_action_space.batching import AsyncBatcher, AsyncLegalMaskBatcher
+    from chess_action_space.bitboards import (
+        NO_EP_SQUARE,
+        NUM_BOARD_COLUMNS,
+        BoardColumn,
+        get_board_array,
+        get_board_from_array,
+        get_boards_array,
+        parse_epds,
+        parse_fens,
+        set_board_array,
+    )
+    from chess_action_space.encoding import (
+        ACTION_KEYS,
+        ACTION_UCI,
+        KEY_TO_ACTION_INDEX,
+        TO_SQUARE_ACTIONS,
+        TO_SQUARE_OFFSETS,
+        get_action,
+        get_action_index,
+        get_board_move,
+        get_incoming_actions,
+        get_interned_move,
+        get_move_from_key,
+        index_to_uci,
+        indices_to_keys,
+        intern_move,
+        keys_to_indices,
+        keys_to_uci,
+        pop_index,
+        pop_indices,
+        push_index,
+        push_indices,
+        uci_to_index,
+        uci_to_keys,
+    )
+    from chess_action_space.env import StepResult, VectorEnv
+    from chess_action_space.explicit import ACTION_SPACE, ACTION_SPACE_SIZE
+    from chess_action_space.masks import (
+        PACKED_MASK_SIZE,
+        LegalMaskCache,
+        get_legal_action_indices,
+        get_legal_mask,
+        get_legal_masks,
+    )
+    from chess_action_space.movegen import (
+        ACTION_BETWEEN,
+        ACTION_CATEGORY,
+        PIECE_ACTION_MASKS,
+        get_candidate_masks,
+        get_legal_masks_vectorized,
+        get_piece_action_mask,
+        get_pseudo_legal_masks,
+        get_unobstructed_masks,
+    )
+    from chess_action_space.orderings import (
+        DEFAULT_ORDERING,
+        ORDERINGS,
+        Ordering,
+        from_ordering,
+        get_inverse_permutation,
+        get_permutation,
+        to_ordering,
+    )
+    from chess_action_space.parallel import (
+        SharedMaskBuffer,
+        get_legal_masks_multiprocess,
+        get_legal_masks_parallel,
+        uci_to_index_parallel,
+    )
+    from chess_action_space.policy import (
+        SPARSE_POLICY_DTYPE,
+        TopK,
+        dense_to_sparse_policies,
+        get_policy_targets,
+        get_to_square_totals,
+        get_top_k_policy_targets,
+        open_sparse_policies,
+        pack_sparse_policies,
+        sparse_to_dense_policies,
+        topk_legal,
+        visits_to_arrays,
+    )
+    from chess_action_space.search import SearchTree
+    from chess_action_space.tracker import LegalMaskTracker
+
+# Public names of the submodules that load tables are resolved on first access (see `__getattr__`), so importing the
+# package loads no table until one is used, and `chess_action_space.generate` can run before the tables exist
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    name: module
+    for module, names in {
+        'analytics': ('ActionStatistics',),
+        'batching': (
+            'AsyncBatcher',
+            'AsyncLegalMaskBatcher',
+        ),
+        'bitboards': (
+            'NO_EP_SQUARE',
+            'NUM_BOARD_COLUMNS',
+            'BoardColumn',
+            'get_board_array',
+            'get_board_from_array',
+            'get_boards_array',
+            'parse_epds',
+            'parse_fens',
+            'set_board_array',
+        ),
+        'encoding': (
+            'ACTION_KEYS',
+            'ACTION_UCI',
+            'KEY_TO_ACTION_INDEX',
+            'TO_SQUARE_ACTIONS',
+            'TO_SQUARE_OFFSETS',
+            'get_action',
+            'get_action_index',
+            'get_board_move',
+            'get_incoming_actions',
+            'get_interned_move',
+            'get_move_from_key',
+            'index_to_uci',
+            'indices_to_keys',
+            'intern_move',
+            'keys_to_indices',
+            'keys_to_uci',
+            'pop_index',
+            'pop_indices',
+            'push_index',
+            'push_indices',
+            'uci_to_index',
+            'uci_to_keys',
+        ),
+        'env': (
+            'StepResult',
+            'VectorEnv',
+        ),
+        'explicit': (
+            'ACTION_SPACE',
+            'ACTION_SPACE_SIZE',
+        ),
+        'masks': (
+            'PACKED_MASK_SIZE',
+            'LegalMaskCache',
+            'get_legal_action_indices',
+            'get_legal_mask',
+            'get_legal_masks',
+        ),
+        'movegen': (
+            'ACTION_BETWEEN',
+            'ACTION_CATEGORY',
+            'PIECE_ACTION_MASKS',
+            'get_candidate_masks',
+            'get_legal_masks_vectorized',
+            'get_piece_action_mask',
+            'get_pseudo_legal_masks',
+            'get_unobstructed_masks',
+        ),
+        'orderings': (
+            'DEFAULT_ORDERING',
+            'ORDERINGS',
+            'Ordering',
+            'from_ordering',
+            'get_inverse_permutation',
+            'get_permutation',
+            'to_ordering',
+        ),
+        'parallel': (
+            'SharedMaskBuffer',
+            'get_legal_masks_multiprocess',
+            'get_legal_masks_parallel',
+            'uci_to_index_parallel',
+        ),
+        'policy': (
+            'SPARSE_POLICY_DTYPE',
+            'TopK',
+            'dense_to_sparse_policies',
+            'get_policy_targets',
+            'get_to_square_totals',
+            'get_top_k_policy_targets',
+            'open_sparse_policies',
+            'pack_sparse_policies',
+            'sparse_to_dense_policies',
+            'topk_legal',
+            'visits_to_arrays',
+        ),
+        'search': ('SearchTree',),
+        'tracker': ('LegalMaskTracker',),
+    }.items()
+    for name in names
+}
+
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        module = _LAZY_ATTRIBUTES.get(name)
+        if module is None:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+        globals()[name] = value
+        return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 def get_action_space_size(fast: bool = True) -> int:
     """
@@ -18,6 +226,8 @@ def get_action_space_size(fast: bool = True) -> int:
     Uses `fast=True` by default to use a pre-computed value.
     """
     if fast:
+        from chess_action_space.explicit import ACTION_SPACE_SIZE
+
         return ACTION_SPACE_SIZE
 
     # Each chess piece moves like either a queen or a knight from one square to another square.
@@ -43,6 +253,8 @@ def iter_action_space(fast: bool = True) -> Iterable[chess.Move]:
     Uses `fast=True` by default to iterate over a pre-computed list.
     """
     if fast:
+        from chess_action_space.explicit import ACTION_SPACE
+
         yield from ACTION_SPACE
         return
 
@@ -58,45 +270,88 @@ def iter_action_space(fast: bool = True) -> Iterable[chess.Move]:
             if not can_be_pawn_promotion(from_square, to_square):
                 continue
             for piece_type in non_queen_promotion_piece_types:
-                promotion_move = copy(move)
-                promotion_move.promotion = piece_type
-                yield promotion_move
-
-
-def _gen_explicit_py() -> None:
-    """Refresh the file `explicit.py`."""
-
-    explicit_py_path = Path(__file__).parent / 'explicit.py'
-
-    s = '"""\nThis file is generated, do not modify it directly!\n"""'
-
-    s += '\n\nimport chess'
-
-    action_space_size = get_action_space_size(fast=False)
-    s += f'\n\nACTION_SPACE_SIZE = {action_space_size}'
-    s += '\n"""The number of moves in the minimal discrete action space in chess."""'
-
-    s += '\n\nACTION_SPACE = ('
-    for move in iter_action_space(fast=False):
-        s += f"\n    chess.Move.from_uci('{move.uci()}'),"
-    s += '\n)'
-    s += f'\n"""All {action_space_size} moves in the minimal discrete action space in chess."""'
-
-    s += '\n'
-
-    with open(explicit_py_path, 'w') as f:
-        f.write(s)
-
-    print(f'Wrote to "{explicit_py_path}"!')
-
-
-if __name__ == '__main__':
-    _gen_explicit_py()
+                yield chess.Move(from_square, to_square, piece_type)
 
 
 __all__ = [
+    'ACTION_BETWEEN',
+    'ACTION_CATEGORY',
+    'ACTION_KEYS',
+    'ACTION_UCI',
     'ACTION_SPACE_SIZE',
     'ACTION_SPACE',
+    'ActionCategory',
+    'ActionStatistics',
+    'AsyncBatcher',
+    'AsyncLegalMaskBatcher',
+    'BoardColumn',
+    'DEFAULT_ORDERING',
+    'KEY_TO_ACTION_INDEX',
+    'LegalMaskCache',
+    'LegalMaskTracker',
+    'MOVE_KEY_SPACE_SIZE',
+    'NO_EP_SQUARE',
+    'NUM_BOARD_COLUMNS',
+    'ORDERINGS',
+    'Ordering',
+    'PACKED_MASK_SIZE',
+    'PIECE_ACTION_MASKS',
+    'SPARSE_POLICY_DTYPE',
+    'SearchTree',
+    'SharedMaskBuffer',
+    'StepResult',
+    'TO_SQUARE_ACTIONS',
+    'TO_SQUARE_OFFSETS',
+    'TopK',
+    'VectorEnv',
+    'dense_to_sparse_policies',
+    'from_ordering',
+    'get_action',
+    'get_action_index',
     'get_action_space_size',
+    'get_board_array',
+    'get_board_move',
+    'get_board_from_array',
+    'get_boards_array',
+    'get_candidate_masks',
+    'get_incoming_actions',
+    'get_interned_move',
+    'get_inverse_permutation',
+    'get_legal_action_indices',
+    'get_legal_mask',
+    'get_legal_masks',
+    'get_legal_masks_multiprocess',
+    'get_legal_masks_parallel',
+    'get_legal_masks_vectorized',
+    'get_move_from_key',
+    'get_move_key',
+    'get_permutation',
+    'get_piece_action_mask',
+    'get_policy_targets',
+    'get_pseudo_legal_masks',
+    'get_to_square_totals',
+    'get_top_k_policy_targets',
+    'get_unobstructed_masks',
+    'index_to_uci',
+    'indices_to_keys',
+    'intern_move',
     'iter_action_space',
+    'keys_to_indices',
+    'keys_to_uci',
+    'open_sparse_policies',
+    'pack_sparse_policies',
+    'parse_epds',
+    'parse_fens',
+    'pop_index',
+    'pop_indices',
+    'push_index',
+    'push_indices',
+    'set_board_array',
+    'sparse_to_dense_policies',
+    'to_ordering',
+    'topk_legal',
+    'uci_to_index',
+    'uci_to_index_parallel',
+    'uci_to_keys',
+    'visits_to_arrays',
 ]
@@ -0,0 +1,38 @@
+"""Random positions shared by the tests and the benchmarks."""
+
+import random
+
+import chess
+
+
+def random_boards(n: int, seed: int = 0) -> list[chess.Board]:
+    """Positions of random games from the starting position, without move stacks."""
+    rng = random.Random(seed)
+    board = chess.Board()
+    boards: list[chess.Board] = []
+    while len(boards) < n:
+        if board.is_game_over():
+            board = chess.Board()
+        board.push(rng.choice(list(board.legal_moves)))
+        boards.append(board.copy(stack=False))
+    return boards
+
+
+def random_games(n: int, seed: int = 0, max_plies: int = 80) -> list[chess.Board]:
+    """Random games of up to `max_plies` plies, as boards whose move stacks hold the games."""
+    rng = random.Random(seed)
+    games = []
+    for _ in range(n):
+        board = chess.Board()
+        for _ in range(rng.randrange(1, max_plies)):
+            if board.is_game_over():
+                break
+            board.push(rng.choice(list(board.legal_moves)))
+        games.append(board)
+    return games
+
+
+__all__ = [
+    'random_boards',
+    'random_games',
+]
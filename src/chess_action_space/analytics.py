@@ -0,0 +1,119 @@
+from collections.abc import Iterable
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import NUM_BOARD_COLUMNS, get_board_array
+from chess_action_space.encoding import get_action_index
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.masks import get_legal_masks
+
+
+class ActionStatistics:
+    """
+    Statistics of the played and legal actions over a stream of positions (ex. for class weighting and prior
+    initialization), accumulated with vectorized passes over batches of action indices and legal masks.
+
+    Partial statistics (ex. of parallel runs over shards of a corpus) are combined with `merge` or `+`. Instances
+    only hold NumPy arrays and counters, so they can be pickled.
+    """
+
+    def __init__(self) -> None:
+        self.num_positions = 0
+        self.play_counts = np.zeros(ACTION_SPACE_SIZE, dtype=np.int64)
+        """The number of times every action was played."""
+        self.legal_counts = np.zeros(ACTION_SPACE_SIZE, dtype=np.int64)
+        """The number of positions in which every action was legal."""
+        self.not_chosen_counts = np.zeros(ACTION_SPACE_SIZE, dtype=np.int64)
+        """The number of positions in which every action was legal but another action was played."""
+        self.legal_move_counts = np.zeros(ACTION_SPACE_SIZE + 1, dtype=np.int64)
+        """Histogram of the number of legal actions: the number of positions with `i` legal actions, at index `i`."""
+
+    def update(self, actions: npt.ArrayLike, masks: npt.ArrayLike) -> None:
+        """
+        Add `N` positions, given the indices of the played actions and the `(N, ACTION_SPACE_SIZE)` legal masks of
+        the positions (see `get_legal_masks`).
+        """
+        actions_array = np.asarray(actions, dtype=np.intp)
+        masks_array = np.asarray(masks, dtype=np.bool_)
+        if actions_array.ndim != 1 or masks_array.shape != (
+            len(actions_array),
+            ACTION_SPACE_SIZE,
+        ):
+            raise ValueError(
+                f'Expected (N,) actions and (N, {ACTION_SPACE_SIZE}) masks, got {actions_array.shape} and '
+                f'{masks_array.shape}'
+            )
+        if len(actions_array) and not (
+            0 <= actions_array.min() and actions_array.max() < ACTION_SPACE_SIZE
+        ):
+            raise ValueError('Action indices must be in [0, ACTION_SPACE_SIZE)')
+
+        legal = masks_array.sum(axis=0)
+        played_legal = masks_array[np.arange(len(actions_array)), actions_array]
+        self.num_positions += len(actions_array)
+        self.play_counts += np.bincount(actions_array, minlength=ACTION_SPACE_SIZE)
+        self.legal_counts += legal
+        self.not_chosen_counts += legal - np.bincount(
+            actions_array[played_legal], minlength=ACTION_SPACE_SIZE
+        )
+        self.legal_move_counts += np.bincount(
+            masks_array.sum(axis=1), minlength=ACTION_SPACE_SIZE + 1
+        )
+
+    def update_games(
+        self, games: Iterable[chess.Board], batch_size: int = 4096
+    ) -> None:
+        """
+        Add every position and move of `games`, given as boards whose move stacks hold the games (ex.
+        `game.end().board()` for a `chess.pgn.Game`). Games are replayed from their root positions into batches of
+        `batch_size` positions in array form, whose legal masks are built with `get_legal_masks`. Raises
+        `ValueError` for moves outside the action space.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be positive, got {batch_size}')
+        positions = np.empty((batch_size, NUM_BOARD_COLUMNS), dtype=np.uint64)
+        actions = np.empty(batch_size, dtype=np.intp)
+        masks = np.empty((batch_size, ACTION_SPACE_SIZE), dtype=np.bool_)
+        n = 0
+        for game in games:
+            board = game.root()
+            for move in game.move_stack:
+                get_board_array(board, out=positions[n])
+                actions[n] = get_action_index(move)
+                board.push(move)
+                n += 1
+                if n == batch_size:
+                    self.update(actions, get_legal_masks(positions, out=masks))
+                    n = 0
+        if n:
+            self.update(actions[:n], get_legal_masks(positions[:n], out=masks[:n]))
+
+    def get_play_rates(self) -> npt.NDArray[np.float64]:
+        """Return the fraction of the positions in which every action was legal where it was played (`0` if never)."""
+        return np.divide(
+            self.legal_counts - self.not_chosen_counts,
+            self.legal_counts,
+            out=np.zeros(ACTION_SPACE_SIZE),
+            where=self.legal_counts > 0,
+        )
+
+    def merge(self, other: 'ActionStatistics') -> None:
+        """Add the statistics of `other` to these statistics."""
+        self.num_positions += other.num_positions
+        self.play_counts += other.play_counts
+        self.legal_counts += other.legal_counts
+        self.not_chosen_counts += other.not_chosen_counts
+        self.legal_move_counts += other.legal_move_counts
+
+    def __add__(self, other: 'ActionStatistics') -> 'ActionStatistics':
+        merged = ActionStatistics()
+        merged.merge(self)
+        merged.merge(other)
+        return merged
+
+
+__all__ = [
+    'ActionStatistics',
+]
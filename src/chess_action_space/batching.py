@@ -0,0 +1,150 @@
+import asyncio
+import functools
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from typing import Any, Generic, TypeVar
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.masks import get_legal_masks
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, _check_ordering
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class AsyncBatcher(Generic[T, R]):
+    """
+    Collect items submitted by many coroutines into batches and process each batch with a single call to `fn`.
+
+    A batch is processed as soon as it holds `max_batch_size` items, or `max_delay_us` microseconds after its first
+    item was submitted. `fn` receives the list of items and must return a sequence (or array) of the same length;
+    `submit` resolves to the element at the item's position. If `fn` raises, every item of the batch raises.
+
+    By default `fn` runs on the event loop thread; pass an `executor` to run it there instead.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list[T]], Sequence[R] | npt.NDArray[Any]],
+        max_batch_size: int = 256,
+        max_delay_us: float = 500,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size must be positive, got {max_batch_size}')
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_delay_us = max_delay_us
+        self.executor = executor
+        self.num_batches = 0
+        """The number of batches processed so far."""
+
+        self._items: list[T] = []
+        self._futures: list[asyncio.Future[R]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Add `item` to the current batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        if len(self._items) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay_us / 1e6, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        if not items:
+            return
+        self.num_batches += 1
+
+        if self.executor is None:
+            try:
+                results = self.fn(items)
+            except Exception as e:
+                self._set_exception(futures, e)
+            else:
+                self._set_results(futures, results)
+            return
+
+        task = asyncio.ensure_future(self._run_in_executor(items, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_in_executor(
+        self, items: list[T], futures: list[asyncio.Future[R]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, self.fn, items)
+        except Exception as e:
+            self._set_exception(futures, e)
+        else:
+            self._set_results(futures, results)
+
+    @staticmethod
+    def _set_results(
+        futures: list[asyncio.Future[R]], results: Sequence[R] | npt.NDArray[Any]
+    ) -> None:
+        if len(results) != len(futures):
+            error = ValueError(f'Expected {len(futures)} results, got {len(results)}')
+            AsyncBatcher._set_exception(futures, error)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _set_exception(futures: list[asyncio.Future[R]], error: Exception) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def flush(self) -> None:
+        """Process the current batch right away and wait for batches running in the executor."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+
+class AsyncLegalMaskBatcher(AsyncBatcher[chess.Board, npt.NDArray[np.bool_]]):
+    """
+    `AsyncBatcher` resolving each board to its legal mask, built with one `get_legal_masks` call per batch. Each
+    mask is a row of the batch array, in `ordering`.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 256,
+        max_delay_us: float = 500,
+        executor: Executor | None = None,
+        ordering: Ordering = DEFAULT_ORDERING,
+    ) -> None:
+        _check_ordering(ordering)
+        super().__init__(
+            functools.partial(get_legal_masks, ordering=ordering),
+            max_batch_size,
+            max_delay_us,
+            executor,
+        )
+        self.ordering = ordering
+
+    async def get_legal_mask(self, board: chess.Board) -> npt.NDArray[np.bool_]:
+        return await self.submit(board)
+
+
+__all__ = [
+    'AsyncBatcher',
+    'AsyncLegalMaskBatcher',
+]
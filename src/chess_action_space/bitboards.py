@@ -0,0 +1,376 @@
+import re
+from collections.abc import Callable, Iterator, Sequence
+from enum import IntEnum
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.instrumentation import count_rows, instrumented
+
+
+class BoardColumn(IntEnum):
+    """
+    The columns of the `uint64` array form of a position, see `get_board_array`. They mirror the state of
+    `chess.Board`.
+    """
+
+    PAWNS = 0
+    KNIGHTS = 1
+    BISHOPS = 2
+    ROOKS = 3
+    QUEENS = 4
+    KINGS = 5
+    WHITE = 6
+    """Occupancy of the white pieces."""
+    BLACK = 7
+    """Occupancy of the black pieces."""
+    TURN = 8
+    """`1` if white is to move, else `0`."""
+    CASTLING_RIGHTS = 9
+    """The cleaned castling rights as a bitboard of rook squares, see `chess.Board.clean_castling_rights`."""
+    EP_SQUARE = 10
+    """The en passant square, or `NO_EP_SQUARE`."""
+    HALFMOVE_CLOCK = 11
+    FULLMOVE_NUMBER = 12
+
+
+NUM_BOARD_COLUMNS = len(BoardColumn)
+
+NO_EP_SQUARE = 64
+"""The value of the `EP_SQUARE` column when there is no en passant square."""
+
+Positions = Sequence[chess.Board] | npt.NDArray[np.uint64]
+"""Positions as `chess.Board` objects, or as an `(N, NUM_BOARD_COLUMNS)` array, see `get_boards_array`."""
+
+
+@instrumented()
+def get_board_array(
+    board: chess.Board, out: npt.NDArray[np.uint64] | None = None
+) -> npt.NDArray[np.uint64]:
+    """
+    Return the position on `board` as a `(NUM_BOARD_COLUMNS,)` `uint64` array, see `BoardColumn`. If `out` is given,
+    the array is written into it and returned.
+    """
+    if out is None:
+        out = np.empty(NUM_BOARD_COLUMNS, dtype=np.uint64)
+    out[:] = (
+        board.pawns,
+        board.knights,
+        board.bishops,
+        board.rooks,
+        board.queens,
+        board.kings,
+        board.occupied_co[chess.WHITE],
+        board.occupied_co[chess.BLACK],
+        board.turn,
+        board.clean_castling_rights(),
+        NO_EP_SQUARE if board.ep_square is None else board.ep_square,
+        board.halfmove_clock,
+        board.fullmove_number,
+    )
+    return out
+
+
+@instrumented(count_rows)
+def get_boards_array(
+    boards: Sequence[chess.Board], out: npt.NDArray[np.uint64] | None = None
+) -> npt.NDArray[np.uint64]:
+    """
+    Batched `get_board_array`, returning an `(N, NUM_BOARD_COLUMNS)` array.
+    """
+    if out is None:
+        out = np.empty((len(boards), NUM_BOARD_COLUMNS), dtype=np.uint64)
+    for board, row in zip(boards, out):
+        get_board_array(board, out=row)
+    return out
+
+
+def _set_board(board: chess.Board, row: list[int]) -> chess.Board:
+    (
+        pawns,
+        knights,
+        bishops,
+        rooks,
+        queens,
+        kings,
+        white,
+        black,
+        turn,
+        castling_rights,
+        ep_square,
+        halfmove_clock,
+        fullmove_number,
+    ) = row
+    board.pawns = pawns
+    board.knights = knights
+    board.bishops = bishops
+    board.rooks = rooks
+    board.queens = queens
+    board.kings = kings
+    board.promoted = chess.BB_EMPTY
+    board.occupied_co[chess.WHITE] = white
+    board.occupied_co[chess.BLACK] = black
+    board.occupied = white | black
+    board.turn = bool(turn)
+    board.castling_rights = castling_rights
+    board.ep_square = None if ep_square == NO_EP_SQUARE else ep_square
+    board.halfmove_clock = halfmove_clock
+    board.fullmove_number = fullmove_number
+    board.clear_stack()
+    return board
+
+
+def set_board_array(board: chess.Board, array: npt.ArrayLike) -> chess.Board:
+    """
+    Set the position on `board` from its array form (see `get_board_array`) without validating it, clear its move
+    stack, and return it. Much cheaper than building a new `chess.Board`.
+    """
+    return _set_board(board, np.asarray(array, dtype=np.uint64).tolist())
+
+
+def get_board_from_array(array: npt.ArrayLike) -> chess.Board:
+    """Return a new `chess.Board` with the position in array form `array`, see `set_board_array`."""
+    return set_board_array(chess.Board(None), array)
+
+
+def iter_boards(positions: Positions) -> Iterator[chess.Board]:
+    """
+    Iterate over `positions` as boards. For the array form, a single scratch board is set to each row in turn, so a
+    yielded board is only valid until the next one is produced.
+    """
+    if not isinstance(positions, np.ndarray):
+        yield from positions
+        return
+    board = chess.Board(None)
+    for row in positions.tolist():
+        yield _set_board(board, row)
+
+
+# Per byte of the position part of a FEN: the number of squares it covers (`-1` for invalid bytes), and the piece
+# code of piece symbols (the piece type, plus 6 for black pieces) or `0`. The promoted marker `~` and padding cover
+# no squares
+_SQUARE_WIDTH = np.full(256, -1, dtype=np.int8)
+_SQUARE_WIDTH[[0, ord('/'), ord('~')]] = 0
+_PIECE_CODE = np.zeros(256, dtype=np.int8)
+for _digit in range(1, 9):
+    _SQUARE_WIDTH[ord(str(_digit))] = _digit
+for _piece_type in chess.PIECE_TYPES:
+    for _color in chess.COLORS:
+        _byte = ord(chess.Piece(_piece_type, _color).symbol())
+        _SQUARE_WIDTH[_byte] = 1
+        _PIECE_CODE[_byte] = _piece_type + (0 if _color == chess.WHITE else 6)
+del _digit, _piece_type, _color, _byte
+_SQUARE_WIDTH.flags.writeable = False
+_PIECE_CODE.flags.writeable = False
+
+# The ranks of the position part start at these squares (counting from a8) after each of the 7 slashes
+_SLASH_STARTS_SUM = sum(range(8, 64, 8))
+
+# Standard chess only keeps castling rights of rooks in the corners, see `chess.Board.clean_castling_rights`
+_CASTLING_FLAG_BITS = {
+    'K': chess.BB_H1,
+    'H': chess.BB_H1,
+    'Q': chess.BB_A1,
+    'A': chess.BB_A1,
+    'k': chess.BB_H8,
+    'h': chess.BB_H8,
+    'q': chess.BB_A8,
+    'a': chess.BB_A8,
+}
+_FEN_CASTLING_REGEX = re.compile(r'^(?:-|[KQABCDEFGH]{0,2}[kqabcdefgh]{0,2})\Z')
+
+_FEN_DEFAULTS = ('w', '-', '-', '0', '1')
+_EPD_OPERATION_REGEX = re.compile(r'\b(hmvc|fmvn)\s+(\d+)\s*;')
+
+_PARSE_CHUNK_SIZE = 1 << 16
+
+
+def _parse_position_parts(parts: Sequence[str], out: npt.NDArray[np.uint64]) -> None:
+    """Write the piece and color bitboards of the position parts of FENs into columns `PAWNS` to `BLACK` of `out`."""
+    try:
+        strings = np.array(parts, dtype=np.bytes_)
+    except UnicodeEncodeError:
+        raise ValueError('Invalid character in the position part of a FEN') from None
+    b = strings.view(np.uint8).reshape(len(parts), strings.dtype.itemsize)
+
+    widths = _SQUARE_WIDTH[b]
+    invalid = (widths < 0).any(axis=1)
+    if invalid.any():
+        i = int(np.argmax(invalid))
+        raise ValueError(
+            f'Invalid character in the position part of FEN {i}: {parts[i]!r}'
+        )
+    # The square (counting from a8) where every byte starts
+    starts = np.cumsum(widths, axis=1, dtype=np.int16) - widths
+    slashes = b == ord('/')
+    slash_starts = np.where(slashes, starts, 0)
+    # 7 slashes at distinct multiples of 8 between 8 and 56 split the 64 squares into 8 ranks of 8
+    valid = (
+        (starts[:, -1] + widths[:, -1] == 64)
+        & (slashes.sum(axis=1) == 7)
+        & (slash_starts.sum(axis=1) == _SLASH_STARTS_SUM)
+        & ~(slash_starts % 8).any(axis=1)
+        & ~(slashes & (starts == 0)).any(axis=1)
+    )
+    if not valid.all():
+        i = int(np.argmin(valid))
+        raise ValueError(f'Expected 8 ranks of 8 squares in FEN {i}: {parts[i]!r}')
+
+    # Scatter every piece onto one of 12 boolean planes (per piece code), with a spare slot per row for other bytes.
+    # Ranks are listed from the 8th down, so flipping the rank of the start of a piece symbol gives its square
+    pieces = _PIECE_CODE[b].astype(np.intp)
+    plane_size = 12 * 64 + 1
+    targets = np.where(pieces > 0, (pieces - 1) * 64 + (starts ^ 56), plane_size - 1)
+    targets += np.arange(0, len(parts) * plane_size, plane_size)[:, None]
+    flat_planes = np.zeros(len(parts) * plane_size, dtype=np.bool_)
+    flat_planes[targets.ravel()] = True
+    planes = flat_planes.reshape(len(parts), plane_size)[:, :-1].reshape(
+        len(parts), 12, 64
+    )
+
+    # Pack the planes into bitboards with square `i` at bit `i`: white pieces first, then black pieces
+    bitboards = np.packbits(planes, axis=2, bitorder='little').view(np.dtype('<u8'))
+    white = bitboards[:, :6, 0]
+    black = bitboards[:, 6:, 0]
+    out[:, BoardColumn.PAWNS : BoardColumn.KINGS + 1] = white | black
+    out[:, BoardColumn.WHITE] = np.bitwise_or.reduce(white, axis=1)
+    out[:, BoardColumn.BLACK] = np.bitwise_or.reduce(black, axis=1)
+
+
+def _map_unique(
+    values: Sequence[str], fn: Callable[[str], int], fens: Sequence[str]
+) -> npt.NDArray[np.uint64]:
+    """Apply `fn` to every distinct value, reporting the FEN of the first value it rejects."""
+    unique, inverse = np.unique(np.array(values, dtype=np.str_), return_inverse=True)
+    mapped = np.empty(len(unique), dtype=np.uint64)
+    for i, value in enumerate(unique.tolist()):
+        try:
+            mapped[i] = fn(value)
+        except ValueError as e:
+            fen = fens[values.index(value)]
+            raise ValueError(f'{e} in FEN {fen!r}') from None
+    return mapped[inverse.reshape(-1)]
+
+
+def _parse_turn(turn: str) -> int:
+    if turn not in ('w', 'b'):
+        raise ValueError(f"Expected 'w' or 'b' for the turn, got {turn!r}")
+    return turn == 'w'
+
+
+def _parse_castling(castling: str) -> int:
+    if not _FEN_CASTLING_REGEX.match(castling):
+        raise ValueError(f'Invalid castling rights {castling!r}')
+    bits = 0
+    for flag in castling:
+        bits |= _CASTLING_FLAG_BITS.get(flag, chess.BB_EMPTY)
+    return bits
+
+
+def _parse_ep_square(ep_square: str) -> int:
+    if ep_square == '-':
+        return NO_EP_SQUARE
+    if ep_square not in chess.SQUARE_NAMES:
+        raise ValueError(f'Invalid en passant square {ep_square!r}')
+    return chess.parse_square(ep_square)
+
+
+def _parse_counters(values: Sequence[str], name: str) -> npt.NDArray[np.uint64]:
+    try:
+        counters = np.fromiter(map(int, values), dtype=np.int64, count=len(values))
+    except ValueError:
+        raise ValueError(f'Invalid {name}') from None
+    if (counters < 0).any():
+        raise ValueError(f'The {name} cannot be negative')
+    return counters.astype(np.uint64)
+
+
+def _parse_fen_chunk(fens: Sequence[str], out: npt.NDArray[np.uint64]) -> None:
+    rows = [fen.split() for fen in fens]
+    for i, row in enumerate(rows):
+        if len(row) != 6:
+            if not 1 <= len(row) <= 6:
+                raise ValueError(f'Expected 1 to 6 parts in FEN {fens[i]!r}')
+            rows[i] = row + list(_FEN_DEFAULTS[len(row) - 1 :])
+    positions, turns, castlings, ep_squares, halfmoves, fullmoves = zip(*rows)
+
+    _parse_position_parts(positions, out)
+    out[:, BoardColumn.TURN] = _map_unique(turns, _parse_turn, fens)
+    castling_rights = _map_unique(castlings, _parse_castling, fens)
+    out[:, BoardColumn.EP_SQUARE] = _map_unique(ep_squares, _parse_ep_square, fens)
+    out[:, BoardColumn.HALFMOVE_CLOCK] = _parse_counters(halfmoves, 'halfmove clock')
+    out[:, BoardColumn.FULLMOVE_NUMBER] = np.maximum(
+        _parse_counters(fullmoves, 'fullmove number'), 1
+    )
+
+    # Clean the castling rights like `chess.Board.clean_castling_rights`: keep the rights of rooks still in their
+    # corner, if the king of their color is still on its initial square
+    rooks = out[:, BoardColumn.ROOKS]
+    kings = out[:, BoardColumn.KINGS]
+    white = out[:, BoardColumn.WHITE]
+    black = out[:, BoardColumn.BLACK]
+    all_bits = np.uint64(chess.BB_ALL)
+    white_rights = np.where(kings & white & np.uint64(chess.BB_E1), all_bits, 0)
+    black_rights = np.where(kings & black & np.uint64(chess.BB_E8), all_bits, 0)
+    out[:, BoardColumn.CASTLING_RIGHTS] = (
+        castling_rights
+        & rooks
+        & (
+            white & np.uint64(chess.BB_RANK_1) & white_rights
+            | black & np.uint64(chess.BB_RANK_8) & black_rights
+        )
+    )
+
+
+@instrumented(count_rows)
+def parse_fens(
+    fens: Sequence[str], out: npt.NDArray[np.uint64] | None = None
+) -> npt.NDArray[np.uint64]:
+    """
+    Parse FENs straight into the `(N, NUM_BOARD_COLUMNS)` array form of `get_boards_array`, without building
+    `chess.Board` objects. Missing trailing parts take the same defaults as `chess.Board`, and the result matches
+    `get_boards_array([chess.Board(fen) for fen in fens])`. Raises `ValueError` for syntactically invalid FENs.
+    """
+    if out is None:
+        out = np.empty((len(fens), NUM_BOARD_COLUMNS), dtype=np.uint64)
+    for start in range(0, len(fens), _PARSE_CHUNK_SIZE):
+        _parse_fen_chunk(
+            fens[start : start + _PARSE_CHUNK_SIZE],
+            out[start : start + _PARSE_CHUNK_SIZE],
+        )
+    return out
+
+
+def _epd_to_fen(epd: str) -> str:
+    parts = epd.strip().rstrip(';').split(None, 4)
+    if len(parts) > 4:
+        operations = dict(_EPD_OPERATION_REGEX.findall(parts.pop() + ';'))
+        parts.append(operations.get('hmvc', '0'))
+        parts.append(operations.get('fmvn', '1'))
+    return ' '.join(parts)
+
+
+@instrumented(count_rows)
+def parse_epds(
+    epds: Sequence[str], out: npt.NDArray[np.uint64] | None = None
+) -> npt.NDArray[np.uint64]:
+    """
+    Like `parse_fens` for EPDs. The `hmvc` and `fmvn` operations set the counters, other operations are ignored.
+    """
+    return parse_fens([_epd_to_fen(epd) for epd in epds], out)
+
+
+__all__ = [
+    'NO_EP_SQUARE',
+    'NUM_BOARD_COLUMNS',
+    'BoardColumn',
+    'Positions',
+    'get_board_array',
+    'get_board_from_array',
+    'get_boards_array',
+    'iter_boards',
+    'parse_epds',
+    'parse_fens',
+    'set_board_array',
+]
@@ -0,0 +1,444 @@
+import functools
+from collections.abc import Sequence
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import BoardColumn
+from chess_action_space.explicit import ACTION_SPACE, ACTION_SPACE_SIZE
+from chess_action_space.instrumentation import count_elements, count_rows, instrumented
+from chess_action_space.orderings import (
+    DEFAULT_ORDERING,
+    Ordering,
+    _get_permutation_tuples,
+    get_inverse_permutation,
+    get_permutation,
+)
+from chess_action_space.tables import load_table
+from chess_action_space.utils import MOVE_KEY_SPACE_SIZE, get_move_key
+
+UciStrings = (
+    Sequence[str] | Sequence[bytes] | npt.NDArray[np.str_] | npt.NDArray[np.bytes_]
+)
+"""UCI strings as `str` or `bytes`, either in a sequence or in a NumPy string array."""
+
+
+ACTION_KEYS: npt.NDArray[np.uint16] = load_table('action_keys')
+"""The move key of every move in `ACTION_SPACE`, in order."""
+
+KEY_TO_ACTION_INDEX: npt.NDArray[np.int16] = load_table('key_to_action_index')
+"""
+Dense map from move key to the index of the move in `ACTION_SPACE`, or `-1` for keys of moves outside the action
+space. Queen promotion keys map to the index of the corresponding non-promotion move.
+"""
+
+_QUEEN_PROMOTIONS: tuple[chess.Move, ...] = tuple(
+    chess.Move(key & 63, key >> 6 & 63, chess.QUEEN)
+    for key in load_table('queen_promotion_keys').tolist()
+)
+"""
+Shared queen promotion moves. These are not part of `ACTION_SPACE` (a queen promotion is encoded by the same action
+as the non-promotion move), but they are interned too so that decoding a promotion never allocates.
+"""
+
+# Tuples keep scalar lookups on Python ints, which is much faster than indexing NumPy arrays one at a time. Like the
+# read-only NumPy tables, they are immutable so that threads (including on free-threaded builds) can share them
+_KEY_TO_ACTION_INDEX: tuple[int, ...] = tuple(KEY_TO_ACTION_INDEX.tolist())
+_interned: list[chess.Move | None] = [None] * MOVE_KEY_SPACE_SIZE
+for _move in (*ACTION_SPACE, *_QUEEN_PROMOTIONS):
+    _interned[get_move_key(_move)] = _move
+_INTERNED = tuple(_interned)
+del _move, _interned
+
+
+@functools.cache
+def _get_key_to_index(ordering: Ordering) -> npt.NDArray[np.int16]:
+    """`KEY_TO_ACTION_INDEX` with indices in `ordering`."""
+    if ordering == DEFAULT_ORDERING:
+        return KEY_TO_ACTION_INDEX
+    # The trailing `-1` keeps keys outside the action space at `-1`
+    key_to_index = np.append(get_inverse_permutation(ordering), np.int16(-1))[
+        KEY_TO_ACTION_INDEX
+    ]
+    key_to_index.flags.writeable = False
+    return key_to_index
+
+
+def _get_default_indices(
+    indices: npt.ArrayLike, ordering: Ordering
+) -> npt.NDArray[np.integer]:
+    """
+    Convert action indices in `ordering` to indices in `ACTION_SPACE`. Raises `IndexError` for out-of-range indices,
+    including negative ones (ex. the `-1` returned by `uci_to_index` for malformed strings).
+    """
+    indices_array = np.asarray(indices, dtype=np.intp)
+    invalid = (indices_array < 0) | (indices_array >= ACTION_SPACE_SIZE)
+    if invalid.any():
+        raise IndexError(
+            f'Action index {indices_array[invalid].flat[0]} is out of range'
+        )
+    if ordering == DEFAULT_ORDERING:
+        return indices_array
+    return get_permutation(ordering)[indices_array]
+
+
+@instrumented()
+def get_action_index(move: chess.Move, ordering: Ordering = DEFAULT_ORDERING) -> int:
+    """
+    Return the index of `move` in `ACTION_SPACE`, or its position in another `ordering`. Queen promotions share the
+    index of the corresponding non-promotion move. Raises `ValueError` if the move is not in the action space.
+    """
+    index = _KEY_TO_ACTION_INDEX[get_move_key(move)]
+    if index < 0:
+        raise ValueError(f'Move {move.uci()!r} is not in the action space')
+    if ordering != DEFAULT_ORDERING:
+        return _get_permutation_tuples(ordering)[1][index]
+    return index
+
+
+@instrumented()
+def get_action(index: int, ordering: Ordering = DEFAULT_ORDERING) -> chess.Move:
+    """
+    Return the shared `chess.Move` at `index` in `ACTION_SPACE`, or at position `index` in another `ordering`.
+    Raises `IndexError` if `index` is out of range (including negative indices).
+    """
+    if not 0 <= index < ACTION_SPACE_SIZE:
+        raise IndexError(f'Action index {index} is out of range')
+    if ordering != DEFAULT_ORDERING:
+        index = _get_permutation_tuples(ordering)[0][index]
+    return ACTION_SPACE[index]
+
+
+_PROMOTION_PIECE_TYPES = (None, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN)
+
+
+def get_interned_move(
+    from_square: chess.Square,
+    to_square: chess.Square,
+    promotion: chess.PieceType | None = None,
+) -> chess.Move:
+    """
+    Return the canonical shared `chess.Move` for the given squares and promotion. For moves in the action space this
+    is the instance stored in `ACTION_SPACE`; queen promotions are interned separately. Raises `ValueError` if the
+    move is neither.
+
+    The returned object is shared by every caller, so it must not be mutated.
+    """
+    return intern_move(chess.Move(from_square, to_square, promotion))
+
+
+def intern_move(move: chess.Move) -> chess.Move:
+    """
+    Return the canonical shared instance equal to `move`, see `get_interned_move`.
+    """
+    if not (
+        0 <= move.from_square < 64
+        and 0 <= move.to_square < 64
+        and move.promotion in _PROMOTION_PIECE_TYPES
+    ):
+        raise ValueError(
+            f'Invalid move from {move.from_square} to {move.to_square} with promotion {move.promotion}'
+        )
+    interned = _INTERNED[get_move_key(move)]
+    if interned is None:
+        raise ValueError(f'Move {move.uci()!r} is not in the action space')
+    return interned
+
+
+_queen_promotion_by_index: list[chess.Move | None] = [None] * len(ACTION_SPACE)
+for _move in _QUEEN_PROMOTIONS:
+    # Queen promotion keys map to the index of the non-promotion move
+    _queen_promotion_by_index[_KEY_TO_ACTION_INDEX[get_move_key(_move)]] = _move
+_QUEEN_PROMOTION_BY_INDEX = tuple(_queen_promotion_by_index)
+del _move, _queen_promotion_by_index
+
+
+@instrumented()
+def get_board_move(
+    board: chess.BaseBoard | npt.NDArray[np.uint64],
+    index: int,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> chess.Move:
+    """
+    Return the shared `chess.Move` encoded by action `index` (in `ordering`) in the context of `board` (or its array
+    form, see `get_board_array`): the non-promotion action of a pawn moving to the back rank decodes to the queen
+    promotion. Legality is not checked. Raises `IndexError` if `index` is out of range (including negative indices).
+    """
+    if not 0 <= index < ACTION_SPACE_SIZE:
+        raise IndexError(f'Action index {index} is out of range')
+    if ordering != DEFAULT_ORDERING:
+        index = _get_permutation_tuples(ordering)[0][index]
+    queen_promotion = _QUEEN_PROMOTION_BY_INDEX[index]
+    if queen_promotion is None:
+        return ACTION_SPACE[index]
+    if isinstance(board, np.ndarray):
+        pawns = int(board[BoardColumn.PAWNS])
+    else:
+        pawns = board.pawns
+    if pawns & chess.BB_SQUARES[queen_promotion.from_square]:
+        return queen_promotion
+    return ACTION_SPACE[index]
+
+
+@instrumented()
+def push_index(
+    board: chess.Board, index: int, ordering: Ordering = DEFAULT_ORDERING
+) -> chess.Move:
+    """
+    Push the action `index` (in `ordering`) onto `board` (see `get_board_move`) and return the pushed shared move.
+    Legality is not checked, like `chess.Board.push`.
+    """
+    move = get_board_move(board, index, ordering)
+    board.push(move)
+    return move
+
+
+@instrumented()
+def pop_index(board: chess.Board, ordering: Ordering = DEFAULT_ORDERING) -> int:
+    """
+    Undo the last move on `board` and return its action index (in `ordering`). Raises `IndexError` if the move stack
+    is empty and `ValueError` if the last move is not in the action space, in which case `board` is left unchanged.
+    """
+    move = board.peek()
+    index = _KEY_TO_ACTION_INDEX[get_move_key(move)]
+    if index < 0:
+        raise ValueError(f'Move {move.uci()!r} is not in the action space')
+    if ordering != DEFAULT_ORDERING:
+        index = _get_permutation_tuples(ordering)[1][index]
+    board.pop()
+    return index
+
+
+@instrumented(count_rows)
+def push_indices(
+    boards: Sequence[chess.Board],
+    indices: npt.ArrayLike,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> list[chess.Move]:
+    """
+    Batched `push_index`: push `indices[i]` onto `boards[i]` for every board and return the pushed moves.
+    """
+    indices_list: list[int] = _get_default_indices(indices, ordering).tolist()
+    if len(indices_list) != len(boards):
+        raise ValueError(f'Got {len(indices_list)} indices for {len(boards)} boards')
+    moves = []
+    for board, index in zip(boards, indices_list):
+        move = get_board_move(board, index)
+        board.push(move)
+        moves.append(move)
+    return moves
+
+
+@instrumented(count_rows)
+def pop_indices(
+    boards: Sequence[chess.Board], ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.int16]:
+    """
+    Batched `pop_index`: undo the last move on every board and return the action indices of the popped moves.
+    """
+    return np.array([pop_index(board, ordering) for board in boards], dtype=np.int16)
+
+
+@instrumented()
+def get_move_from_key(key: int) -> chess.Move:
+    """
+    Return the canonical shared `chess.Move` with the given move key, see `get_interned_move`. Raises `ValueError` if
+    the key does not belong to a move in the action space or to a queen promotion.
+    """
+    move = _INTERNED[key] if 0 <= key < MOVE_KEY_SPACE_SIZE else None
+    if move is None:
+        raise ValueError(f'Move key {key} is not in the action space')
+    return move
+
+
+@instrumented(count_elements)
+def keys_to_indices(
+    keys: npt.ArrayLike, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.int16]:
+    """
+    Vectorized conversion from move keys to action indices (in `ordering`). Keys of moves outside the action space
+    (including negative or out-of-range keys) map to `-1`.
+    """
+    # Both ends of the key range are not moves, so clipping maps every out-of-range key to `-1`
+    return np.take(
+        _get_key_to_index(ordering), np.asarray(keys, dtype=np.intp), mode='clip'
+    )
+
+
+@instrumented(count_elements)
+def indices_to_keys(
+    indices: npt.ArrayLike, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.uint16]:
+    """
+    Vectorized conversion from action indices (in `ordering`) to move keys. Raises `IndexError` for out-of-range
+    indices, including negative ones.
+    """
+    return ACTION_KEYS[_get_default_indices(indices, ordering)]
+
+
+_PROMOTION_FROM_BYTE = np.full(256, -1, dtype=np.int32)
+_PROMOTION_FROM_BYTE[0] = 0
+for _piece_type in (chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN):
+    _PROMOTION_FROM_BYTE[ord(chess.piece_symbol(_piece_type))] = _piece_type
+
+_PROMOTION_TO_BYTE = np.zeros(8, dtype=np.uint8)
+for _piece_type in chess.PIECE_TYPES:
+    if _piece_type != chess.PAWN:
+        _PROMOTION_TO_BYTE[_piece_type] = ord(chess.piece_symbol(_piece_type))
+del _piece_type
+_PROMOTION_FROM_BYTE.flags.writeable = False
+_PROMOTION_TO_BYTE.flags.writeable = False
+
+
+def _as_uci_bytes(
+    ucis: UciStrings,
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.bool_]]:
+    """
+    Return the first 5 bytes of every UCI string as a `(..., 5)` array, and a mask of strings that are too long.
+    """
+    arr = np.asarray(ucis)
+    if arr.size == 0:
+        arr = arr.astype('S5')
+    elif arr.dtype.kind == 'U':
+        arr = arr.astype('S')
+    elif arr.dtype.kind != 'S':
+        raise TypeError(f'Expected UCI strings, got an array of dtype {arr.dtype}')
+    if arr.dtype.itemsize < 5:
+        arr = arr.astype('S5')
+
+    width = arr.dtype.itemsize
+    b = np.ascontiguousarray(arr).view(np.uint8).reshape(*arr.shape, width)
+    too_long = b[..., 5:].any(axis=-1)
+    return b[..., :5], too_long
+
+
+@instrumented(count_elements)
+def uci_to_keys(
+    ucis: UciStrings,
+) -> npt.NDArray[np.int32]:
+    """
+    Vectorized conversion from UCI strings (`str` or `bytes`) to move keys, without going through `chess.Move`.
+    Malformed strings map to `-1`. Null moves and drops are not supported.
+    """
+    b, too_long = _as_uci_bytes(ucis)
+    from_file = b[..., 0] - np.uint8(ord('a'))
+    from_rank = b[..., 1] - np.uint8(ord('1'))
+    to_file = b[..., 2] - np.uint8(ord('a'))
+    to_rank = b[..., 3] - np.uint8(ord('1'))
+    promotion = _PROMOTION_FROM_BYTE[b[..., 4]]
+
+    # `uint8` arithmetic wraps around, so a single comparison catches characters on either side of the range
+    valid = (
+        (from_file < 8)
+        & (from_rank < 8)
+        & (to_file < 8)
+        & (to_rank < 8)
+        & (promotion >= 0)
+        & ~too_long
+    )
+    keys = (
+        (from_file.astype(np.int32) | from_rank.astype(np.int32) << 3)
+        | (to_file.astype(np.int32) | to_rank.astype(np.int32) << 3) << 6
+        | promotion << 12
+    )
+    return np.where(valid, keys, np.int32(-1))
+
+
+@instrumented(count_elements)
+def keys_to_uci(keys: npt.ArrayLike) -> npt.NDArray[np.bytes_]:
+    """
+    Vectorized conversion from move keys to UCI strings, returned as a fixed-width `S5` array (non-promotions are
+    4 bytes long). Keys are not validated.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    from_square = keys & 63
+    to_square = keys >> 6 & 63
+    b = np.empty((*keys.shape, 5), dtype=np.uint8)
+    b[..., 0] = ord('a') + (from_square & 7)
+    b[..., 1] = ord('1') + (from_square >> 3)
+    b[..., 2] = ord('a') + (to_square & 7)
+    b[..., 3] = ord('1') + (to_square >> 3)
+    b[..., 4] = _PROMOTION_TO_BYTE[keys >> 12 & 7]
+    return b.view('S5').reshape(keys.shape)
+
+
+ACTION_UCI: npt.NDArray[np.bytes_] = load_table('action_uci')
+"""The UCI string of every move in `ACTION_SPACE`, in order, as a fixed-width `S5` array."""
+
+TO_SQUARE_ACTIONS: npt.NDArray[np.int16] = load_table('to_square_actions')
+"""
+The indices of the actions of `ACTION_SPACE` grouped by to-square (the actions landing on `square` are
+`TO_SQUARE_ACTIONS[TO_SQUARE_OFFSETS[square]:TO_SQUARE_OFFSETS[square + 1]]`), see `get_incoming_actions`.
+"""
+
+TO_SQUARE_OFFSETS: npt.NDArray[np.int16] = load_table('to_square_offsets')
+"""The `(65,)` offsets of the actions of every to-square in `TO_SQUARE_ACTIONS`."""
+
+
+def get_incoming_actions(
+    to_square: chess.Square, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.int16]:
+    """
+    Return the indices (in `ordering`) of the actions landing on `to_square`, ex. the moves of every piece that
+    could reach the square. In the default ordering, the result is a read-only view of `TO_SQUARE_ACTIONS`.
+    """
+    actions = TO_SQUARE_ACTIONS[
+        TO_SQUARE_OFFSETS[to_square] : TO_SQUARE_OFFSETS[to_square + 1]
+    ]
+    if ordering != DEFAULT_ORDERING:
+        return get_inverse_permutation(ordering)[actions]
+    return actions
+
+
+@instrumented(count_elements)
+def uci_to_index(
+    ucis: UciStrings, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.int16]:
+    """
+    Vectorized conversion from UCI strings (`str` or `bytes`) to action indices (in `ordering`), without going
+    through `chess.Move`. Queen promotions (ex. `e7e8q`) map to the index of the corresponding non-promotion move.
+    Malformed strings and moves outside the action space map to `-1`.
+    """
+    return keys_to_indices(uci_to_keys(ucis), ordering)
+
+
+@instrumented(count_elements)
+def index_to_uci(
+    indices: npt.ArrayLike, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.bytes_]:
+    """
+    Vectorized conversion from action indices (in `ordering`) to UCI strings, returned as a fixed-width `S5` array.
+    Use `.astype(str)` on the result to get `str` values. Raises `IndexError` for out-of-range indices, including
+    the `-1` returned by `uci_to_index` for malformed strings.
+    """
+    return ACTION_UCI[_get_default_indices(indices, ordering)]
+
+
+__all__ = [
+    'ACTION_KEYS',
+    'ACTION_UCI',
+    'KEY_TO_ACTION_INDEX',
+    'MOVE_KEY_SPACE_SIZE',
+    'TO_SQUARE_ACTIONS',
+    'TO_SQUARE_OFFSETS',
+    'UciStrings',
+    'get_action',
+    'get_action_index',
+    'get_board_move',
+    'get_incoming_actions',
+    'get_interned_move',
+    'get_move_from_key',
+    'get_move_key',
+    'index_to_uci',
+    'indices_to_keys',
+    'intern_move',
+    'keys_to_indices',
+    'keys_to_uci',
+    'pop_index',
+    'pop_indices',
+    'push_index',
+    'push_indices',
+    'uci_to_index',
+    'uci_to_keys',
+]
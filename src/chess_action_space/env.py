@@ -0,0 +1,144 @@
+from typing import NamedTuple
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import (
+    NUM_BOARD_COLUMNS,
+    get_board_array,
+    get_boards_array,
+)
+from chess_action_space.encoding import push_index
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.masks import get_legal_mask, get_legal_masks
+from chess_action_space.movegen import get_legal_masks_vectorized
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, _check_ordering
+
+_VECTORIZED_MASKS_MIN_ENVS = 64
+"""
+The number of games from which `step` builds the masks from the observations with `get_legal_masks_vectorized`.
+Below it, its fixed cost (about 3 ms per call) exceeds generating the legal moves of every board with python-chess.
+"""
+
+
+class StepResult(NamedTuple):
+    observations: npt.NDArray[np.uint64]
+    """`(N, NUM_BOARD_COLUMNS)` positions to act on, see `chess_action_space.bitboards.BoardColumn`."""
+    masks: npt.NDArray[np.bool_]
+    """`(N, ACTION_SPACE_SIZE)` legal masks of the positions to act on, in the `ordering` of the environment."""
+    rewards: npt.NDArray[np.float32]
+    """`(N,)` rewards for the player who made the last move: `1` for delivering checkmate, else `0`."""
+    dones: npt.NDArray[np.bool_]
+    """`(N,)` flags of games that ended with the last move and were automatically reset."""
+
+
+class VectorEnv:
+    """
+    `N` concurrent self-play games stepped with one action index per game.
+
+    Games end on checkmate, stalemate, insufficient material, the seventy-five-move rule, fivefold repetition, or
+    after `max_plies` plies, and are then reset automatically: the observation and mask returned for a finished game
+    already belong to its next game.
+
+    The arrays of a `StepResult` are buffers owned by the environment and are overwritten by the next call to
+    `reset` or `step`; copy them to keep them. Actions and masks are in `ordering`.
+    """
+
+    def __init__(
+        self,
+        max_plies: int = 512,
+        fen: str = chess.STARTING_FEN,
+        ordering: Ordering = DEFAULT_ORDERING,
+    ) -> None:
+        _check_ordering(ordering)
+        self.max_plies = max_plies
+        self.fen = fen
+        self.ordering = ordering
+        self.boards: list[chess.Board] = []
+
+        initial_board = chess.Board(fen)
+        self._initial_observation = get_board_array(initial_board)
+        self._initial_mask = get_legal_mask(initial_board, ordering=ordering)
+        self._allocate(0)
+
+    def _allocate(self, num_envs: int) -> None:
+        self._plies = np.zeros(num_envs, dtype=np.int32)
+        self._observations = np.empty((num_envs, NUM_BOARD_COLUMNS), dtype=np.uint64)
+        self._masks = np.zeros((num_envs, ACTION_SPACE_SIZE), dtype=np.bool_)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=np.bool_)
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.boards)
+
+    def _get_result(self) -> StepResult:
+        return StepResult(self._observations, self._masks, self._rewards, self._dones)
+
+    def reset(self, num_envs: int) -> StepResult:
+        """Start `num_envs` new games."""
+        self.boards = [chess.Board(self.fen) for _ in range(num_envs)]
+        self._allocate(num_envs)
+        self._observations[:] = self._initial_observation
+        self._masks[:] = self._initial_mask
+        return self._get_result()
+
+    def step(self, actions: npt.ArrayLike) -> StepResult:
+        """
+        Play `actions[i]` (an action index in `ordering`) in game `i` for every game. Raises `ValueError` if an action
+        is illegal.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(
+                f'Expected actions of shape ({self.num_envs},), got {actions.shape}'
+            )
+        legal = self._masks[np.arange(self.num_envs), actions]
+        if not legal.all():
+            i = int(np.argmin(legal))
+            raise ValueError(
+                f'Illegal action {actions[i]} in game {i}: {self.boards[i].fen()}'
+            )
+
+        for board, action in zip(self.boards, actions.tolist()):
+            push_index(board, action, self.ordering)
+        self._plies += 1
+        get_boards_array(self.boards, out=self._observations)
+        if self.num_envs >= _VECTORIZED_MASKS_MIN_ENVS:
+            get_legal_masks_vectorized(
+                self._observations, out=self._masks, ordering=self.ordering
+            )
+        else:
+            get_legal_masks(self.boards, out=self._masks, ordering=self.ordering)
+
+        self._rewards[:] = 0
+        self._dones[:] = self._plies >= self.max_plies
+        no_legal_moves = ~self._masks.any(axis=1)
+        for i in np.flatnonzero(no_legal_moves).tolist():
+            self._dones[i] = True
+            if self.boards[i].is_check():
+                self._rewards[i] = 1
+        for i in np.flatnonzero(~self._dones).tolist():
+            board = self.boards[i]
+            if (
+                board.is_insufficient_material()
+                or board.is_seventyfive_moves()
+                # A fivefold repetition takes at least 16 reversible plies
+                or (board.halfmove_clock >= 16 and board.is_fivefold_repetition())
+            ):
+                self._dones[i] = True
+
+        done_indices = np.flatnonzero(self._dones)
+        for i in done_indices.tolist():
+            self.boards[i] = chess.Board(self.fen)
+        self._plies[done_indices] = 0
+        self._observations[done_indices] = self._initial_observation
+        self._masks[done_indices] = self._initial_mask
+        return self._get_result()
+
+
+__all__ = [
+    'StepResult',
+    'VectorEnv',
+]
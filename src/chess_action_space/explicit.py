@@ -1,5 +1,5 @@
 """
-This file is generated, do not modify it directly!
+This file is generated by `python -m chess_action_space.generate`, do not modify it directly!
 """
 
 import chess
@@ -7,1930 +7,79 @@ import chess
 ACTION_SPACE_SIZE = 1924
 """The number of moves in the minimal discrete action space in chess."""
 
-ACTION_SPACE = (
-    chess.Move.from_uci('a1b1'),
-    chess.Move.from_uci('a1c1'),
-    chess.Move.from_uci('a1d1'),
-    chess.Move.from_uci('a1e1'),
-    chess.Move.from_uci('a1f1'),
-    chess.Move.from_uci('a1g1'),
-    chess.Move.from_uci('a1h1'),
-    chess.Move.from_uci('a1a2'),
-    chess.Move.from_uci('a1b2'),
-    chess.Move.from_uci('a1c2'),
-    chess.Move.from_uci('a1a3'),
-    chess.Move.from_uci('a1b3'),
-    chess.Move.from_uci('a1c3'),
-    chess.Move.from_uci('a1a4'),
-    chess.Move.from_uci('a1d4'),
-    chess.Move.from_uci('a1a5'),
-    chess.Move.from_uci('a1e5'),
-    chess.Move.from_uci('a1a6'),
-    chess.Move.from_uci('a1f6'),
-    chess.Move.from_uci('a1a7'),
-    chess.Move.from_uci('a1g7'),
-    chess.Move.from_uci('a1a8'),
-    chess.Move.from_uci('a1h8'),
-    chess.Move.from_uci('b1a1'),
-    chess.Move.from_uci('b1c1'),
-    chess.Move.from_uci('b1d1'),
-    chess.Move.from_uci('b1e1'),
-    chess.Move.from_uci('b1f1'),
-    chess.Move.from_uci('b1g1'),
-    chess.Move.from_uci('b1h1'),
-    chess.Move.from_uci('b1a2'),
-    chess.Move.from_uci('b1b2'),
-    chess.Move.from_uci('b1c2'),
-    chess.Move.from_uci('b1d2'),
-    chess.Move.from_uci('b1a3'),
-    chess.Move.from_uci('b1b3'),
-    chess.Move.from_uci('b1c3'),
-    chess.Move.from_uci('b1d3'),
-    chess.Move.from_uci('b1b4'),
-    chess.Move.from_uci('b1e4'),
-    chess.Move.from_uci('b1b5'),
-    chess.Move.from_uci('b1f5'),
-    chess.Move.from_uci('b1b6'),
-    chess.Move.from_uci('b1g6'),
-    chess.Move.from_uci('b1b7'),
-    chess.Move.from_uci('b1h7'),
-    chess.Move.from_uci('b1b8'),
-    chess.Move.from_uci('c1a1'),
-    chess.Move.from_uci('c1b1'),
-    chess.Move.from_uci('c1d1'),
-    chess.Move.from_uci('c1e1'),
-    chess.Move.from_uci('c1f1'),
-    chess.Move.from_uci('c1g1'),
-    chess.Move.from_uci('c1h1'),
-    chess.Move.from_uci('c1a2'),
-    chess.Move.from_uci('c1b2'),
-    chess.Move.from_uci('c1c2'),
-    chess.Move.from_uci('c1d2'),
-    chess.Move.from_uci('c1e2'),
-    chess.Move.from_uci('c1a3'),
-    chess.Move.from_uci('c1b3'),
-    chess.Move.from_uci('c1c3'),
-    chess.Move.from_uci('c1d3'),
-    chess.Move.from_uci('c1e3'),
-    chess.Move.from_uci('c1c4'),
-    chess.Move.from_uci('c1f4'),
-    chess.Move.from_uci('c1c5'),
-    chess.Move.from_uci('c1g5'),
-    chess.Move.from_uci('c1c6'),
-    chess.Move.from_uci('c1h6'),
-    chess.Move.from_uci('c1c7'),
-    chess.Move.from_uci('c1c8'),
-    chess.Move.from_uci('d1a1'),
-    chess.Move.from_uci('d1b1'),
-    chess.Move.from_uci('d1c1'),
-    chess.Move.from_uci('d1e1'),
-    chess.Move.from_uci('d1f1'),
-    chess.Move.from_uci('d1g1'),
-    chess.Move.from_uci('d1h1'),
-    chess.Move.from_uci('d1b2'),
-    chess.Move.from_uci('d1c2'),
-    chess.Move.from_uci('d1d2'),
-    chess.Move.from_uci('d1e2'),
-    chess.Move.from_uci('d1f2'),
-    chess.Move.from_uci('d1b3'),
-    chess.Move.from_uci('d1c3'),
-    chess.Move.from_uci('d1d3'),
-    chess.Move.from_uci('d1e3'),
-    chess.Move.from_uci('d1f3'),
-    chess.Move.from_uci('d1a4'),
-    chess.Move.from_uci('d1d4'),
-    chess.Move.from_uci('d1g4'),
-    chess.Move.from_uci('d1d5'),
-    chess.Move.from_uci('d1h5'),
-    chess.Move.from_uci('d1d6'),
-    chess.Move.from_uci('d1d7'),
-    chess.Move.from_uci('d1d8'),
-    chess.Move.from_uci('e1a1'),
-    chess.Move.from_uci('e1b1'),
-    chess.Move.from_uci('e1c1'),
-    chess.Move.from_uci('e1d1'),
-    chess.Move.from_uci('e1f1'),
-    chess.Move.from_uci('e1g1'),
-    chess.Move.from_uci('e1h1'),
-    chess.Move.from_uci('e1c2'),
-    chess.Move.from_uci('e1d2'),
-    chess.Move.from_uci('e1e2'),
-    chess.Move.from_uci('e1f2'),
-    chess.Move.from_uci('e1g2'),
-    chess.Move.from_uci('e1c3'),
-    chess.Move.from_uci('e1d3'),
-    chess.Move.from_uci('e1e3'),
-    chess.Move.from_uci('e1f3'),
-    chess.Move.from_uci('e1g3'),
-    chess.Move.from_uci('e1b4'),
-    chess.Move.from_uci('e1e4'),
-    chess.Move.from_uci('e1h4'),
-    chess.Move.from_uci('e1a5'),
-    chess.Move.from_uci('e1e5'),
-    chess.Move.from_uci('e1e6'),
-    chess.Move.from_uci('e1e7'),
-    chess.Move.from_uci('e1e8'),
-    chess.Move.from_uci('f1a1'),
-    chess.Move.from_uci('f1b1'),
-    chess.Move.from_uci('f1c1'),
-    chess.Move.from_uci('f1d1'),
-    chess.Move.from_uci('f1e1'),
-    chess.Move.from_uci('f1g1'),
-    chess.Move.from_uci('f1h1'),
-    chess.Move.from_uci('f1d2'),
-    chess.Move.from_uci('f1e2'),
-    chess.Move.from_uci('f1f2'),
-    chess.Move.from_uci('f1g2'),
-    chess.Move.from_uci('f1h2'),
-    chess.Move.from_uci('f1d3'),
-    chess.Move.from_uci('f1e3'),
-    chess.Move.from_uci('f1f3'),
-    chess.Move.from_uci('f1g3'),
-    chess.Move.from_uci('f1h3'),
-    chess.Move.from_uci('f1c4'),
-    chess.Move.from_uci('f1f4'),
-    chess.Move.from_uci('f1b5'),
-    chess.Move.from_uci('f1f5'),
-    chess.Move.from_uci('f1a6'),
-    chess.Move.from_uci('f1f6'),
-    chess.Move.from_uci('f1f7'),
-    chess.Move.from_uci('f1f8'),
-    chess.Move.from_uci('g1a1'),
-    chess.Move.from_uci('g1b1'),
-    chess.Move.from_uci('g1c1'),
-    chess.Move.from_uci('g1d1'),
-    chess.Move.from_uci('g1e1'),
-    chess.Move.from_uci('g1f1'),
-    chess.Move.from_uci('g1h1'),
-    chess.Move.from_uci('g1e2'),
-    chess.Move.from_uci('g1f2'),
-    chess.Move.from_uci('g1g2'),
-    chess.Move.from_uci('g1h2'),
-    chess.Move.from_uci('g1e3'),
-    chess.Move.from_uci('g1f3'),
-    chess.Move.from_uci('g1g3'),
-    chess.Move.from_uci('g1h3'),
-    chess.Move.from_uci('g1d4'),
-    chess.Move.from_uci('g1g4'),
-    chess.Move.from_uci('g1c5'),
-    chess.Move.from_uci('g1g5'),
-    chess.Move.from_uci('g1b6'),
-    chess.Move.from_uci('g1g6'),
-    chess.Move.from_uci('g1a7'),
-    chess.Move.from_uci('g1g7'),
-    chess.Move.from_uci('g1g8'),
-    chess.Move.from_uci('h1a1'),
-    chess.Move.from_uci('h1b1'),
-    chess.Move.from_uci('h1c1'),
-    chess.Move.from_uci('h1d1'),
-    chess.Move.from_uci('h1e1'),
-    chess.Move.from_uci('h1f1'),
-    chess.Move.from_uci('h1g1'),
-    chess.Move.from_uci('h1f2'),
-    chess.Move.from_uci('h1g2'),
-    chess.Move.from_uci('h1h2'),
-    chess.Move.from_uci('h1f3'),
-    chess.Move.from_uci('h1g3'),
-    chess.Move.from_uci('h1h3'),
-    chess.Move.from_uci('h1e4'),
-    chess.Move.from_uci('h1h4'),
-    chess.Move.from_uci('h1d5'),
-    chess.Move.from_uci('h1h5'),
-    chess.Move.from_uci('h1c6'),
-    chess.Move.from_uci('h1h6'),
-    chess.Move.from_uci('h1b7'),
-    chess.Move.from_uci('h1h7'),
-    chess.Move.from_uci('h1a8'),
-    chess.Move.from_uci('h1h8'),
-    chess.Move.from_uci('a2a1'),
-    chess.Move.from_uci('a2a1n'),
-    chess.Move.from_uci('a2a1b'),
-    chess.Move.from_uci('a2a1r'),
-    chess.Move.from_uci('a2b1'),
-    chess.Move.from_uci('a2b1n'),
-    chess.Move.from_uci('a2b1b'),
-    chess.Move.from_uci('a2b1r'),
-    chess.Move.from_uci('a2c1'),
-    chess.Move.from_uci('a2b2'),
-    chess.Move.from_uci('a2c2'),
-    chess.Move.from_uci('a2d2'),
-    chess.Move.from_uci('a2e2'),
-    chess.Move.from_uci('a2f2'),
-    chess.Move.from_uci('a2g2'),
-    chess.Move.from_uci('a2h2'),
-    chess.Move.from_uci('a2a3'),
-    chess.Move.from_uci('a2b3'),
-    chess.Move.from_uci('a2c3'),
-    chess.Move.from_uci('a2a4'),
-    chess.Move.from_uci('a2b4'),
-    chess.Move.from_uci('a2c4'),
-    chess.Move.from_uci('a2a5'),
-    chess.Move.from_uci('a2d5'),
-    chess.Move.from_uci('a2a6'),
-    chess.Move.from_uci('a2e6'),
-    chess.Move.from_uci('a2a7'),
-    chess.Move.from_uci('a2f7'),
-    chess.Move.from_uci('a2a8'),
-    chess.Move.from_uci('a2g8'),
-    chess.Move.from_uci('b2a1'),
-    chess.Move.from_uci('b2a1n'),
-    chess.Move.from_uci('b2a1b'),
-    chess.Move.from_uci('b2a1r'),
-    chess.Move.from_uci('b2b1'),
-    chess.Move.from_uci('b2b1n'),
-    chess.Move.from_uci('b2b1b'),
-    chess.Move.from_uci('b2b1r'),
-    chess.Move.from_uci('b2c1'),
-    chess.Move.from_uci('b2c1n'),
-    chess.Move.from_uci('b2c1b'),
-    chess.Move.from_uci('b2c1r'),
-    chess.Move.from_uci('b2d1'),
-    chess.Move.from_uci('b2a2'),
-    chess.Move.from_uci('b2c2'),
-    chess.Move.from_uci('b2d2'),
-    chess.Move.from_uci('b2e2'),
-    chess.Move.from_uci('b2f2'),
-    chess.Move.from_uci('b2g2'),
-    chess.Move.from_uci('b2h2'),
-    chess.Move.from_uci('b2a3'),
-    chess.Move.from_uci('b2b3'),
-    chess.Move.from_uci('b2c3'),
-    chess.Move.from_uci('b2d3'),
-    chess.Move.from_uci('b2a4'),
-    chess.Move.from_uci('b2b4'),
-    chess.Move.from_uci('b2c4'),
-    chess.Move.from_uci('b2d4'),
-    chess.Move.from_uci('b2b5'),
-    chess.Move.from_uci('b2e5'),
-    chess.Move.from_uci('b2b6'),
-    chess.Move.from_uci('b2f6'),
-    chess.Move.from_uci('b2b7'),
-    chess.Move.from_uci('b2g7'),
-    chess.Move.from_uci('b2b8'),
-    chess.Move.from_uci('b2h8'),
-    chess.Move.from_uci('c2a1'),
-    chess.Move.from_uci('c2b1'),
-    chess.Move.from_uci('c2b1n'),
-    chess.Move.from_uci('c2b1b'),
-    chess.Move.from_uci('c2b1r'),
-    chess.Move.from_uci('c2c1'),
-    chess.Move.from_uci('c2c1n'),
-    chess.Move.from_uci('c2c1b'),
-    chess.Move.from_uci('c2c1r'),
-    chess.Move.from_uci('c2d1'),
-    chess.Move.from_uci('c2d1n'),
-    chess.Move.from_uci('c2d1b'),
-    chess.Move.from_uci('c2d1r'),
-    chess.Move.from_uci('c2e1'),
-    chess.Move.from_uci('c2a2'),
-    chess.Move.from_uci('c2b2'),
-    chess.Move.from_uci('c2d2'),
-    chess.Move.from_uci('c2e2'),
-    chess.Move.from_uci('c2f2'),
-    chess.Move.from_uci('c2g2'),
-    chess.Move.from_uci('c2h2'),
-    chess.Move.from_uci('c2a3'),
-    chess.Move.from_uci('c2b3'),
-    chess.Move.from_uci('c2c3'),
-    chess.Move.from_uci('c2d3'),
-    chess.Move.from_uci('c2e3'),
-    chess.Move.from_uci('c2a4'),
-    chess.Move.from_uci('c2b4'),
-    chess.Move.from_uci('c2c4'),
-    chess.Move.from_uci('c2d4'),
-    chess.Move.from_uci('c2e4'),
-    chess.Move.from_uci('c2c5'),
-    chess.Move.from_uci('c2f5'),
-    chess.Move.from_uci('c2c6'),
-    chess.Move.from_uci('c2g6'),
-    chess.Move.from_uci('c2c7'),
-    chess.Move.from_uci('c2h7'),
-    chess.Move.from_uci('c2c8'),
-    chess.Move.from_uci('d2b1'),
-    chess.Move.from_uci('d2c1'),
-    chess.Move.from_uci('d2c1n'),
-    chess.Move.from_uci('d2c1b'),
-    chess.Move.from_uci('d2c1r'),
-    chess.Move.from_uci('d2d1'),
-    chess.Move.from_uci('d2d1n'),
-    chess.Move.from_uci('d2d1b'),
-    chess.Move.from_uci('d2d1r'),
-    chess.Move.from_uci('d2e1'),
-    chess.Move.from_uci('d2e1n'),
-    chess.Move.from_uci('d2e1b'),
-    chess.Move.from_uci('d2e1r'),
-    chess.Move.from_uci('d2f1'),
-    chess.Move.from_uci('d2a2'),
-    chess.Move.from_uci('d2b2'),
-    chess.Move.from_uci('d2c2'),
-    chess.Move.from_uci('d2e2'),
-    chess.Move.from_uci('d2f2'),
-    chess.Move.from_uci('d2g2'),
-    chess.Move.from_uci('d2h2'),
-    chess.Move.from_uci('d2b3'),
-    chess.Move.from_uci('d2c3'),
-    chess.Move.from_uci('d2d3'),
-    chess.Move.from_uci('d2e3'),
-    chess.Move.from_uci('d2f3'),
-    chess.Move.from_uci('d2b4'),
-    chess.Move.from_uci('d2c4'),
-    chess.Move.from_uci('d2d4'),
-    chess.Move.from_uci('d2e4'),
-    chess.Move.from_uci('d2f4'),
-    chess.Move.from_uci('d2a5'),
-    chess.Move.from_uci('d2d5'),
-    chess.Move.from_uci('d2g5'),
-    chess.Move.from_uci('d2d6'),
-    chess.Move.from_uci('d2h6'),
-    chess.Move.from_uci('d2d7'),
-    chess.Move.from_uci('d2d8'),
-    chess.Move.from_uci('e2c1'),
-    chess.Move.from_uci('e2d1'),
-    chess.Move.from_uci('e2d1n'),
-    chess.Move.from_uci('e2d1b'),
-    chess.Move.from_uci('e2d1r'),
-    chess.Move.from_uci('e2e1'),
-    chess.Move.from_uci('e2e1n'),
-    chess.Move.from_uci('e2e1b'),
-    chess.Move.from_uci('e2e1r'),
-    chess.Move.from_uci('e2f1'),
-    chess.Move.from_uci('e2f1n'),
-    chess.Move.from_uci('e2f1b'),
-    chess.Move.from_uci('e2f1r'),
-    chess.Move.from_uci('e2g1'),
-    chess.Move.from_uci('e2a2'),
-    chess.Move.from_uci('e2b2'),
-    chess.Move.from_uci('e2c2'),
-    chess.Move.from_uci('e2d2'),
-    chess.Move.from_uci('e2f2'),
-    chess.Move.from_uci('e2g2'),
-    chess.Move.from_uci('e2h2'),
-    chess.Move.from_uci('e2c3'),
-    chess.Move.from_uci('e2d3'),
-    chess.Move.from_uci('e2e3'),
-    chess.Move.from_uci('e2f3'),
-    chess.Move.from_uci('e2g3'),
-    chess.Move.from_uci('e2c4'),
-    chess.Move.from_uci('e2d4'),
-    chess.Move.from_uci('e2e4'),
-    chess.Move.from_uci('e2f4'),
-    chess.Move.from_uci('e2g4'),
-    chess.Move.from_uci('e2b5'),
-    chess.Move.from_uci('e2e5'),
-    chess.Move.from_uci('e2h5'),
-    chess.Move.from_uci('e2a6'),
-    chess.Move.from_uci('e2e6'),
-    chess.Move.from_uci('e2e7'),
-    chess.Move.from_uci('e2e8'),
-    chess.Move.from_uci('f2d1'),
-    chess.Move.from_uci('f2e1'),
-    chess.Move.from_uci('f2e1n'),
-    chess.Move.from_uci('f2e1b'),
-    chess.Move.from_uci('f2e1r'),
-    chess.Move.from_uci('f2f1'),
-    chess.Move.from_uci('f2f1n'),
-    chess.Move.from_uci('f2f1b'),
-    chess.Move.from_uci('f2f1r'),
-    chess.Move.from_uci('f2g1'),
-    chess.Move.from_uci('f2g1n'),
-    chess.Move.from_uci('f2g1b'),
-    chess.Move.from_uci('f2g1r'),
-    chess.Move.from_uci('f2h1'),
-    chess.Move.from_uci('f2a2'),
-    chess.Move.from_uci('f2b2'),
-    chess.Move.from_uci('f2c2'),
-    chess.Move.from_uci('f2d2'),
-    chess.Move.from_uci('f2e2'),
-    chess.Move.from_uci('f2g2'),
-    chess.Move.from_uci('f2h2'),
-    chess.Move.from_uci('f2d3'),
-    chess.Move.from_uci('f2e3'),
-    chess.Move.from_uci('f2f3'),
-    chess.Move.from_uci('f2g3'),
-    chess.Move.from_uci('f2h3'),
-    chess.Move.from_uci('f2d4'),
-    chess.Move.from_uci('f2e4'),
-    chess.Move.from_uci('f2f4'),
-    chess.Move.from_uci('f2g4'),
-    chess.Move.from_uci('f2h4'),
-    chess.Move.from_uci('f2c5'),
-    chess.Move.from_uci('f2f5'),
-    chess.Move.from_uci('f2b6'),
-    chess.Move.from_uci('f2f6'),
-    chess.Move.from_uci('f2a7'),
-    chess.Move.from_uci('f2f7'),
-    chess.Move.from_uci('f2f8'),
-    chess.Move.from_uci('g2e1'),
-    chess.Move.from_uci('g2f1'),
-    chess.Move.from_uci('g2f1n'),
-    chess.Move.from_uci('g2f1b'),
-    chess.Move.from_uci('g2f1r'),
-    chess.Move.from_uci('g2g1'),
-    chess.Move.from_uci('g2g1n'),
-    chess.Move.from_uci('g2g1b'),
-    chess.Move.from_uci('g2g1r'),
-    chess.Move.from_uci('g2h1'),
-    chess.Move.from_uci('g2h1n'),
-    chess.Move.from_uci('g2h1b'),
-    chess.Move.from_uci('g2h1r'),
-    chess.Move.from_uci('g2a2'),
-    chess.Move.from_uci('g2b2'),
-    chess.Move.from_uci('g2c2'),
-    chess.Move.from_uci('g2d2'),
-    chess.Move.from_uci('g2e2'),
-    chess.Move.from_uci('g2f2'),
-    chess.Move.from_uci('g2h2'),
-    chess.Move.from_uci('g2e3'),
-    chess.Move.from_uci('g2f3'),
-    chess.Move.from_uci('g2g3'),
-    chess.Move.from_uci('g2h3'),
-    chess.Move.from_uci('g2e4'),
-    chess.Move.from_uci('g2f4'),
-    chess.Move.from_uci('g2g4'),
-    chess.Move.from_uci('g2h4'),
-    chess.Move.from_uci('g2d5'),
-    chess.Move.from_uci('g2g5'),
-    chess.Move.from_uci('g2c6'),
-    chess.Move.from_uci('g2g6'),
-    chess.Move.from_uci('g2b7'),
-    chess.Move.from_uci('g2g7'),
-    chess.Move.from_uci('g2a8'),
-    chess.Move.from_uci('g2g8'),
-    chess.Move.from_uci('h2f1'),
-    chess.Move.from_uci('h2g1'),
-    chess.Move.from_uci('h2g1n'),
-    chess.Move.from_uci('h2g1b'),
-    chess.Move.from_uci('h2g1r'),
-    chess.Move.from_uci('h2h1'),
-    chess.Move.from_uci('h2h1n'),
-    chess.Move.from_uci('h2h1b'),
-    chess.Move.from_uci('h2h1r'),
-    chess.Move.from_uci('h2a2'),
-    chess.Move.from_uci('h2b2'),
-    chess.Move.from_uci('h2c2'),
-    chess.Move.from_uci('h2d2'),
-    chess.Move.from_uci('h2e2'),
-    chess.Move.from_uci('h2f2'),
-    chess.Move.from_uci('h2g2'),
-    chess.Move.from_uci('h2f3'),
-    chess.Move.from_uci('h2g3'),
-    chess.Move.from_uci('h2h3'),
-    chess.Move.from_uci('h2f4'),
-    chess.Move.from_uci('h2g4'),
-    chess.Move.from_uci('h2h4'),
-    chess.Move.from_uci('h2e5'),
-    chess.Move.from_uci('h2h5'),
-    chess.Move.from_uci('h2d6'),
-    chess.Move.from_uci('h2h6'),
-    chess.Move.from_uci('h2c7'),
-    chess.Move.from_uci('h2h7'),
-    chess.Move.from_uci('h2b8'),
-    chess.Move.from_uci('h2h8'),
-    chess.Move.from_uci('a3a1'),
-    chess.Move.from_uci('a3b1'),
-    chess.Move.from_uci('a3c1'),
-    chess.Move.from_uci('a3a2'),
-    chess.Move.from_uci('a3b2'),
-    chess.Move.from_uci('a3c2'),
-    chess.Move.from_uci('a3b3'),
-    chess.Move.from_uci('a3c3'),
-    chess.Move.from_uci('a3d3'),
-    chess.Move.from_uci('a3e3'),
-    chess.Move.from_uci('a3f3'),
-    chess.Move.from_uci('a3g3'),
-    chess.Move.from_uci('a3h3'),
-    chess.Move.from_uci('a3a4'),
-    chess.Move.from_uci('a3b4'),
-    chess.Move.from_uci('a3c4'),
-    chess.Move.from_uci('a3a5'),
-    chess.Move.from_uci('a3b5'),
-    chess.Move.from_uci('a3c5'),
-    chess.Move.from_uci('a3a6'),
-    chess.Move.from_uci('a3d6'),
-    chess.Move.from_uci('a3a7'),
-    chess.Move.from_uci('a3e7'),
-    chess.Move.from_uci('a3a8'),
-    chess.Move.from_uci('a3f8'),
-    chess.Move.from_uci('b3a1'),
-    chess.Move.from_uci('b3b1'),
-    chess.Move.from_uci('b3c1'),
-    chess.Move.from_uci('b3d1'),
-    chess.Move.from_uci('b3a2'),
-    chess.Move.from_uci('b3b2'),
-    chess.Move.from_uci('b3c2'),
-    chess.Move.from_uci('b3d2'),
-    chess.Move.from_uci('b3a3'),
-    chess.Move.from_uci('b3c3'),
-    chess.Move.from_uci('b3d3'),
-    chess.Move.from_uci('b3e3'),
-    chess.Move.from_uci('b3f3'),
-    chess.Move.from_uci('b3g3'),
-    chess.Move.from_uci('b3h3'),
-    chess.Move.from_uci('b3a4'),
-    chess.Move.from_uci('b3b4'),
-    chess.Move.from_uci('b3c4'),
-    chess.Move.from_uci('b3d4'),
-    chess.Move.from_uci('b3a5'),
-    chess.Move.from_uci('b3b5'),
-    chess.Move.from_uci('b3c5'),
-    chess.Move.from_uci('b3d5'),
-    chess.Move.from_uci('b3b6'),
-    chess.Move.from_uci('b3e6'),
-    chess.Move.from_uci('b3b7'),
-    chess.Move.from_uci('b3f7'),
-    chess.Move.from_uci('b3b8'),
-    chess.Move.from_uci('b3g8'),
-    chess.Move.from_uci('c3a1'),
-    chess.Move.from_uci('c3b1'),
-    chess.Move.from_uci('c3c1'),
-    chess.Move.from_uci('c3d1'),
-    chess.Move.from_uci('c3e1'),
-    chess.Move.from_uci('c3a2'),
-    chess.Move.from_uci('c3b2'),
-    chess.Move.from_uci('c3c2'),
-    chess.Move.from_uci('c3d2'),
-    chess.Move.from_uci('c3e2'),
-    chess.Move.from_uci('c3a3'),
-    chess.Move.from_uci('c3b3'),
-    chess.Move.from_uci('c3d3'),
-    chess.Move.from_uci('c3e3'),
-    chess.Move.from_uci('c3f3'),
-    chess.Move.from_uci('c3g3'),
-    chess.Move.from_uci('c3h3'),
-    chess.Move.from_uci('c3a4'),
-    chess.Move.from_uci('c3b4'),
-    chess.Move.from_uci('c3c4'),
-    chess.Move.from_uci('c3d4'),
-    chess.Move.from_uci('c3e4'),
-    chess.Move.from_uci('c3a5'),
-    chess.Move.from_uci('c3b5'),
-    chess.Move.from_uci('c3c5'),
-    chess.Move.from_uci('c3d5'),
-    chess.Move.from_uci('c3e5'),
-    chess.Move.from_uci('c3c6'),
-    chess.Move.from_uci('c3f6'),
-    chess.Move.from_uci('c3c7'),
-    chess.Move.from_uci('c3g7'),
-    chess.Move.from_uci('c3c8'),
-    chess.Move.from_uci('c3h8'),
-    chess.Move.from_uci('d3b1'),
-    chess.Move.from_uci('d3c1'),
-    chess.Move.from_uci('d3d1'),
-    chess.Move.from_uci('d3e1'),
-    chess.Move.from_uci('d3f1'),
-    chess.Move.from_uci('d3b2'),
-    chess.Move.from_uci('d3c2'),
-    chess.Move.from_uci('d3d2'),
-    chess.Move.from_uci('d3e2'),
-    chess.Move.from_uci('d3f2'),
-    chess.Move.from_uci('d3a3'),
-    chess.Move.from_uci('d3b3'),
-    chess.Move.from_uci('d3c3'),
-    chess.Move.from_uci('d3e3'),
-    chess.Move.from_uci('d3f3'),
-    chess.Move.from_uci('d3g3'),
-    chess.Move.from_uci('d3h3'),
-    chess.Move.from_uci('d3b4'),
-    chess.Move.from_uci('d3c4'),
-    chess.Move.from_uci('d3d4'),
-    chess.Move.from_uci('d3e4'),
-    chess.Move.from_uci('d3f4'),
-    chess.Move.from_uci('d3b5'),
-    chess.Move.from_uci('d3c5'),
-    chess.Move.from_uci('d3d5'),
-    chess.Move.from_uci('d3e5'),
-    chess.Move.from_uci('d3f5'),
-    chess.Move.from_uci('d3a6'),
-    chess.Move.from_uci('d3d6'),
-    chess.Move.from_uci('d3g6'),
-    chess.Move.from_uci('d3d7'),
-    chess.Move.from_uci('d3h7'),
-    chess.Move.from_uci('d3d8'),
-    chess.Move.from_uci('e3c1'),
-    chess.Move.from_uci('e3d1'),
-    chess.Move.from_uci('e3e1'),
-    chess.Move.from_uci('e3f1'),
-    chess.Move.from_uci('e3g1'),
-    chess.Move.from_uci('e3c2'),
-    chess.Move.from_uci('e3d2'),
-    chess.Move.from_uci('e3e2'),
-    chess.Move.from_uci('e3f2'),
-    chess.Move.from_uci('e3g2'),
-    chess.Move.from_uci('e3a3'),
-    chess.Move.from_uci('e3b3'),
-    chess.Move.from_uci('e3c3'),
-    chess.Move.from_uci('e3d3'),
-    chess.Move.from_uci('e3f3'),
-    chess.Move.from_uci('e3g3'),
-    chess.Move.from_uci('e3h3'),
-    chess.Move.from_uci('e3c4'),
-    chess.Move.from_uci('e3d4'),
-    chess.Move.from_uci('e3e4'),
-    chess.Move.from_uci('e3f4'),
-    chess.Move.from_uci('e3g4'),
-    chess.Move.from_uci('e3c5'),
-    chess.Move.from_uci('e3d5'),
-    chess.Move.from_uci('e3e5'),
-    chess.Move.from_uci('e3f5'),
-    chess.Move.from_uci('e3g5'),
-    chess.Move.from_uci('e3b6'),
-    chess.Move.from_uci('e3e6'),
-    chess.Move.from_uci('e3h6'),
-    chess.Move.from_uci('e3a7'),
-    chess.Move.from_uci('e3e7'),
-    chess.Move.from_uci('e3e8'),
-    chess.Move.from_uci('f3d1'),
-    chess.Move.from_uci('f3e1'),
-    chess.Move.from_uci('f3f1'),
-    chess.Move.from_uci('f3g1'),
-    chess.Move.from_uci('f3h1'),
-    chess.Move.from_uci('f3d2'),
-    chess.Move.from_uci('f3e2'),
-    chess.Move.from_uci('f3f2'),
-    chess.Move.from_uci('f3g2'),
-    chess.Move.from_uci('f3h2'),
-    chess.Move.from_uci('f3a3'),
-    chess.Move.from_uci('f3b3'),
-    chess.Move.from_uci('f3c3'),
-    chess.Move.from_uci('f3d3'),
-    chess.Move.from_uci('f3e3'),
-    chess.Move.from_uci('f3g3'),
-    chess.Move.from_uci('f3h3'),
-    chess.Move.from_uci('f3d4'),
-    chess.Move.from_uci('f3e4'),
-    chess.Move.from_uci('f3f4'),
-    chess.Move.from_uci('f3g4'),
-    chess.Move.from_uci('f3h4'),
-    chess.Move.from_uci('f3d5'),
-    chess.Move.from_uci('f3e5'),
-    chess.Move.from_uci('f3f5'),
-    chess.Move.from_uci('f3g5'),
-    chess.Move.from_uci('f3h5'),
-    chess.Move.from_uci('f3c6'),
-    chess.Move.from_uci('f3f6'),
-    chess.Move.from_uci('f3b7'),
-    chess.Move.from_uci('f3f7'),
-    chess.Move.from_uci('f3a8'),
-    chess.Move.from_uci('f3f8'),
-    chess.Move.from_uci('g3e1'),
-    chess.Move.from_uci('g3f1'),
-    chess.Move.from_uci('g3g1'),
-    chess.Move.from_uci('g3h1'),
-    chess.Move.from_uci('g3e2'),
-    chess.Move.from_uci('g3f2'),
-    chess.Move.from_uci('g3g2'),
-    chess.Move.from_uci('g3h2'),
-    chess.Move.from_uci('g3a3'),
-    chess.Move.from_uci('g3b3'),
-    chess.Move.from_uci('g3c3'),
-    chess.Move.from_uci('g3d3'),
-    chess.Move.from_uci('g3e3'),
-    chess.Move.from_uci('g3f3'),
-    chess.Move.from_uci('g3h3'),
-    chess.Move.from_uci('g3e4'),
-    chess.Move.from_uci('g3f4'),
-    chess.Move.from_uci('g3g4'),
-    chess.Move.from_uci('g3h4'),
-    chess.Move.from_uci('g3e5'),
-    chess.Move.from_uci('g3f5'),
-    chess.Move.from_uci('g3g5'),
-    chess.Move.from_uci('g3h5'),
-    chess.Move.from_uci('g3d6'),
-    chess.Move.from_uci('g3g6'),
-    chess.Move.from_uci('g3c7'),
-    chess.Move.from_uci('g3g7'),
-    chess.Move.from_uci('g3b8'),
-    chess.Move.from_uci('g3g8'),
-    chess.Move.from_uci('h3f1'),
-    chess.Move.from_uci('h3g1'),
-    chess.Move.from_uci('h3h1'),
-    chess.Move.from_uci('h3f2'),
-    chess.Move.from_uci('h3g2'),
-    chess.Move.from_uci('h3h2'),
-    chess.Move.from_uci('h3a3'),
-    chess.Move.from_uci('h3b3'),
-    chess.Move.from_uci('h3c3'),
-    chess.Move.from_uci('h3d3'),
-    chess.Move.from_uci('h3e3'),
-    chess.Move.from_uci('h3f3'),
-    chess.Move.from_uci('h3g3'),
-    chess.Move.from_uci('h3f4'),
-    chess.Move.from_uci('h3g4'),
-    chess.Move.from_uci('h3h4'),
-    chess.Move.from_uci('h3f5'),
-    chess.Move.from_uci('h3g5'),
-    chess.Move.from_uci('h3h5'),
-    chess.Move.from_uci('h3e6'),
-    chess.Move.from_uci('h3h6'),
-    chess.Move.from_uci('h3d7'),
-    chess.Move.from_uci('h3h7'),
-    chess.Move.from_uci('h3c8'),
-    chess.Move.from_uci('h3h8'),
-    chess.Move.from_uci('a4a1'),
-    chess.Move.from_uci('a4d1'),
-    chess.Move.from_uci('a4a2'),
-    chess.Move.from_uci('a4b2'),
-    chess.Move.from_uci('a4c2'),
-    chess.Move.from_uci('a4a3'),
-    chess.Move.from_uci('a4b3'),
-    chess.Move.from_uci('a4c3'),
-    chess.Move.from_uci('a4b4'),
-    chess.Move.from_uci('a4c4'),
-    chess.Move.from_uci('a4d4'),
-    chess.Move.from_uci('a4e4'),
-    chess.Move.from_uci('a4f4'),
-    chess.Move.from_uci('a4g4'),
-    chess.Move.from_uci('a4h4'),
-    chess.Move.from_uci('a4a5'),
-    chess.Move.from_uci('a4b5'),
-    chess.Move.from_uci('a4c5'),
-    chess.Move.from_uci('a4a6'),
-    chess.Move.from_uci('a4b6'),
-    chess.Move.from_uci('a4c6'),
-    chess.Move.from_uci('a4a7'),
-    chess.Move.from_uci('a4d7'),
-    chess.Move.from_uci('a4a8'),
-    chess.Move.from_uci('a4e8'),
-    chess.Move.from_uci('b4b1'),
-    chess.Move.from_uci('b4e1'),
-    chess.Move.from_uci('b4a2'),
-    chess.Move.from_uci('b4b2'),
-    chess.Move.from_uci('b4c2'),
-    chess.Move.from_uci('b4d2'),
-    chess.Move.from_uci('b4a3'),
-    chess.Move.from_uci('b4b3'),
-    chess.Move.from_uci('b4c3'),
-    chess.Move.from_uci('b4d3'),
-    chess.Move.from_uci('b4a4'),
-    chess.Move.from_uci('b4c4'),
-    chess.Move.from_uci('b4d4'),
-    chess.Move.from_uci('b4e4'),
-    chess.Move.from_uci('b4f4'),
-    chess.Move.from_uci('b4g4'),
-    chess.Move.from_uci('b4h4'),
-    chess.Move.from_uci('b4a5'),
-    chess.Move.from_uci('b4b5'),
-    chess.Move.from_uci('b4c5'),
-    chess.Move.from_uci('b4d5'),
-    chess.Move.from_uci('b4a6'),
-    chess.Move.from_uci('b4b6'),
-    chess.Move.from_uci('b4c6'),
-    chess.Move.from_uci('b4d6'),
-    chess.Move.from_uci('b4b7'),
-    chess.Move.from_uci('b4e7'),
-    chess.Move.from_uci('b4b8'),
-    chess.Move.from_uci('b4f8'),
-    chess.Move.from_uci('c4c1'),
-    chess.Move.from_uci('c4f1'),
-    chess.Move.from_uci('c4a2'),
-    chess.Move.from_uci('c4b2'),
-    chess.Move.from_uci('c4c2'),
-    chess.Move.from_uci('c4d2'),
-    chess.Move.from_uci('c4e2'),
-    chess.Move.from_uci('c4a3'),
-    chess.Move.from_uci('c4b3'),
-    chess.Move.from_uci('c4c3'),
-    chess.Move.from_uci('c4d3'),
-    chess.Move.from_uci('c4e3'),
-    chess.Move.from_uci('c4a4'),
-    chess.Move.from_uci('c4b4'),
-    chess.Move.from_uci('c4d4'),
-    chess.Move.from_uci('c4e4'),
-    chess.Move.from_uci('c4f4'),
-    chess.Move.from_uci('c4g4'),
-    chess.Move.from_uci('c4h4'),
-    chess.Move.from_uci('c4a5'),
-    chess.Move.from_uci('c4b5'),
-    chess.Move.from_uci('c4c5'),
-    chess.Move.from_uci('c4d5'),
-    chess.Move.from_uci('c4e5'),
-    chess.Move.from_uci('c4a6'),
-    chess.Move.from_uci('c4b6'),
-    chess.Move.from_uci('c4c6'),
-    chess.Move.from_uci('c4d6'),
-    chess.Move.from_uci('c4e6'),
-    chess.Move.from_uci('c4c7'),
-    chess.Move.from_uci('c4f7'),
-    chess.Move.from_uci('c4c8'),
-    chess.Move.from_uci('c4g8'),
-    chess.Move.from_uci('d4a1'),
-    chess.Move.from_uci('d4d1'),
-    chess.Move.from_uci('d4g1'),
-    chess.Move.from_uci('d4b2'),
-    chess.Move.from_uci('d4c2'),
-    chess.Move.from_uci('d4d2'),
-    chess.Move.from_uci('d4e2'),
-    chess.Move.from_uci('d4f2'),
-    chess.Move.from_uci('d4b3'),
-    chess.Move.from_uci('d4c3'),
-    chess.Move.from_uci('d4d3'),
-    chess.Move.from_uci('d4e3'),
-    chess.Move.from_uci('d4f3'),
-    chess.Move.from_uci('d4a4'),
-    chess.Move.from_uci('d4b4'),
-    chess.Move.from_uci('d4c4'),
-    chess.Move.from_uci('d4e4'),
-    chess.Move.from_uci('d4f4'),
-    chess.Move.from_uci('d4g4'),
-    chess.Move.from_uci('d4h4'),
-    chess.Move.from_uci('d4b5'),
-    chess.Move.from_uci('d4c5'),
-    chess.Move.from_uci('d4d5'),
-    chess.Move.from_uci('d4e5'),
-    chess.Move.from_uci('d4f5'),
-    chess.Move.from_uci('d4b6'),
-    chess.Move.from_uci('d4c6'),
-    chess.Move.from_uci('d4d6'),
-    chess.Move.from_uci('d4e6'),
-    chess.Move.from_uci('d4f6'),
-    chess.Move.from_uci('d4a7'),
-    chess.Move.from_uci('d4d7'),
-    chess.Move.from_uci('d4g7'),
-    chess.Move.from_uci('d4d8'),
-    chess.Move.from_uci('d4h8'),
-    chess.Move.from_uci('e4b1'),
-    chess.Move.from_uci('e4e1'),
-    chess.Move.from_uci('e4h1'),
-    chess.Move.from_uci('e4c2'),
-    chess.Move.from_uci('e4d2'),
-    chess.Move.from_uci('e4e2'),
-    chess.Move.from_uci('e4f2'),
-    chess.Move.from_uci('e4g2'),
-    chess.Move.from_uci('e4c3'),
-    chess.Move.from_uci('e4d3'),
-    chess.Move.from_uci('e4e3'),
-    chess.Move.from_uci('e4f3'),
-    chess.Move.from_uci('e4g3'),
-    chess.Move.from_uci('e4a4'),
-    chess.Move.from_uci('e4b4'),
-    chess.Move.from_uci('e4c4'),
-    chess.Move.from_uci('e4d4'),
-    chess.Move.from_uci('e4f4'),
-    chess.Move.from_uci('e4g4'),
-    chess.Move.from_uci('e4h4'),
-    chess.Move.from_uci('e4c5'),
-    chess.Move.from_uci('e4d5'),
-    chess.Move.from_uci('e4e5'),
-    chess.Move.from_uci('e4f5'),
-    chess.Move.from_uci('e4g5'),
-    chess.Move.from_uci('e4c6'),
-    chess.Move.from_uci('e4d6'),
-    chess.Move.from_uci('e4e6'),
-    chess.Move.from_uci('e4f6'),
-    chess.Move.from_uci('e4g6'),
-    chess.Move.from_uci('e4b7'),
-    chess.Move.from_uci('e4e7'),
-    chess.Move.from_uci('e4h7'),
-    chess.Move.from_uci('e4a8'),
-    chess.Move.from_uci('e4e8'),
-    chess.Move.from_uci('f4c1'),
-    chess.Move.from_uci('f4f1'),
-    chess.Move.from_uci('f4d2'),
-    chess.Move.from_uci('f4e2'),
-    chess.Move.from_uci('f4f2'),
-    chess.Move.from_uci('f4g2'),
-    chess.Move.from_uci('f4h2'),
-    chess.Move.from_uci('f4d3'),
-    chess.Move.from_uci('f4e3'),
-    chess.Move.from_uci('f4f3'),
-    chess.Move.from_uci('f4g3'),
-    chess.Move.from_uci('f4h3'),
-    chess.Move.from_uci('f4a4'),
-    chess.Move.from_uci('f4b4'),
-    chess.Move.from_uci('f4c4'),
-    chess.Move.from_uci('f4d4'),
-    chess.Move.from_uci('f4e4'),
-    chess.Move.from_uci('f4g4'),
-    chess.Move.from_uci('f4h4'),
-    chess.Move.from_uci('f4d5'),
-    chess.Move.from_uci('f4e5'),
-    chess.Move.from_uci('f4f5'),
-    chess.Move.from_uci('f4g5'),
-    chess.Move.from_uci('f4h5'),
-    chess.Move.from_uci('f4d6'),
-    chess.Move.from_uci('f4e6'),
-    chess.Move.from_uci('f4f6'),
-    chess.Move.from_uci('f4g6'),
-    chess.Move.from_uci('f4h6'),
-    chess.Move.from_uci('f4c7'),
-    chess.Move.from_uci('f4f7'),
-    chess.Move.from_uci('f4b8'),
-    chess.Move.from_uci('f4f8'),
-    chess.Move.from_uci('g4d1'),
-    chess.Move.from_uci('g4g1'),
-    chess.Move.from_uci('g4e2'),
-    chess.Move.from_uci('g4f2'),
-    chess.Move.from_uci('g4g2'),
-    chess.Move.from_uci('g4h2'),
-    chess.Move.from_uci('g4e3'),
-    chess.Move.from_uci('g4f3'),
-    chess.Move.from_uci('g4g3'),
-    chess.Move.from_uci('g4h3'),
-    chess.Move.from_uci('g4a4'),
-    chess.Move.from_uci('g4b4'),
-    chess.Move.from_uci('g4c4'),
-    chess.Move.from_uci('g4d4'),
-    chess.Move.from_uci('g4e4'),
-    chess.Move.from_uci('g4f4'),
-    chess.Move.from_uci('g4h4'),
-    chess.Move.from_uci('g4e5'),
-    chess.Move.from_uci('g4f5'),
-    chess.Move.from_uci('g4g5'),
-    chess.Move.from_uci('g4h5'),
-    chess.Move.from_uci('g4e6'),
-    chess.Move.from_uci('g4f6'),
-    chess.Move.from_uci('g4g6'),
-    chess.Move.from_uci('g4h6'),
-    chess.Move.from_uci('g4d7'),
-    chess.Move.from_uci('g4g7'),
-    chess.Move.from_uci('g4c8'),
-    chess.Move.from_uci('g4g8'),
-    chess.Move.from_uci('h4e1'),
-    chess.Move.from_uci('h4h1'),
-    chess.Move.from_uci('h4f2'),
-    chess.Move.from_uci('h4g2'),
-    chess.Move.from_uci('h4h2'),
-    chess.Move.from_uci('h4f3'),
-    chess.Move.from_uci('h4g3'),
-    chess.Move.from_uci('h4h3'),
-    chess.Move.from_uci('h4a4'),
-    chess.Move.from_uci('h4b4'),
-    chess.Move.from_uci('h4c4'),
-    chess.Move.from_uci('h4d4'),
-    chess.Move.from_uci('h4e4'),
-    chess.Move.from_uci('h4f4'),
-    chess.Move.from_uci('h4g4'),
-    chess.Move.from_uci('h4f5'),
-    chess.Move.from_uci('h4g5'),
-    chess.Move.from_uci('h4h5'),
-    chess.Move.from_uci('h4f6'),
-    chess.Move.from_uci('h4g6'),
-    chess.Move.from_uci('h4h6'),
-    chess.Move.from_uci('h4e7'),
-    chess.Move.from_uci('h4h7'),
-    chess.Move.from_uci('h4d8'),
-    chess.Move.from_uci('h4h8'),
-    chess.Move.from_uci('a5a1'),
-    chess.Move.from_uci('a5e1'),
-    chess.Move.from_uci('a5a2'),
-    chess.Move.from_uci('a5d2'),
-    chess.Move.from_uci('a5a3'),
-    chess.Move.from_uci('a5b3'),
-    chess.Move.from_uci('a5c3'),
-    chess.Move.from_uci('a5a4'),
-    chess.Move.from_uci('a5b4'),
-    chess.Move.from_uci('a5c4'),
-    chess.Move.from_uci('a5b5'),
-    chess.Move.from_uci('a5c5'),
-    chess.Move.from_uci('a5d5'),
-    chess.Move.from_uci('a5e5'),
-    chess.Move.from_uci('a5f5'),
-    chess.Move.from_uci('a5g5'),
-    chess.Move.from_uci('a5h5'),
-    chess.Move.from_uci('a5a6'),
-    chess.Move.from_uci('a5b6'),
-    chess.Move.from_uci('a5c6'),
-    chess.Move.from_uci('a5a7'),
-    chess.Move.from_uci('a5b7'),
-    chess.Move.from_uci('a5c7'),
-    chess.Move.from_uci('a5a8'),
-    chess.Move.from_uci('a5d8'),
-    chess.Move.from_uci('b5b1'),
-    chess.Move.from_uci('b5f1'),
-    chess.Move.from_uci('b5b2'),
-    chess.Move.from_uci('b5e2'),
-    chess.Move.from_uci('b5a3'),
-    chess.Move.from_uci('b5b3'),
-    chess.Move.from_uci('b5c3'),
-    chess.Move.from_uci('b5d3'),
-    chess.Move.from_uci('b5a4'),
-    chess.Move.from_uci('b5b4'),
-    chess.Move.from_uci('b5c4'),
-    chess.Move.from_uci('b5d4'),
-    chess.Move.from_uci('b5a5'),
-    chess.Move.from_uci('b5c5'),
-    chess.Move.from_uci('b5d5'),
-    chess.Move.from_uci('b5e5'),
-    chess.Move.from_uci('b5f5'),
-    chess.Move.from_uci('b5g5'),
-    chess.Move.from_uci('b5h5'),
-    chess.Move.from_uci('b5a6'),
-    chess.Move.from_uci('b5b6'),
-    chess.Move.from_uci('b5c6'),
-    chess.Move.from_uci('b5d6'),
-    chess.Move.from_uci('b5a7'),
-    chess.Move.from_uci('b5b7'),
-    chess.Move.from_uci('b5c7'),
-    chess.Move.from_uci('b5d7'),
-    chess.Move.from_uci('b5b8'),
-    chess.Move.from_uci('b5e8'),
-    chess.Move.from_uci('c5c1'),
-    chess.Move.from_uci('c5g1'),
-    chess.Move.from_uci('c5c2'),
-    chess.Move.from_uci('c5f2'),
-    chess.Move.from_uci('c5a3'),
-    chess.Move.from_uci('c5b3'),
-    chess.Move.from_uci('c5c3'),
-    chess.Move.from_uci('c5d3'),
-    chess.Move.from_uci('c5e3'),
-    chess.Move.from_uci('c5a4'),
-    chess.Move.from_uci('c5b4'),
-    chess.Move.from_uci('c5c4'),
-    chess.Move.from_uci('c5d4'),
-    chess.Move.from_uci('c5e4'),
-    chess.Move.from_uci('c5a5'),
-    chess.Move.from_uci('c5b5'),
-    chess.Move.from_uci('c5d5'),
-    chess.Move.from_uci('c5e5'),
-    chess.Move.from_uci('c5f5'),
-    chess.Move.from_uci('c5g5'),
-    chess.Move.from_uci('c5h5'),
-    chess.Move.from_uci('c5a6'),
-    chess.Move.from_uci('c5b6'),
-    chess.Move.from_uci('c5c6'),
-    chess.Move.from_uci('c5d6'),
-    chess.Move.from_uci('c5e6'),
-    chess.Move.from_uci('c5a7'),
-    chess.Move.from_uci('c5b7'),
-    chess.Move.from_uci('c5c7'),
-    chess.Move.from_uci('c5d7'),
-    chess.Move.from_uci('c5e7'),
-    chess.Move.from_uci('c5c8'),
-    chess.Move.from_uci('c5f8'),
-    chess.Move.from_uci('d5d1'),
-    chess.Move.from_uci('d5h1'),
-    chess.Move.from_uci('d5a2'),
-    chess.Move.from_uci('d5d2'),
-    chess.Move.from_uci('d5g2'),
-    chess.Move.from_uci('d5b3'),
-    chess.Move.from_uci('d5c3'),
-    chess.Move.from_uci('d5d3'),
-    chess.Move.from_uci('d5e3'),
-    chess.Move.from_uci('d5f3'),
-    chess.Move.from_uci('d5b4'),
-    chess.Move.from_uci('d5c4'),
-    chess.Move.from_uci('d5d4'),
-    chess.Move.from_uci('d5e4'),
-    chess.Move.from_uci('d5f4'),
-    chess.Move.from_uci('d5a5'),
-    chess.Move.from_uci('d5b5'),
-    chess.Move.from_uci('d5c5'),
-    chess.Move.from_uci('d5e5'),
-    chess.Move.from_uci('d5f5'),
-    chess.Move.from_uci('d5g5'),
-    chess.Move.from_uci('d5h5'),
-    chess.Move.from_uci('d5b6'),
-    chess.Move.from_uci('d5c6'),
-    chess.Move.from_uci('d5d6'),
-    chess.Move.from_uci('d5e6'),
-    chess.Move.from_uci('d5f6'),
-    chess.Move.from_uci('d5b7'),
-    chess.Move.from_uci('d5c7'),
-    chess.Move.from_uci('d5d7'),
-    chess.Move.from_uci('d5e7'),
-    chess.Move.from_uci('d5f7'),
-    chess.Move.from_uci('d5a8'),
-    chess.Move.from_uci('d5d8'),
-    chess.Move.from_uci('d5g8'),
-    chess.Move.from_uci('e5a1'),
-    chess.Move.from_uci('e5e1'),
-    chess.Move.from_uci('e5b2'),
-    chess.Move.from_uci('e5e2'),
-    chess.Move.from_uci('e5h2'),
-    chess.Move.from_uci('e5c3'),
-    chess.Move.from_uci('e5d3'),
-    chess.Move.from_uci('e5e3'),
-    chess.Move.from_uci('e5f3'),
-    chess.Move.from_uci('e5g3'),
-    chess.Move.from_uci('e5c4'),
-    chess.Move.from_uci('e5d4'),
-    chess.Move.from_uci('e5e4'),
-    chess.Move.from_uci('e5f4'),
-    chess.Move.from_uci('e5g4'),
-    chess.Move.from_uci('e5a5'),
-    chess.Move.from_uci('e5b5'),
-    chess.Move.from_uci('e5c5'),
-    chess.Move.from_uci('e5d5'),
-    chess.Move.from_uci('e5f5'),
-    chess.Move.from_uci('e5g5'),
-    chess.Move.from_uci('e5h5'),
-    chess.Move.from_uci('e5c6'),
-    chess.Move.from_uci('e5d6'),
-    chess.Move.from_uci('e5e6'),
-    chess.Move.from_uci('e5f6'),
-    chess.Move.from_uci('e5g6'),
-    chess.Move.from_uci('e5c7'),
-    chess.Move.from_uci('e5d7'),
-    chess.Move.from_uci('e5e7'),
-    chess.Move.from_uci('e5f7'),
-    chess.Move.from_uci('e5g7'),
-    chess.Move.from_uci('e5b8'),
-    chess.Move.from_uci('e5e8'),
-    chess.Move.from_uci('e5h8'),
-    chess.Move.from_uci('f5b1'),
-    chess.Move.from_uci('f5f1'),
-    chess.Move.from_uci('f5c2'),
-    chess.Move.from_uci('f5f2'),
-    chess.Move.from_uci('f5d3'),
-    chess.Move.from_uci('f5e3'),
-    chess.Move.from_uci('f5f3'),
-    chess.Move.from_uci('f5g3'),
-    chess.Move.from_uci('f5h3'),
-    chess.Move.from_uci('f5d4'),
-    chess.Move.from_uci('f5e4'),
-    chess.Move.from_uci('f5f4'),
-    chess.Move.from_uci('f5g4'),
-    chess.Move.from_uci('f5h4'),
-    chess.Move.from_uci('f5a5'),
-    chess.Move.from_uci('f5b5'),
-    chess.Move.from_uci('f5c5'),
-    chess.Move.from_uci('f5d5'),
-    chess.Move.from_uci('f5e5'),
-    chess.Move.from_uci('f5g5'),
-    chess.Move.from_uci('f5h5'),
-    chess.Move.from_uci('f5d6'),
-    chess.Move.from_uci('f5e6'),
-    chess.Move.from_uci('f5f6'),
-    chess.Move.from_uci('f5g6'),
-    chess.Move.from_uci('f5h6'),
-    chess.Move.from_uci('f5d7'),
-    chess.Move.from_uci('f5e7'),
-    chess.Move.from_uci('f5f7'),
-    chess.Move.from_uci('f5g7'),
-    chess.Move.from_uci('f5h7'),
-    chess.Move.from_uci('f5c8'),
-    chess.Move.from_uci('f5f8'),
-    chess.Move.from_uci('g5c1'),
-    chess.Move.from_uci('g5g1'),
-    chess.Move.from_uci('g5d2'),
-    chess.Move.from_uci('g5g2'),
-    chess.Move.from_uci('g5e3'),
-    chess.Move.from_uci('g5f3'),
-    chess.Move.from_uci('g5g3'),
-    chess.Move.from_uci('g5h3'),
-    chess.Move.from_uci('g5e4'),
-    chess.Move.from_uci('g5f4'),
-    chess.Move.from_uci('g5g4'),
-    chess.Move.from_uci('g5h4'),
-    chess.Move.from_uci('g5a5'),
-    chess.Move.from_uci('g5b5'),
-    chess.Move.from_uci('g5c5'),
-    chess.Move.from_uci('g5d5'),
-    chess.Move.from_uci('g5e5'),
-    chess.Move.from_uci('g5f5'),
-    chess.Move.from_uci('g5h5'),
-    chess.Move.from_uci('g5e6'),
-    chess.Move.from_uci('g5f6'),
-    chess.Move.from_uci('g5g6'),
-    chess.Move.from_uci('g5h6'),
-    chess.Move.from_uci('g5e7'),
-    chess.Move.from_uci('g5f7'),
-    chess.Move.from_uci('g5g7'),
-    chess.Move.from_uci('g5h7'),
-    chess.Move.from_uci('g5d8'),
-    chess.Move.from_uci('g5g8'),
-    chess.Move.from_uci('h5d1'),
-    chess.Move.from_uci('h5h1'),
-    chess.Move.from_uci('h5e2'),
-    chess.Move.from_uci('h5h2'),
-    chess.Move.from_uci('h5f3'),
-    chess.Move.from_uci('h5g3'),
-    chess.Move.from_uci('h5h3'),
-    chess.Move.from_uci('h5f4'),
-    chess.Move.from_uci('h5g4'),
-    chess.Move.from_uci('h5h4'),
-    chess.Move.from_uci('h5a5'),
-    chess.Move.from_uci('h5b5'),
-    chess.Move.from_uci('h5c5'),
-    chess.Move.from_uci('h5d5'),
-    chess.Move.from_uci('h5e5'),
-    chess.Move.from_uci('h5f5'),
-    chess.Move.from_uci('h5g5'),
-    chess.Move.from_uci('h5f6'),
-    chess.Move.from_uci('h5g6'),
-    chess.Move.from_uci('h5h6'),
-    chess.Move.from_uci('h5f7'),
-    chess.Move.from_uci('h5g7'),
-    chess.Move.from_uci('h5h7'),
-    chess.Move.from_uci('h5e8'),
-    chess.Move.from_uci('h5h8'),
-    chess.Move.from_uci('a6a1'),
-    chess.Move.from_uci('a6f1'),
-    chess.Move.from_uci('a6a2'),
-    chess.Move.from_uci('a6e2'),
-    chess.Move.from_uci('a6a3'),
-    chess.Move.from_uci('a6d3'),
-    chess.Move.from_uci('a6a4'),
-    chess.Move.from_uci('a6b4'),
-    chess.Move.from_uci('a6c4'),
-    chess.Move.from_uci('a6a5'),
-    chess.Move.from_uci('a6b5'),
-    chess.Move.from_uci('a6c5'),
-    chess.Move.from_uci('a6b6'),
-    chess.Move.from_uci('a6c6'),
-    chess.Move.from_uci('a6d6'),
-    chess.Move.from_uci('a6e6'),
-    chess.Move.from_uci('a6f6'),
-    chess.Move.from_uci('a6g6'),
-    chess.Move.from_uci('a6h6'),
-    chess.Move.from_uci('a6a7'),
-    chess.Move.from_uci('a6b7'),
-    chess.Move.from_uci('a6c7'),
-    chess.Move.from_uci('a6a8'),
-    chess.Move.from_uci('a6b8'),
-    chess.Move.from_uci('a6c8'),
-    chess.Move.from_uci('b6b1'),
-    chess.Move.from_uci('b6g1'),
-    chess.Move.from_uci('b6b2'),
-    chess.Move.from_uci('b6f2'),
-    chess.Move.from_uci('b6b3'),
-    chess.Move.from_uci('b6e3'),
-    chess.Move.from_uci('b6a4'),
-    chess.Move.from_uci('b6b4'),
-    chess.Move.from_uci('b6c4'),
-    chess.Move.from_uci('b6d4'),
-    chess.Move.from_uci('b6a5'),
-    chess.Move.from_uci('b6b5'),
-    chess.Move.from_uci('b6c5'),
-    chess.Move.from_uci('b6d5'),
-    chess.Move.from_uci('b6a6'),
-    chess.Move.from_uci('b6c6'),
-    chess.Move.from_uci('b6d6'),
-    chess.Move.from_uci('b6e6'),
-    chess.Move.from_uci('b6f6'),
-    chess.Move.from_uci('b6g6'),
-    chess.Move.from_uci('b6h6'),
-    chess.Move.from_uci('b6a7'),
-    chess.Move.from_uci('b6b7'),
-    chess.Move.from_uci('b6c7'),
-    chess.Move.from_uci('b6d7'),
-    chess.Move.from_uci('b6a8'),
-    chess.Move.from_uci('b6b8'),
-    chess.Move.from_uci('b6c8'),
-    chess.Move.from_uci('b6d8'),
-    chess.Move.from_uci('c6c1'),
-    chess.Move.from_uci('c6h1'),
-    chess.Move.from_uci('c6c2'),
-    chess.Move.from_uci('c6g2'),
-    chess.Move.from_uci('c6c3'),
-    chess.Move.from_uci('c6f3'),
-    chess.Move.from_uci('c6a4'),
-    chess.Move.from_uci('c6b4'),
-    chess.Move.from_uci('c6c4'),
-    chess.Move.from_uci('c6d4'),
-    chess.Move.from_uci('c6e4'),
-    chess.Move.from_uci('c6a5'),
-    chess.Move.from_uci('c6b5'),
-    chess.Move.from_uci('c6c5'),
-    chess.Move.from_uci('c6d5'),
-    chess.Move.from_uci('c6e5'),
-    chess.Move.from_uci('c6a6'),
-    chess.Move.from_uci('c6b6'),
-    chess.Move.from_uci('c6d6'),
-    chess.Move.from_uci('c6e6'),
-    chess.Move.from_uci('c6f6'),
-    chess.Move.from_uci('c6g6'),
-    chess.Move.from_uci('c6h6'),
-    chess.Move.from_uci('c6a7'),
-    chess.Move.from_uci('c6b7'),
-    chess.Move.from_uci('c6c7'),
-    chess.Move.from_uci('c6d7'),
-    chess.Move.from_uci('c6e7'),
-    chess.Move.from_uci('c6a8'),
-    chess.Move.from_uci('c6b8'),
-    chess.Move.from_uci('c6c8'),
-    chess.Move.from_uci('c6d8'),
-    chess.Move.from_uci('c6e8'),
-    chess.Move.from_uci('d6d1'),
-    chess.Move.from_uci('d6d2'),
-    chess.Move.from_uci('d6h2'),
-    chess.Move.from_uci('d6a3'),
-    chess.Move.from_uci('d6d3'),
-    chess.Move.from_uci('d6g3'),
-    chess.Move.from_uci('d6b4'),
-    chess.Move.from_uci('d6c4'),
-    chess.Move.from_uci('d6d4'),
-    chess.Move.from_uci('d6e4'),
-    chess.Move.from_uci('d6f4'),
-    chess.Move.from_uci('d6b5'),
-    chess.Move.from_uci('d6c5'),
-    chess.Move.from_uci('d6d5'),
-    chess.Move.from_uci('d6e5'),
-    chess.Move.from_uci('d6f5'),
-    chess.Move.from_uci('d6a6'),
-    chess.Move.from_uci('d6b6'),
-    chess.Move.from_uci('d6c6'),
-    chess.Move.from_uci('d6e6'),
-    chess.Move.from_uci('d6f6'),
-    chess.Move.from_uci('d6g6'),
-    chess.Move.from_uci('d6h6'),
-    chess.Move.from_uci('d6b7'),
-    chess.Move.from_uci('d6c7'),
-    chess.Move.from_uci('d6d7'),
-    chess.Move.from_uci('d6e7'),
-    chess.Move.from_uci('d6f7'),
-    chess.Move.from_uci('d6b8'),
-    chess.Move.from_uci('d6c8'),
-    chess.Move.from_uci('d6d8'),
-    chess.Move.from_uci('d6e8'),
-    chess.Move.from_uci('d6f8'),
-    chess.Move.from_uci('e6e1'),
-    chess.Move.from_uci('e6a2'),
-    chess.Move.from_uci('e6e2'),
-    chess.Move.from_uci('e6b3'),
-    chess.Move.from_uci('e6e3'),
-    chess.Move.from_uci('e6h3'),
-    chess.Move.from_uci('e6c4'),
-    chess.Move.from_uci('e6d4'),
-    chess.Move.from_uci('e6e4'),
-    chess.Move.from_uci('e6f4'),
-    chess.Move.from_uci('e6g4'),
-    chess.Move.from_uci('e6c5'),
-    chess.Move.from_uci('e6d5'),
-    chess.Move.from_uci('e6e5'),
-    chess.Move.from_uci('e6f5'),
-    chess.Move.from_uci('e6g5'),
-    chess.Move.from_uci('e6a6'),
-    chess.Move.from_uci('e6b6'),
-    chess.Move.from_uci('e6c6'),
-    chess.Move.from_uci('e6d6'),
-    chess.Move.from_uci('e6f6'),
-    chess.Move.from_uci('e6g6'),
-    chess.Move.from_uci('e6h6'),
-    chess.Move.from_uci('e6c7'),
-    chess.Move.from_uci('e6d7'),
-    chess.Move.from_uci('e6e7'),
-    chess.Move.from_uci('e6f7'),
-    chess.Move.from_uci('e6g7'),
-    chess.Move.from_uci('e6c8'),
-    chess.Move.from_uci('e6d8'),
-    chess.Move.from_uci('e6e8'),
-    chess.Move.from_uci('e6f8'),
-    chess.Move.from_uci('e6g8'),
-    chess.Move.from_uci('f6a1'),
-    chess.Move.from_uci('f6f1'),
-    chess.Move.from_uci('f6b2'),
-    chess.Move.from_uci('f6f2'),
-    chess.Move.from_uci('f6c3'),
-    chess.Move.from_uci('f6f3'),
-    chess.Move.from_uci('f6d4'),
-    chess.Move.from_uci('f6e4'),
-    chess.Move.from_uci('f6f4'),
-    chess.Move.from_uci('f6g4'),
-    chess.Move.from_uci('f6h4'),
-    chess.Move.from_uci('f6d5'),
-    chess.Move.from_uci('f6e5'),
-    chess.Move.from_uci('f6f5'),
-    chess.Move.from_uci('f6g5'),
-    chess.Move.from_uci('f6h5'),
-    chess.Move.from_uci('f6a6'),
-    chess.Move.from_uci('f6b6'),
-    chess.Move.from_uci('f6c6'),
-    chess.Move.from_uci('f6d6'),
-    chess.Move.from_uci('f6e6'),
-    chess.Move.from_uci('f6g6'),
-    chess.Move.from_uci('f6h6'),
-    chess.Move.from_uci('f6d7'),
-    chess.Move.from_uci('f6e7'),
-    chess.Move.from_uci('f6f7'),
-    chess.Move.from_uci('f6g7'),
-    chess.Move.from_uci('f6h7'),
-    chess.Move.from_uci('f6d8'),
-    chess.Move.from_uci('f6e8'),
-    chess.Move.from_uci('f6f8'),
-    chess.Move.from_uci('f6g8'),
-    chess.Move.from_uci('f6h8'),
-    chess.Move.from_uci('g6b1'),
-    chess.Move.from_uci('g6g1'),
-    chess.Move.from_uci('g6c2'),
-    chess.Move.from_uci('g6g2'),
-    chess.Move.from_uci('g6d3'),
-    chess.Move.from_uci('g6g3'),
-    chess.Move.from_uci('g6e4'),
-    chess.Move.from_uci('g6f4'),
-    chess.Move.from_uci('g6g4'),
-    chess.Move.from_uci('g6h4'),
-    chess.Move.from_uci('g6e5'),
-    chess.Move.from_uci('g6f5'),
-    chess.Move.from_uci('g6g5'),
-    chess.Move.from_uci('g6h5'),
-    chess.Move.from_uci('g6a6'),
-    chess.Move.from_uci('g6b6'),
-    chess.Move.from_uci('g6c6'),
-    chess.Move.from_uci('g6d6'),
-    chess.Move.from_uci('g6e6'),
-    chess.Move.from_uci('g6f6'),
-    chess.Move.from_uci('g6h6'),
-    chess.Move.from_uci('g6e7'),
-    chess.Move.from_uci('g6f7'),
-    chess.Move.from_uci('g6g7'),
-    chess.Move.from_uci('g6h7'),
-    chess.Move.from_uci('g6e8'),
-    chess.Move.from_uci('g6f8'),
-    chess.Move.from_uci('g6g8'),
-    chess.Move.from_uci('g6h8'),
-    chess.Move.from_uci('h6c1'),
-    chess.Move.from_uci('h6h1'),
-    chess.Move.from_uci('h6d2'),
-    chess.Move.from_uci('h6h2'),
-    chess.Move.from_uci('h6e3'),
-    chess.Move.from_uci('h6h3'),
-    chess.Move.from_uci('h6f4'),
-    chess.Move.from_uci('h6g4'),
-    chess.Move.from_uci('h6h4'),
-    chess.Move.from_uci('h6f5'),
-    chess.Move.from_uci('h6g5'),
-    chess.Move.from_uci('h6h5'),
-    chess.Move.from_uci('h6a6'),
-    chess.Move.from_uci('h6b6'),
-    chess.Move.from_uci('h6c6'),
-    chess.Move.from_uci('h6d6'),
-    chess.Move.from_uci('h6e6'),
-    chess.Move.from_uci('h6f6'),
-    chess.Move.from_uci('h6g6'),
-    chess.Move.from_uci('h6f7'),
-    chess.Move.from_uci('h6g7'),
-    chess.Move.from_uci('h6h7'),
-    chess.Move.from_uci('h6f8'),
-    chess.Move.from_uci('h6g8'),
-    chess.Move.from_uci('h6h8'),
-    chess.Move.from_uci('a7a1'),
-    chess.Move.from_uci('a7g1'),
-    chess.Move.from_uci('a7a2'),
-    chess.Move.from_uci('a7f2'),
-    chess.Move.from_uci('a7a3'),
-    chess.Move.from_uci('a7e3'),
-    chess.Move.from_uci('a7a4'),
-    chess.Move.from_uci('a7d4'),
-    chess.Move.from_uci('a7a5'),
-    chess.Move.from_uci('a7b5'),
-    chess.Move.from_uci('a7c5'),
-    chess.Move.from_uci('a7a6'),
-    chess.Move.from_uci('a7b6'),
-    chess.Move.from_uci('a7c6'),
-    chess.Move.from_uci('a7b7'),
-    chess.Move.from_uci('a7c7'),
-    chess.Move.from_uci('a7d7'),
-    chess.Move.from_uci('a7e7'),
-    chess.Move.from_uci('a7f7'),
-    chess.Move.from_uci('a7g7'),
-    chess.Move.from_uci('a7h7'),
-    chess.Move.from_uci('a7a8'),
-    chess.Move.from_uci('a7a8n'),
-    chess.Move.from_uci('a7a8b'),
-    chess.Move.from_uci('a7a8r'),
-    chess.Move.from_uci('a7b8'),
-    chess.Move.from_uci('a7b8n'),
-    chess.Move.from_uci('a7b8b'),
-    chess.Move.from_uci('a7b8r'),
-    chess.Move.from_uci('a7c8'),
-    chess.Move.from_uci('b7b1'),
-    chess.Move.from_uci('b7h1'),
-    chess.Move.from_uci('b7b2'),
-    chess.Move.from_uci('b7g2'),
-    chess.Move.from_uci('b7b3'),
-    chess.Move.from_uci('b7f3'),
-    chess.Move.from_uci('b7b4'),
-    chess.Move.from_uci('b7e4'),
-    chess.Move.from_uci('b7a5'),
-    chess.Move.from_uci('b7b5'),
-    chess.Move.from_uci('b7c5'),
-    chess.Move.from_uci('b7d5'),
-    chess.Move.from_uci('b7a6'),
-    chess.Move.from_uci('b7b6'),
-    chess.Move.from_uci('b7c6'),
-    chess.Move.from_uci('b7d6'),
-    chess.Move.from_uci('b7a7'),
-    chess.Move.from_uci('b7c7'),
-    chess.Move.from_uci('b7d7'),
-    chess.Move.from_uci('b7e7'),
-    chess.Move.from_uci('b7f7'),
-    chess.Move.from_uci('b7g7'),
-    chess.Move.from_uci('b7h7'),
-    chess.Move.from_uci('b7a8'),
-    chess.Move.from_uci('b7a8n'),
-    chess.Move.from_uci('b7a8b'),
-    chess.Move.from_uci('b7a8r'),
-    chess.Move.from_uci('b7b8'),
-    chess.Move.from_uci('b7b8n'),
-    chess.Move.from_uci('b7b8b'),
-    chess.Move.from_uci('b7b8r'),
-    chess.Move.from_uci('b7c8'),
-    chess.Move.from_uci('b7c8n'),
-    chess.Move.from_uci('b7c8b'),
-    chess.Move.from_uci('b7c8r'),
-    chess.Move.from_uci('b7d8'),
-    chess.Move.from_uci('c7c1'),
-    chess.Move.from_uci('c7c2'),
-    chess.Move.from_uci('c7h2'),
-    chess.Move.from_uci('c7c3'),
-    chess.Move.from_uci('c7g3'),
-    chess.Move.from_uci('c7c4'),
-    chess.Move.from_uci('c7f4'),
-    chess.Move.from_uci('c7a5'),
-    chess.Move.from_uci('c7b5'),
-    chess.Move.from_uci('c7c5'),
-    chess.Move.from_uci('c7d5'),
-    chess.Move.from_uci('c7e5'),
-    chess.Move.from_uci('c7a6'),
-    chess.Move.from_uci('c7b6'),
-    chess.Move.from_uci('c7c6'),
-    chess.Move.from_uci('c7d6'),
-    chess.Move.from_uci('c7e6'),
-    chess.Move.from_uci('c7a7'),
-    chess.Move.from_uci('c7b7'),
-    chess.Move.from_uci('c7d7'),
-    chess.Move.from_uci('c7e7'),
-    chess.Move.from_uci('c7f7'),
-    chess.Move.from_uci('c7g7'),
-    chess.Move.from_uci('c7h7'),
-    chess.Move.from_uci('c7a8'),
-    chess.Move.from_uci('c7b8'),
-    chess.Move.from_uci('c7b8n'),
-    chess.Move.from_uci('c7b8b'),
-    chess.Move.from_uci('c7b8r'),
-    chess.Move.from_uci('c7c8'),
-    chess.Move.from_uci('c7c8n'),
-    chess.Move.from_uci('c7c8b'),
-    chess.Move.from_uci('c7c8r'),
-    chess.Move.from_uci('c7d8'),
-    chess.Move.from_uci('c7d8n'),
-    chess.Move.from_uci('c7d8b'),
-    chess.Move.from_uci('c7d8r'),
-    chess.Move.from_uci('c7e8'),
-    chess.Move.from_uci('d7d1'),
-    chess.Move.from_uci('d7d2'),
-    chess.Move.from_uci('d7d3'),
-    chess.Move.from_uci('d7h3'),
-    chess.Move.from_uci('d7a4'),
-    chess.Move.from_uci('d7d4'),
-    chess.Move.from_uci('d7g4'),
-    chess.Move.from_uci('d7b5'),
-    chess.Move.from_uci('d7c5'),
-    chess.Move.from_uci('d7d5'),
-    chess.Move.from_uci('d7e5'),
-    chess.Move.from_uci('d7f5'),
-    chess.Move.from_uci('d7b6'),
-    chess.Move.from_uci('d7c6'),
-    chess.Move.from_uci('d7d6'),
-    chess.Move.from_uci('d7e6'),
-    chess.Move.from_uci('d7f6'),
-    chess.Move.from_uci('d7a7'),
-    chess.Move.from_uci('d7b7'),
-    chess.Move.from_uci('d7c7'),
-    chess.Move.from_uci('d7e7'),
-    chess.Move.from_uci('d7f7'),
-    chess.Move.from_uci('d7g7'),
-    chess.Move.from_uci('d7h7'),
-    chess.Move.from_uci('d7b8'),
-    chess.Move.from_uci('d7c8'),
-    chess.Move.from_uci('d7c8n'),
-    chess.Move.from_uci('d7c8b'),
-    chess.Move.from_uci('d7c8r'),
-    chess.Move.from_uci('d7d8'),
-    chess.Move.from_uci('d7d8n'),
-    chess.Move.from_uci('d7d8b'),
-    chess.Move.from_uci('d7d8r'),
-    chess.Move.from_uci('d7e8'),
-    chess.Move.from_uci('d7e8n'),
-    chess.Move.from_uci('d7e8b'),
-    chess.Move.from_uci('d7e8r'),
-    chess.Move.from_uci('d7f8'),
-    chess.Move.from_uci('e7e1'),
-    chess.Move.from_uci('e7e2'),
-    chess.Move.from_uci('e7a3'),
-    chess.Move.from_uci('e7e3'),
-    chess.Move.from_uci('e7b4'),
-    chess.Move.from_uci('e7e4'),
-    chess.Move.from_uci('e7h4'),
-    chess.Move.from_uci('e7c5'),
-    chess.Move.from_uci('e7d5'),
-    chess.Move.from_uci('e7e5'),
-    chess.Move.from_uci('e7f5'),
-    chess.Move.from_uci('e7g5'),
-    chess.Move.from_uci('e7c6'),
-    chess.Move.from_uci('e7d6'),
-    chess.Move.from_uci('e7e6'),
-    chess.Move.from_uci('e7f6'),
-    chess.Move.from_uci('e7g6'),
-    chess.Move.from_uci('e7a7'),
-    chess.Move.from_uci('e7b7'),
-    chess.Move.from_uci('e7c7'),
-    chess.Move.from_uci('e7d7'),
-    chess.Move.from_uci('e7f7'),
-    chess.Move.from_uci('e7g7'),
-    chess.Move.from_uci('e7h7'),
-    chess.Move.from_uci('e7c8'),
-    chess.Move.from_uci('e7d8'),
-    chess.Move.from_uci('e7d8n'),
-    chess.Move.from_uci('e7d8b'),
-    chess.Move.from_uci('e7d8r'),
-    chess.Move.from_uci('e7e8'),
-    chess.Move.from_uci('e7e8n'),
-    chess.Move.from_uci('e7e8b'),
-    chess.Move.from_uci('e7e8r'),
-    chess.Move.from_uci('e7f8'),
-    chess.Move.from_uci('e7f8n'),
-    chess.Move.from_uci('e7f8b'),
-    chess.Move.from_uci('e7f8r'),
-    chess.Move.from_uci('e7g8'),
-    chess.Move.from_uci('f7f1'),
-    chess.Move.from_uci('f7a2'),
-    chess.Move.from_uci('f7f2'),
-    chess.Move.from_uci('f7b3'),
-    chess.Move.from_uci('f7f3'),
-    chess.Move.from_uci('f7c4'),
-    chess.Move.from_uci('f7f4'),
-    chess.Move.from_uci('f7d5'),
-    chess.Move.from_uci('f7e5'),
-    chess.Move.from_uci('f7f5'),
-    chess.Move.from_uci('f7g5'),
-    chess.Move.from_uci('f7h5'),
-    chess.Move.from_uci('f7d6'),
-    chess.Move.from_uci('f7e6'),
-    chess.Move.from_uci('f7f6'),
-    chess.Move.from_uci('f7g6'),
-    chess.Move.from_uci('f7h6'),
-    chess.Move.from_uci('f7a7'),
-    chess.Move.from_uci('f7b7'),
-    chess.Move.from_uci('f7c7'),
-    chess.Move.from_uci('f7d7'),
-    chess.Move.from_uci('f7e7'),
-    chess.Move.from_uci('f7g7'),
-    chess.Move.from_uci('f7h7'),
-    chess.Move.from_uci('f7d8'),
-    chess.Move.from_uci('f7e8'),
-    chess.Move.from_uci('f7e8n'),
-    chess.Move.from_uci('f7e8b'),
-    chess.Move.from_uci('f7e8r'),
-    chess.Move.from_uci('f7f8'),
-    chess.Move.from_uci('f7f8n'),
-    chess.Move.from_uci('f7f8b'),
-    chess.Move.from_uci('f7f8r'),
-    chess.Move.from_uci('f7g8'),
-    chess.Move.from_uci('f7g8n'),
-    chess.Move.from_uci('f7g8b'),
-    chess.Move.from_uci('f7g8r'),
-    chess.Move.from_uci('f7h8'),
-    chess.Move.from_uci('g7a1'),
-    chess.Move.from_uci('g7g1'),
-    chess.Move.from_uci('g7b2'),
-    chess.Move.from_uci('g7g2'),
-    chess.Move.from_uci('g7c3'),
-    chess.Move.from_uci('g7g3'),
-    chess.Move.from_uci('g7d4'),
-    chess.Move.from_uci('g7g4'),
-    chess.Move.from_uci('g7e5'),
-    chess.Move.from_uci('g7f5'),
-    chess.Move.from_uci('g7g5'),
-    chess.Move.from_uci('g7h5'),
-    chess.Move.from_uci('g7e6'),
-    chess.Move.from_uci('g7f6'),
-    chess.Move.from_uci('g7g6'),
-    chess.Move.from_uci('g7h6'),
-    chess.Move.from_uci('g7a7'),
-    chess.Move.from_uci('g7b7'),
-    chess.Move.from_uci('g7c7'),
-    chess.Move.from_uci('g7d7'),
-    chess.Move.from_uci('g7e7'),
-    chess.Move.from_uci('g7f7'),
-    chess.Move.from_uci('g7h7'),
-    chess.Move.from_uci('g7e8'),
-    chess.Move.from_uci('g7f8'),
-    chess.Move.from_uci('g7f8n'),
-    chess.Move.from_uci('g7f8b'),
-    chess.Move.from_uci('g7f8r'),
-    chess.Move.from_uci('g7g8'),
-    chess.Move.from_uci('g7g8n'),
-    chess.Move.from_uci('g7g8b'),
-    chess.Move.from_uci('g7g8r'),
-    chess.Move.from_uci('g7h8'),
-    chess.Move.from_uci('g7h8n'),
-    chess.Move.from_uci('g7h8b'),
-    chess.Move.from_uci('g7h8r'),
-    chess.Move.from_uci('h7b1'),
-    chess.Move.from_uci('h7h1'),
-    chess.Move.from_uci('h7c2'),
-    chess.Move.from_uci('h7h2'),
-    chess.Move.from_uci('h7d3'),
-    chess.Move.from_uci('h7h3'),
-    chess.Move.from_uci('h7e4'),
-    chess.Move.from_uci('h7h4'),
-    chess.Move.from_uci('h7f5'),
-    chess.Move.from_uci('h7g5'),
-    chess.Move.from_uci('h7h5'),
-    chess.Move.from_uci('h7f6'),
-    chess.Move.from_uci('h7g6'),
-    chess.Move.from_uci('h7h6'),
-    chess.Move.from_uci('h7a7'),
-    chess.Move.from_uci('h7b7'),
-    chess.Move.from_uci('h7c7'),
-    chess.Move.from_uci('h7d7'),
-    chess.Move.from_uci('h7e7'),
-    chess.Move.from_uci('h7f7'),
-    chess.Move.from_uci('h7g7'),
-    chess.Move.from_uci('h7f8'),
-    chess.Move.from_uci('h7g8'),
-    chess.Move.from_uci('h7g8n'),
-    chess.Move.from_uci('h7g8b'),
-    chess.Move.from_uci('h7g8r'),
-    chess.Move.from_uci('h7h8'),
-    chess.Move.from_uci('h7h8n'),
-    chess.Move.from_uci('h7h8b'),
-    chess.Move.from_uci('h7h8r'),
-    chess.Move.from_uci('a8a1'),
-    chess.Move.from_uci('a8h1'),
-    chess.Move.from_uci('a8a2'),
-    chess.Move.from_uci('a8g2'),
-    chess.Move.from_uci('a8a3'),
-    chess.Move.from_uci('a8f3'),
-    chess.Move.from_uci('a8a4'),
-    chess.Move.from_uci('a8e4'),
-    chess.Move.from_uci('a8a5'),
-    chess.Move.from_uci('a8d5'),
-    chess.Move.from_uci('a8a6'),
-    chess.Move.from_uci('a8b6'),
-    chess.Move.from_uci('a8c6'),
-    chess.Move.from_uci('a8a7'),
-    chess.Move.from_uci('a8b7'),
-    chess.Move.from_uci('a8c7'),
-    chess.Move.from_uci('a8b8'),
-    chess.Move.from_uci('a8c8'),
-    chess.Move.from_uci('a8d8'),
-    chess.Move.from_uci('a8e8'),
-    chess.Move.from_uci('a8f8'),
-    chess.Move.from_uci('a8g8'),
-    chess.Move.from_uci('a8h8'),
-    chess.Move.from_uci('b8b1'),
-    chess.Move.from_uci('b8b2'),
-    chess.Move.from_uci('b8h2'),
-    chess.Move.from_uci('b8b3'),
-    chess.Move.from_uci('b8g3'),
-    chess.Move.from_uci('b8b4'),
-    chess.Move.from_uci('b8f4'),
-    chess.Move.from_uci('b8b5'),
-    chess.Move.from_uci('b8e5'),
-    chess.Move.from_uci('b8a6'),
-    chess.Move.from_uci('b8b6'),
-    chess.Move.from_uci('b8c6'),
-    chess.Move.from_uci('b8d6'),
-    chess.Move.from_uci('b8a7'),
-    chess.Move.from_uci('b8b7'),
-    chess.Move.from_uci('b8c7'),
-    chess.Move.from_uci('b8d7'),
-    chess.Move.from_uci('b8a8'),
-    chess.Move.from_uci('b8c8'),
-    chess.Move.from_uci('b8d8'),
-    chess.Move.from_uci('b8e8'),
-    chess.Move.from_uci('b8f8'),
-    chess.Move.from_uci('b8g8'),
-    chess.Move.from_uci('b8h8'),
-    chess.Move.from_uci('c8c1'),
-    chess.Move.from_uci('c8c2'),
-    chess.Move.from_uci('c8c3'),
-    chess.Move.from_uci('c8h3'),
-    chess.Move.from_uci('c8c4'),
-    chess.Move.from_uci('c8g4'),
-    chess.Move.from_uci('c8c5'),
-    chess.Move.from_uci('c8f5'),
-    chess.Move.from_uci('c8a6'),
-    chess.Move.from_uci('c8b6'),
-    chess.Move.from_uci('c8c6'),
-    chess.Move.from_uci('c8d6'),
-    chess.Move.from_uci('c8e6'),
-    chess.Move.from_uci('c8a7'),
-    chess.Move.from_uci('c8b7'),
-    chess.Move.from_uci('c8c7'),
-    chess.Move.from_uci('c8d7'),
-    chess.Move.from_uci('c8e7'),
-    chess.Move.from_uci('c8a8'),
-    chess.Move.from_uci('c8b8'),
-    chess.Move.from_uci('c8d8'),
-    chess.Move.from_uci('c8e8'),
-    chess.Move.from_uci('c8f8'),
-    chess.Move.from_uci('c8g8'),
-    chess.Move.from_uci('c8h8'),
-    chess.Move.from_uci('d8d1'),
-    chess.Move.from_uci('d8d2'),
-    chess.Move.from_uci('d8d3'),
-    chess.Move.from_uci('d8d4'),
-    chess.Move.from_uci('d8h4'),
-    chess.Move.from_uci('d8a5'),
-    chess.Move.from_uci('d8d5'),
-    chess.Move.from_uci('d8g5'),
-    chess.Move.from_uci('d8b6'),
-    chess.Move.from_uci('d8c6'),
-    chess.Move.from_uci('d8d6'),
-    chess.Move.from_uci('d8e6'),
-    chess.Move.from_uci('d8f6'),
-    chess.Move.from_uci('d8b7'),
-    chess.Move.from_uci('d8c7'),
-    chess.Move.from_uci('d8d7'),
-    chess.Move.from_uci('d8e7'),
-    chess.Move.from_uci('d8f7'),
-    chess.Move.from_uci('d8a8'),
-    chess.Move.from_uci('d8b8'),
-    chess.Move.from_uci('d8c8'),
-    chess.Move.from_uci('d8e8'),
-    chess.Move.from_uci('d8f8'),
-    chess.Move.from_uci('d8g8'),
-    chess.Move.from_uci('d8h8'),
-    chess.Move.from_uci('e8e1'),
-    chess.Move.from_uci('e8e2'),
-    chess.Move.from_uci('e8e3'),
-    chess.Move.from_uci('e8a4'),
-    chess.Move.from_uci('e8e4'),
-    chess.Move.from_uci('e8b5'),
-    chess.Move.from_uci('e8e5'),
-    chess.Move.from_uci('e8h5'),
-    chess.Move.from_uci('e8c6'),
-    chess.Move.from_uci('e8d6'),
-    chess.Move.from_uci('e8e6'),
-    chess.Move.from_uci('e8f6'),
-    chess.Move.from_uci('e8g6'),
-    chess.Move.from_uci('e8c7'),
-    chess.Move.from_uci('e8d7'),
-    chess.Move.from_uci('e8e7'),
-    chess.Move.from_uci('e8f7'),
-    chess.Move.from_uci('e8g7'),
-    chess.Move.from_uci('e8a8'),
-    chess.Move.from_uci('e8b8'),
-    chess.Move.from_uci('e8c8'),
-    chess.Move.from_uci('e8d8'),
-    chess.Move.from_uci('e8f8'),
-    chess.Move.from_uci('e8g8'),
-    chess.Move.from_uci('e8h8'),
-    chess.Move.from_uci('f8f1'),
-    chess.Move.from_uci('f8f2'),
-    chess.Move.from_uci('f8a3'),
-    chess.Move.from_uci('f8f3'),
-    chess.Move.from_uci('f8b4'),
-    chess.Move.from_uci('f8f4'),
-    chess.Move.from_uci('f8c5'),
-    chess.Move.from_uci('f8f5'),
-    chess.Move.from_uci('f8d6'),
-    chess.Move.from_uci('f8e6'),
-    chess.Move.from_uci('f8f6'),
-    chess.Move.from_uci('f8g6'),
-    chess.Move.from_uci('f8h6'),
-    chess.Move.from_uci('f8d7'),
-    chess.Move.from_uci('f8e7'),
-    chess.Move.from_uci('f8f7'),
-    chess.Move.from_uci('f8g7'),
-    chess.Move.from_uci('f8h7'),
-    chess.Move.from_uci('f8a8'),
-    chess.Move.from_uci('f8b8'),
-    chess.Move.from_uci('f8c8'),
-    chess.Move.from_uci('f8d8'),
-    chess.Move.from_uci('f8e8'),
-    chess.Move.from_uci('f8g8'),
-    chess.Move.from_uci('f8h8'),
-    chess.Move.from_uci('g8g1'),
-    chess.Move.from_uci('g8a2'),
-    chess.Move.from_uci('g8g2'),
-    chess.Move.from_uci('g8b3'),
-    chess.Move.from_uci('g8g3'),
-    chess.Move.from_uci('g8c4'),
-    chess.Move.from_uci('g8g4'),
-    chess.Move.from_uci('g8d5'),
-    chess.Move.from_uci('g8g5'),
-    chess.Move.from_uci('g8e6'),
-    chess.Move.from_uci('g8f6'),
-    chess.Move.from_uci('g8g6'),
-    chess.Move.from_uci('g8h6'),
-    chess.Move.from_uci('g8e7'),
-    chess.Move.from_uci('g8f7'),
-    chess.Move.from_uci('g8g7'),
-    chess.Move.from_uci('g8h7'),
-    chess.Move.from_uci('g8a8'),
-    chess.Move.from_uci('g8b8'),
-    chess.Move.from_uci('g8c8'),
-    chess.Move.from_uci('g8d8'),
-    chess.Move.from_uci('g8e8'),
-    chess.Move.from_uci('g8f8'),
-    chess.Move.from_uci('g8h8'),
-    chess.Move.from_uci('h8a1'),
-    chess.Move.from_uci('h8h1'),
-    chess.Move.from_uci('h8b2'),
-    chess.Move.from_uci('h8h2'),
-    chess.Move.from_uci('h8c3'),
-    chess.Move.from_uci('h8h3'),
-    chess.Move.from_uci('h8d4'),
-    chess.Move.from_uci('h8h4'),
-    chess.Move.from_uci('h8e5'),
-    chess.Move.from_uci('h8h5'),
-    chess.Move.from_uci('h8f6'),
-    chess.Move.from_uci('h8g6'),
-    chess.Move.from_uci('h8h6'),
-    chess.Move.from_uci('h8f7'),
-    chess.Move.from_uci('h8g7'),
-    chess.Move.from_uci('h8h7'),
-    chess.Move.from_uci('h8a8'),
-    chess.Move.from_uci('h8b8'),
-    chess.Move.from_uci('h8c8'),
-    chess.Move.from_uci('h8d8'),
-    chess.Move.from_uci('h8e8'),
-    chess.Move.from_uci('h8f8'),
-    chess.Move.from_uci('h8g8'),
+# Move keys `from_square | to_square << 6 | promotion << 12`, see `chess_action_space.get_move_key`
+# fmt: off
+_ACTION_KEYS = (
+    64, 128, 192, 256, 320, 384, 448, 512, 576, 640, 1024, 1088, 1152, 1536, 1728, 2048, 2304, 2560, 2880, 3072, 3456, 3584, 4032,  # a1
+    1, 129, 193, 257, 321, 385, 449, 513, 577, 641, 705, 1025, 1089, 1153, 1217, 1601, 1793, 2113, 2369, 2625, 2945, 3137, 3521, 3649,  # b1
+    2, 66, 194, 258, 322, 386, 450, 514, 578, 642, 706, 770, 1026, 1090, 1154, 1218, 1282, 1666, 1858, 2178, 2434, 2690, 3010, 3202, 3714,  # c1
+    3, 67, 131, 259, 323, 387, 451, 579, 643, 707, 771, 835, 1091, 1155, 1219, 1283, 1347, 1539, 1731, 1923, 2243, 2499, 2755, 3267, 3779,  # d1
+    4, 68, 132, 196, 324, 388, 452, 644, 708, 772, 836, 900, 1156, 1220, 1284, 1348, 1412, 1604, 1796, 1988, 2052, 2308, 2820, 3332, 3844,  # e1
+    5, 69, 133, 197, 261, 389, 453, 709, 773, 837, 901, 965, 1221, 1285, 1349, 1413, 1477, 1669, 1861, 2117, 2373, 2565, 2885, 3397, 3909,  # f1
+    6, 70, 134, 198, 262, 326, 454, 774, 838, 902, 966, 1286, 1350, 1414, 1478, 1734, 1926, 2182, 2438, 2630, 2950, 3078, 3462, 3974,  # g1
+    7, 71, 135, 199, 263, 327, 391, 839, 903, 967, 1351, 1415, 1479, 1799, 1991, 2247, 2503, 2695, 3015, 3143, 3527, 3591, 4039,  # h1
+    8, 8200, 12296, 16392, 72, 8264, 12360, 16456, 136, 584, 648, 712, 776, 840, 904, 968, 1032, 1096, 1160, 1544, 1608, 1672, 2056, 2248, 2568, 2824, 3080, 3400, 3592, 3976,  # a2
+    9, 8201, 12297, 16393, 73, 8265, 12361, 16457, 137, 8329, 12425, 16521, 201, 521, 649, 713, 777, 841, 905, 969, 1033, 1097, 1161, 1225, 1545, 1609, 1673, 1737, 2121, 2313, 2633, 2889, 3145, 3465, 3657, 4041,  # b2
+    10, 74, 8266, 12362, 16458, 138, 8330, 12426, 16522, 202, 8394, 12490, 16586, 266, 522, 586, 714, 778, 842, 906, 970, 1034, 1098, 1162, 1226, 1290, 1546, 1610, 1674, 1738, 1802, 2186, 2378, 2698, 2954, 3210, 3530, 3722,  # c2
+    75, 139, 8331, 12427, 16523, 203, 8395, 12491, 16587, 267, 8459, 12555, 16651, 331, 523, 587, 651, 779, 843, 907, 971, 1099, 1163, 1227, 1291, 1355, 1611, 1675, 1739, 1803, 1867, 2059, 2251, 2443, 2763, 3019, 3275, 3787,  # d2
+    140, 204, 8396, 12492, 16588, 268, 8460, 12556, 16652, 332, 8524, 12620, 16716, 396, 524, 588, 652, 716, 844, 908, 972, 1164, 1228, 1292, 1356, 1420, 1676, 1740, 1804, 1868, 1932, 2124, 2316, 2508, 2572, 2828, 3340, 3852,  # e2
+    205, 269, 8461, 12557, 16653, 333, 8525, 12621, 16717, 397, 8589, 12685, 16781, 461, 525, 589, 653, 717, 781, 909, 973, 1229, 1293, 1357, 1421, 1485, 1741, 1805, 1869, 1933, 1997, 2189, 2381, 2637, 2893, 3085, 3405, 3917,  # f2
+    270, 334, 8526, 12622, 16718, 398, 8590, 12686, 16782, 462, 8654, 12750, 16846, 526, 590, 654, 718, 782, 846, 974, 1294, 1358, 1422, 1486, 1806, 1870, 1934, 1998, 2254, 2446, 2702, 2958, 3150, 3470, 3598, 3982,  # g2
+    335, 399, 8591, 12687, 16783, 463, 8655, 12751, 16847, 527, 591, 655, 719, 783, 847, 911, 1359, 1423, 1487, 1871, 1935, 1999, 2319, 2511, 2767, 3023, 3215, 3535, 3663, 4047,  # h2
+    16, 80, 144, 528, 592, 656, 1104, 1168, 1232, 1296, 1360, 1424, 1488, 1552, 1616, 1680, 2064, 2128, 2192, 2576, 2768, 3088, 3344, 3600, 3920,  # a3
+    17, 81, 145, 209, 529, 593, 657, 721, 1041, 1169, 1233, 1297, 1361, 1425, 1489, 1553, 1617, 1681, 1745, 2065, 2129, 2193, 2257, 2641, 2833, 3153, 3409, 3665, 3985,  # b3
+    18, 82, 146, 210, 274, 530, 594, 658, 722, 786, 1042, 1106, 1234, 1298, 1362, 1426, 1490, 1554, 1618, 1682, 1746, 1810, 2066, 2130, 2194, 2258, 2322, 2706, 2898, 3218, 3474, 3730, 4050,  # c3
+    83, 147, 211, 275, 339, 595, 659, 723, 787, 851, 1043, 1107, 1171, 1299, 1363, 1427, 1491, 1619, 1683, 1747, 1811, 1875, 2131, 2195, 2259, 2323, 2387, 2579, 2771, 2963, 3283, 3539, 3795,  # d3
+    148, 212, 276, 340, 404, 660, 724, 788, 852, 916, 1044, 1108, 1172, 1236, 1364, 1428, 1492, 1684, 1748, 1812, 1876, 1940, 2196, 2260, 2324, 2388, 2452, 2644, 2836, 3028, 3092, 3348, 3860,  # e3
+    213, 277, 341, 405, 469, 725, 789, 853, 917, 981, 1045, 1109, 1173, 1237, 1301, 1429, 1493, 1749, 1813, 1877, 1941, 2005, 2261, 2325, 2389, 2453, 2517, 2709, 2901, 3157, 3413, 3605, 3925,  # f3
+    278, 342, 406, 470, 790, 854, 918, 982, 1046, 1110, 1174, 1238, 1302, 1366, 1494, 1814, 1878, 1942, 2006, 2326, 2390, 2454, 2518, 2774, 2966, 3222, 3478, 3670, 3990,  # g3
+    343, 407, 471, 855, 919, 983, 1047, 1111, 1175, 1239, 1303, 1367, 1431, 1879, 1943, 2007, 2391, 2455, 2519, 2839, 3031, 3287, 3543, 3735, 4055,  # h3
+    24, 216, 536, 600, 664, 1048, 1112, 1176, 1624, 1688, 1752, 1816, 1880, 1944, 2008, 2072, 2136, 2200, 2584, 2648, 2712, 3096, 3288, 3608, 3864,  # a4
+    89, 281, 537, 601, 665, 729, 1049, 1113, 1177, 1241, 1561, 1689, 1753, 1817, 1881, 1945, 2009, 2073, 2137, 2201, 2265, 2585, 2649, 2713, 2777, 3161, 3353, 3673, 3929,  # b4
+    154, 346, 538, 602, 666, 730, 794, 1050, 1114, 1178, 1242, 1306, 1562, 1626, 1754, 1818, 1882, 1946, 2010, 2074, 2138, 2202, 2266, 2330, 2586, 2650, 2714, 2778, 2842, 3226, 3418, 3738, 3994,  # c4
+    27, 219, 411, 603, 667, 731, 795, 859, 1115, 1179, 1243, 1307, 1371, 1563, 1627, 1691, 1819, 1883, 1947, 2011, 2139, 2203, 2267, 2331, 2395, 2651, 2715, 2779, 2843, 2907, 3099, 3291, 3483, 3803, 4059,  # d4
+    92, 284, 476, 668, 732, 796, 860, 924, 1180, 1244, 1308, 1372, 1436, 1564, 1628, 1692, 1756, 1884, 1948, 2012, 2204, 2268, 2332, 2396, 2460, 2716, 2780, 2844, 2908, 2972, 3164, 3356, 3548, 3612, 3868,  # e4
+    157, 349, 733, 797, 861, 925, 989, 1245, 1309, 1373, 1437, 1501, 1565, 1629, 1693, 1757, 1821, 1949, 2013, 2269, 2333, 2397, 2461, 2525, 2781, 2845, 2909, 2973, 3037, 3229, 3421, 3677, 3933,  # f4
+    222, 414, 798, 862, 926, 990, 1310, 1374, 1438, 1502, 1566, 1630, 1694, 1758, 1822, 1886, 2014, 2334, 2398, 2462, 2526, 2846, 2910, 2974, 3038, 3294, 3486, 3742, 3998,  # g4
+    287, 479, 863, 927, 991, 1375, 1439, 1503, 1567, 1631, 1695, 1759, 1823, 1887, 1951, 2399, 2463, 2527, 2911, 2975, 3039, 3359, 3551, 3807, 4063,  # h4
+    32, 288, 544, 736, 1056, 1120, 1184, 1568, 1632, 1696, 2144, 2208, 2272, 2336, 2400, 2464, 2528, 2592, 2656, 2720, 3104, 3168, 3232, 3616, 3808,  # a5
+    97, 353, 609, 801, 1057, 1121, 1185, 1249, 1569, 1633, 1697, 1761, 2081, 2209, 2273, 2337, 2401, 2465, 2529, 2593, 2657, 2721, 2785, 3105, 3169, 3233, 3297, 3681, 3873,  # b5
+    162, 418, 674, 866, 1058, 1122, 1186, 1250, 1314, 1570, 1634, 1698, 1762, 1826, 2082, 2146, 2274, 2338, 2402, 2466, 2530, 2594, 2658, 2722, 2786, 2850, 3106, 3170, 3234, 3298, 3362, 3746, 3938,  # c5
+    227, 483, 547, 739, 931, 1123, 1187, 1251, 1315, 1379, 1635, 1699, 1763, 1827, 1891, 2083, 2147, 2211, 2339, 2403, 2467, 2531, 2659, 2723, 2787, 2851, 2915, 3171, 3235, 3299, 3363, 3427, 3619, 3811, 4003,  # d5
+    36, 292, 612, 804, 996, 1188, 1252, 1316, 1380, 1444, 1700, 1764, 1828, 1892, 1956, 2084, 2148, 2212, 2276, 2404, 2468, 2532, 2724, 2788, 2852, 2916, 2980, 3236, 3300, 3364, 3428, 3492, 3684, 3876, 4068,  # e5
+    101, 357, 677, 869, 1253, 1317, 1381, 1445, 1509, 1765, 1829, 1893, 1957, 2021, 2085, 2149, 2213, 2277, 2341, 2469, 2533, 2789, 2853, 2917, 2981, 3045, 3301, 3365, 3429, 3493, 3557, 3749, 3941,  # f5
+    166, 422, 742, 934, 1318, 1382, 1446, 1510, 1830, 1894, 1958, 2022, 2086, 2150, 2214, 2278, 2342, 2406, 2534, 2854, 2918, 2982, 3046, 3366, 3430, 3494, 3558, 3814, 4006,  # g5
+    231, 487, 807, 999, 1383, 1447, 1511, 1895, 1959, 2023, 2087, 2151, 2215, 2279, 2343, 2407, 2471, 2919, 2983, 3047, 3431, 3495, 3559, 3879, 4071,  # h5
+    40, 360, 552, 808, 1064, 1256, 1576, 1640, 1704, 2088, 2152, 2216, 2664, 2728, 2792, 2856, 2920, 2984, 3048, 3112, 3176, 3240, 3624, 3688, 3752,  # a6
+    105, 425, 617, 873, 1129, 1321, 1577, 1641, 1705, 1769, 2089, 2153, 2217, 2281, 2601, 2729, 2793, 2857, 2921, 2985, 3049, 3113, 3177, 3241, 3305, 3625, 3689, 3753, 3817,  # b6
+    170, 490, 682, 938, 1194, 1386, 1578, 1642, 1706, 1770, 1834, 2090, 2154, 2218, 2282, 2346, 2602, 2666, 2794, 2858, 2922, 2986, 3050, 3114, 3178, 3242, 3306, 3370, 3626, 3690, 3754, 3818, 3882,  # c6
+    235, 747, 1003, 1067, 1259, 1451, 1643, 1707, 1771, 1835, 1899, 2155, 2219, 2283, 2347, 2411, 2603, 2667, 2731, 2859, 2923, 2987, 3051, 3179, 3243, 3307, 3371, 3435, 3691, 3755, 3819, 3883, 3947,  # d6
+    300, 556, 812, 1132, 1324, 1516, 1708, 1772, 1836, 1900, 1964, 2220, 2284, 2348, 2412, 2476, 2604, 2668, 2732, 2796, 2924, 2988, 3052, 3244, 3308, 3372, 3436, 3500, 3756, 3820, 3884, 3948, 4012,  # e6
+    45, 365, 621, 877, 1197, 1389, 1773, 1837, 1901, 1965, 2029, 2285, 2349, 2413, 2477, 2541, 2605, 2669, 2733, 2797, 2861, 2989, 3053, 3309, 3373, 3437, 3501, 3565, 3821, 3885, 3949, 4013, 4077,  # f6
+    110, 430, 686, 942, 1262, 1454, 1838, 1902, 1966, 2030, 2350, 2414, 2478, 2542, 2606, 2670, 2734, 2798, 2862, 2926, 3054, 3374, 3438, 3502, 3566, 3886, 3950, 4014, 4078,  # g6
+    175, 495, 751, 1007, 1327, 1519, 1903, 1967, 2031, 2415, 2479, 2543, 2607, 2671, 2735, 2799, 2863, 2927, 2991, 3439, 3503, 3567, 3951, 4015, 4079,  # h6
+    48, 432, 560, 880, 1072, 1328, 1584, 1776, 2096, 2160, 2224, 2608, 2672, 2736, 3184, 3248, 3312, 3376, 3440, 3504, 3568, 3632, 11824, 15920, 20016, 3696, 11888, 15984, 20080, 3760,  # a7
+    113, 497, 625, 945, 1137, 1393, 1649, 1841, 2097, 2161, 2225, 2289, 2609, 2673, 2737, 2801, 3121, 3249, 3313, 3377, 3441, 3505, 3569, 3633, 11825, 15921, 20017, 3697, 11889, 15985, 20081, 3761, 11953, 16049, 20145, 3825,  # b7
+    178, 690, 1010, 1202, 1458, 1714, 1906, 2098, 2162, 2226, 2290, 2354, 2610, 2674, 2738, 2802, 2866, 3122, 3186, 3314, 3378, 3442, 3506, 3570, 3634, 3698, 11890, 15986, 20082, 3762, 11954, 16050, 20146, 3826, 12018, 16114, 20210, 3890,  # c7
+    243, 755, 1267, 1523, 1587, 1779, 1971, 2163, 2227, 2291, 2355, 2419, 2675, 2739, 2803, 2867, 2931, 3123, 3187, 3251, 3379, 3443, 3507, 3571, 3699, 3763, 11955, 16051, 20147, 3827, 12019, 16115, 20211, 3891, 12083, 16179, 20275, 3955,  # d7
+    308, 820, 1076, 1332, 1652, 1844, 2036, 2228, 2292, 2356, 2420, 2484, 2740, 2804, 2868, 2932, 2996, 3124, 3188, 3252, 3316, 3444, 3508, 3572, 3764, 3828, 12020, 16116, 20212, 3892, 12084, 16180, 20276, 3956, 12148, 16244, 20340, 4020,  # e7
+    373, 565, 885, 1141, 1397, 1717, 1909, 2293, 2357, 2421, 2485, 2549, 2805, 2869, 2933, 2997, 3061, 3125, 3189, 3253, 3317, 3381, 3509, 3573, 3829, 3893, 12085, 16181, 20277, 3957, 12149, 16245, 20341, 4021, 12213, 16309, 20405, 4085,  # f7
+    54, 438, 630, 950, 1206, 1462, 1782, 1974, 2358, 2422, 2486, 2550, 2870, 2934, 2998, 3062, 3126, 3190, 3254, 3318, 3382, 3446, 3574, 3894, 3958, 12150, 16246, 20342, 4022, 12214, 16310, 20406, 4086, 12278, 16374, 20470,  # g7
+    119, 503, 695, 1015, 1271, 1527, 1847, 2039, 2423, 2487, 2551, 2935, 2999, 3063, 3127, 3191, 3255, 3319, 3383, 3447, 3511, 3959, 4023, 12215, 16311, 20407, 4087, 12279, 16375, 20471,  # h7
+    56, 504, 568, 952, 1080, 1400, 1592, 1848, 2104, 2296, 2616, 2680, 2744, 3128, 3192, 3256, 3704, 3768, 3832, 3896, 3960, 4024, 4088,  # a8
+    121, 633, 1017, 1145, 1465, 1657, 1913, 2169, 2361, 2617, 2681, 2745, 2809, 3129, 3193, 3257, 3321, 3641, 3769, 3833, 3897, 3961, 4025, 4089,  # b8
+    186, 698, 1210, 1530, 1722, 1978, 2234, 2426, 2618, 2682, 2746, 2810, 2874, 3130, 3194, 3258, 3322, 3386, 3642, 3706, 3834, 3898, 3962, 4026, 4090,  # c8
+    251, 763, 1275, 1787, 2043, 2107, 2299, 2491, 2683, 2747, 2811, 2875, 2939, 3195, 3259, 3323, 3387, 3451, 3643, 3707, 3771, 3899, 3963, 4027, 4091,  # d8
+    316, 828, 1340, 1596, 1852, 2172, 2364, 2556, 2748, 2812, 2876, 2940, 3004, 3260, 3324, 3388, 3452, 3516, 3644, 3708, 3772, 3836, 3964, 4028, 4092,  # e8
+    381, 893, 1085, 1405, 1661, 1917, 2237, 2429, 2813, 2877, 2941, 3005, 3069, 3325, 3389, 3453, 3517, 3581, 3645, 3709, 3773, 3837, 3901, 4029, 4093,  # f8
+    446, 574, 958, 1150, 1470, 1726, 1982, 2302, 2494, 2878, 2942, 3006, 3070, 3390, 3454, 3518, 3582, 3646, 3710, 3774, 3838, 3902, 3966, 4094,  # g8
+    63, 511, 639, 1023, 1215, 1535, 1791, 2047, 2367, 2559, 2943, 3007, 3071, 3455, 3519, 3583, 3647, 3711, 3775, 3839, 3903, 3967, 4031,  # h8
+)
+# fmt: on
+
+ACTION_SPACE = tuple(
+    chess.Move(key & 63, key >> 6 & 63, key >> 12 or None) for key in _ACTION_KEYS
 )
 """All 1924 moves in the minimal discrete action space in chess."""
+
+del _ACTION_KEYS
@@ -0,0 +1,316 @@
+"""
+Generate every precomputed artifact of the package from a single pass over `iter_action_space(fast=False)`.
+
+Run `python -m chess_action_space.generate` to refresh them. Each artifact's checksum is recorded in
+`data/manifest.json`, so stale files are caught by the tests.
+"""
+
+import io
+import json
+from collections.abc import Callable
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space import get_action_space_size, iter_action_space
+from chess_action_space.orderings import ORDERINGS
+from chess_action_space.tables import _PACKAGE_DIR, MANIFEST_PATH, get_checksum
+from chess_action_space.utils import (
+    MOVE_KEY_SPACE_SIZE,
+    can_be_pawn_promotion,
+    get_action_category,
+    get_move_key,
+)
+
+_Moves = tuple[chess.Move, ...]
+
+_ARTIFACT_BUILDERS: dict[str, Callable[[_Moves], bytes]] = {}
+"""Map from the path of each artifact (relative to the package) to the function building its content."""
+
+
+def _artifact(
+    path: str,
+) -> Callable[[Callable[[_Moves], bytes]], Callable[[_Moves], bytes]]:
+    def register(builder: Callable[[_Moves], bytes]) -> Callable[[_Moves], bytes]:
+        _ARTIFACT_BUILDERS[path] = builder
+        return builder
+
+    return register
+
+
+def _npy_bytes(table: npt.NDArray) -> bytes:
+    f = io.BytesIO()
+    np.save(f, table, allow_pickle=False)
+    return f.getvalue()
+
+
+def _get_action_keys(moves: _Moves) -> npt.NDArray[np.uint16]:
+    return np.array([get_move_key(move) for move in moves], dtype=np.uint16)
+
+
+def _get_queen_promotion_keys(moves: _Moves) -> npt.NDArray[np.uint16]:
+    return np.array(
+        [
+            get_move_key(chess.Move(move.from_square, move.to_square, chess.QUEEN))
+            for move in moves
+            if move.promotion is None
+            and can_be_pawn_promotion(move.from_square, move.to_square)
+        ],
+        dtype=np.uint16,
+    )
+
+
+@_artifact('explicit.py')
+def _build_explicit_py(moves: _Moves) -> bytes:
+    rows = []
+    for from_square in chess.SQUARES:
+        keys = [get_move_key(move) for move in moves if move.from_square == from_square]
+        row = ' '.join(f'{key},' for key in keys)
+        rows.append(f'    {row}  # {chess.square_name(from_square)}')
+    lines = [
+        '"""',
+        'This file is generated by `python -m chess_action_space.generate`, do not modify it directly!',
+        '"""',
+        '',
+        'import chess',
+        '',
+        f'ACTION_SPACE_SIZE = {len(moves)}',
+        '"""The number of moves in the minimal discrete action space in chess."""',
+        '',
+        '# Move keys `from_square | to_square << 6 | promotion << 12`, see `chess_action_space.get_move_key`',
+        '# fmt: off',
+        '_ACTION_KEYS = (',
+        *rows,
+        ')',
+        '# fmt: on',
+        '',
+        'ACTION_SPACE = tuple(',
+        '    chess.Move(key & 63, key >> 6 & 63, key >> 12 or None) for key in _ACTION_KEYS',
+        ')',
+        f'"""All {len(moves)} moves in the minimal discrete action space in chess."""',
+        '',
+        'del _ACTION_KEYS',
+        '',
+    ]
+    return '\n'.join(lines).encode()
+
+
+@_artifact('data/action_keys.npy')
+def _build_action_keys(moves: _Moves) -> bytes:
+    return _npy_bytes(_get_action_keys(moves))
+
+
+@_artifact('data/action_uci.npy')
+def _build_action_uci(moves: _Moves) -> bytes:
+    return _npy_bytes(np.array([move.uci() for move in moves], dtype='S5'))
+
+
+@_artifact('data/action_between.npy')
+def _build_action_between(moves: _Moves) -> bytes:
+    return _npy_bytes(
+        np.array(
+            [chess.between(move.from_square, move.to_square) for move in moves],
+            dtype=np.uint64,
+        )
+    )
+
+
+@_artifact('data/action_category.npy')
+def _build_action_category(moves: _Moves) -> bytes:
+    return _npy_bytes(
+        np.array(
+            [get_action_category(move.from_square, move.to_square) for move in moves],
+            dtype=np.uint8,
+        )
+    )
+
+
+# Directions as `(file delta, rank delta)`, see the `'direction'` ordering
+_QUEEN_DIRECTIONS = (
+    (0, 1),
+    (1, 1),
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+)
+_KNIGHT_DIRECTIONS = (
+    (1, 2),
+    (2, 1),
+    (2, -1),
+    (1, -2),
+    (-1, -2),
+    (-2, -1),
+    (-2, 1),
+    (-1, 2),
+)
+
+
+def _get_direction(move: chess.Move) -> tuple[int, int]:
+    """Return the index of the direction of `move` (queen directions first, then knight directions) and its distance."""
+    file_delta = chess.square_file(move.to_square) - chess.square_file(move.from_square)
+    rank_delta = chess.square_rank(move.to_square) - chess.square_rank(move.from_square)
+    if (file_delta, rank_delta) in _KNIGHT_DIRECTIONS:
+        return len(_QUEEN_DIRECTIONS) + _KNIGHT_DIRECTIONS.index(
+            (file_delta, rank_delta)
+        ), 1
+    distance = max(abs(file_delta), abs(rank_delta))
+    return _QUEEN_DIRECTIONS.index(
+        (file_delta // distance, rank_delta // distance)
+    ), distance
+
+
+def _get_ordering_key(ordering: str, index: int, move: chess.Move) -> tuple[int, ...]:
+    """The sort key of the move at `index` in `ACTION_SPACE` for `ordering`, see `Ordering`."""
+    underpromotion = move.promotion is not None
+    if ordering == 'from_square':
+        return (index,)
+    if ordering == 'to_square':
+        return move.to_square, index
+    if ordering == 'direction':
+        return (
+            underpromotion,
+            move.promotion or 0,
+            *_get_direction(move),
+            move.from_square,
+        )
+    if ordering == 'underpromotions_last':
+        return underpromotion, index
+    raise ValueError(f'Unknown ordering {ordering!r}')
+
+
+@_artifact('data/action_orderings.npy')
+def _build_action_orderings(moves: _Moves) -> bytes:
+    return _npy_bytes(
+        np.array(
+            [
+                sorted(
+                    range(len(moves)),
+                    key=lambda index: _get_ordering_key(ordering, index, moves[index]),
+                )
+                for ordering in ORDERINGS
+            ],
+            dtype=np.int16,
+        )
+    )
+
+
+@_artifact('data/to_square_actions.npy')
+def _build_to_square_actions(moves: _Moves) -> bytes:
+    return _npy_bytes(
+        np.array(
+            sorted(range(len(moves)), key=lambda index: moves[index].to_square),
+            dtype=np.int16,
+        )
+    )
+
+
+@_artifact('data/to_square_offsets.npy')
+def _build_to_square_offsets(moves: _Moves) -> bytes:
+    offsets = np.zeros(len(chess.SQUARES) + 1, dtype=np.int16)
+    counts = np.bincount([move.to_square for move in moves], minlength=len(offsets) - 1)
+    np.cumsum(counts, out=offsets[1:])
+    return _npy_bytes(offsets)
+
+
+def _get_piece_destinations(
+    piece_type: chess.PieceType, color: chess.Color, square: chess.Square
+) -> chess.Bitboard:
+    """
+    The squares a piece on `square` could ever move to, including pawn pushes and castling. Pawns never stand on the
+    first or last rank, so they have no destinations from there.
+    """
+    bb = chess.BB_SQUARES[square]
+    if piece_type == chess.PAWN:
+        if bb & chess.BB_BACKRANKS:
+            return chess.BB_EMPTY
+        if color == chess.WHITE:
+            pushes = bb << 8 | (bb & chess.BB_RANK_2) << 16
+        else:
+            pushes = bb >> 8 | (bb & chess.BB_RANK_7) >> 16
+        return pushes & chess.BB_ALL | chess.BB_PAWN_ATTACKS[color][square]
+
+    board = chess.BaseBoard.empty()
+    board.set_piece_at(square, chess.Piece(piece_type, color))
+    destinations = board.attacks_mask(square)
+    if piece_type == chess.KING and square == (chess.E1 if color else chess.E8):
+        destinations |= chess.BB_SQUARES[square + 2] | chess.BB_SQUARES[square - 2]
+    return destinations
+
+
+@_artifact('data/piece_action_masks.npy')
+def _build_piece_action_masks(moves: _Moves) -> bytes:
+    masks = np.zeros(
+        (len(chess.COLORS), len(chess.PIECE_TYPES) + 1, len(moves)), dtype=np.bool_
+    )
+    for color in chess.COLORS:
+        for piece_type in chess.PIECE_TYPES:
+            for index, move in enumerate(moves):
+                # Only pawns underpromote
+                if move.promotion is not None and piece_type != chess.PAWN:
+                    continue
+                destinations = _get_piece_destinations(
+                    piece_type, color, move.from_square
+                )
+                masks[int(color), piece_type, index] = bool(
+                    destinations & chess.BB_SQUARES[move.to_square]
+                )
+    return _npy_bytes(masks)
+
+
+@_artifact('data/queen_promotion_keys.npy')
+def _build_queen_promotion_keys(moves: _Moves) -> bytes:
+    return _npy_bytes(_get_queen_promotion_keys(moves))
+
+
+@_artifact('data/key_to_action_index.npy')
+def _build_key_to_action_index(moves: _Moves) -> bytes:
+    key_to_action_index = np.full(MOVE_KEY_SPACE_SIZE, -1, dtype=np.int16)
+    key_to_action_index[_get_action_keys(moves)] = np.arange(len(moves))
+    for key in _get_queen_promotion_keys(moves).tolist():
+        # Queen promotions are encoded by the non-promotion move
+        key_to_action_index[key] = key_to_action_index[key & 0xFFF]
+    return _npy_bytes(key_to_action_index)
+
+
+def build_artifacts() -> dict[str, bytes]:
+    """
+    Return the content of every artifact, keyed by its path relative to the package.
+    """
+    moves = tuple(iter_action_space(fast=False))
+    assert len(moves) == get_action_space_size(fast=False)
+    return {path: build(moves) for path, build in _ARTIFACT_BUILDERS.items()}
+
+
+def build_manifest(artifacts: dict[str, bytes]) -> bytes:
+    manifest = {
+        path: get_checksum(content) for path, content in sorted(artifacts.items())
+    }
+    return (json.dumps(manifest, indent=2) + '\n').encode()
+
+
+def write_artifacts() -> None:
+    """Refresh every generated artifact and the manifest."""
+    artifacts = build_artifacts()
+    for path, content in artifacts.items():
+        artifact_path = _PACKAGE_DIR / path
+        artifact_path.parent.mkdir(parents=True, exist_ok=True)
+        artifact_path.write_bytes(content)
+        print(f'Wrote to "{artifact_path}"!')
+
+    MANIFEST_PATH.write_bytes(build_manifest(artifacts))
+    print(f'Wrote to "{MANIFEST_PATH}"!')
+
+
+if __name__ == '__main__':
+    write_artifacts()
+
+
+__all__ = [
+    'build_artifacts',
+    'build_manifest',
+    'write_artifacts',
+]
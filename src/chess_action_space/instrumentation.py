@@ -0,0 +1,159 @@
+import functools
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Callable
+from typing import Any, NamedTuple, TypeVar
+
+import numpy as np
+
+INSTRUMENTATION_ENV_VAR = 'CHESS_ACTION_SPACE_INSTRUMENT'
+"""
+If set to a non-empty value when the package is imported, instrumentation starts enabled: the public encode, decode
+and mask functions record their call counts, time and number of items processed, see `snapshot`. It can be switched
+at runtime with `enable` and `disable`. While disabled, the package modules hold the undecorated functions, so
+instrumentation costs nothing.
+"""
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class CallStats(NamedTuple):
+    calls: int
+    seconds: float
+    """
+    The cumulative wall time of all calls, excluding the time spent in nested instrumented calls (which is recorded
+    under their own names), so the times of all functions add up without double counting.
+    """
+    items: int
+    """The number of items (moves, positions, strings, ...) processed by all calls."""
+
+
+_stats: dict[str, list[int]] = {}
+"""Map from qualified function name to `[calls, nanoseconds, items]`."""
+_stats_lock = threading.Lock()
+_enabled = bool(os.environ.get(INSTRUMENTATION_ENV_VAR))
+_wrappers: dict[Callable[..., Any], Callable[..., Any]] = {}
+"""Map from every instrumented function to its recording wrapper."""
+_local = threading.local()
+"""Per thread, `nested`: the time spent in nested instrumented calls of every instrumented call on the stack."""
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _replace_functions(
+    replacements: dict[Callable[..., Any], Callable[..., Any]],
+) -> None:
+    """Replace the functions of `replacements` in the namespaces of all imported modules of the package."""
+    package = __name__.rpartition('.')[0]
+    for name, module in list(sys.modules.items()):
+        if name != package and not name.startswith(f'{package}.'):
+            continue
+        namespace = vars(module)
+        for attribute, value in list(namespace.items()):
+            if isinstance(value, types.FunctionType) and value in replacements:
+                namespace[attribute] = replacements[value]
+
+
+def enable() -> None:
+    """
+    Start recording the stats of instrumented functions. The functions of the package are replaced by their wrappers
+    in its modules, so references to them taken before (ex. `from chess_action_space import get_action`) are not
+    recorded.
+    """
+    global _enabled
+    _enabled = True
+    _replace_functions(_wrappers)
+
+
+def disable() -> None:
+    """Stop recording the stats of instrumented functions, keeping those recorded so far."""
+    global _enabled
+    _enabled = False
+    _replace_functions({wrapper: fn for fn, wrapper in _wrappers.items()})
+
+
+def count_rows(result: Any) -> int:
+    """Count the items of a batch function as the length of its result (ex. one row per position)."""
+    return len(result)
+
+
+def count_elements(result: Any) -> int:
+    """Count the items of an element-wise function as the number of elements of its result."""
+    return int(np.size(result))
+
+
+def instrumented(count_items: Callable[[Any], int] | None = None) -> Callable[[F], F]:
+    """
+    Decorate a function to record its `CallStats` under its module and qualified name while instrumentation is
+    enabled (see `enable` and `INSTRUMENTATION_ENV_VAR`). The function is returned unchanged while disabled.
+    `count_items(result)` returns the number of items processed by a call, by default `1`.
+    """
+
+    def decorate(fn: F) -> F:
+        name = f'{fn.__module__}.{fn.__qualname__}'
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            nested = getattr(_local, 'nested', None)
+            if nested is None:
+                nested = _local.nested = []
+            nested.append(0)
+            start = time.perf_counter_ns()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                self_time = elapsed - nested.pop()
+                if nested:
+                    nested[-1] += elapsed
+            items = 1 if count_items is None else count_items(result)
+            with _stats_lock:
+                stats = _stats.setdefault(name, [0, 0, 0])
+                stats[0] += 1
+                stats[1] += self_time
+                stats[2] += items
+            return result
+
+        _wrappers[fn] = wrapper
+        return wrapper if _enabled else fn  # type: ignore[return-value]
+
+    return decorate
+
+
+def snapshot() -> dict[str, CallStats]:
+    """
+    Return the stats recorded so far for every instrumented function that was called, keyed by module and qualified
+    name (ex. `'chess_action_space.masks.get_legal_masks'`).
+    """
+    with _stats_lock:
+        return {
+            name: CallStats(calls, nanoseconds / 1e9, items)
+            for name, (calls, nanoseconds, items) in sorted(_stats.items())
+        }
+
+
+def reset() -> None:
+    """Clear all recorded stats."""
+    with _stats_lock:
+        _stats.clear()
+
+
+__all__ = [
+    'INSTRUMENTATION_ENV_VAR',
+    'CallStats',
+    'count_elements',
+    'count_rows',
+    'disable',
+    'enable',
+    'instrumented',
+    'is_enabled',
+    'reset',
+    'snapshot',
+]
@@ -0,0 +1,189 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Literal, NamedTuple
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import Positions, iter_boards
+from chess_action_space.encoding import _get_key_to_index
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.instrumentation import count_rows, instrumented
+from chess_action_space.movegen import get_legal_masks_vectorized
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, _check_ordering
+from chess_action_space.utils import get_move_key
+
+PACKED_MASK_SIZE = -(-ACTION_SPACE_SIZE // 8)
+"""The number of bytes of a legal mask packed with `np.packbits`."""
+
+
+@instrumented()
+def get_legal_action_indices(
+    board: chess.Board, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray[np.uint16]:
+    """
+    Return the sorted indices in `ACTION_SPACE` (or positions in another `ordering`) of all legal moves on `board`.
+    All four promotions of a pawn map to distinct actions (queen promotions to the non-promotion action).
+    """
+    keys = [get_move_key(move) for move in board.legal_moves]
+    indices = _get_key_to_index(ordering)[keys].astype(np.uint16)
+    indices.sort()
+    return indices
+
+
+@instrumented()
+def get_legal_mask(
+    board: chess.Board,
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return a boolean mask of shape `(ACTION_SPACE_SIZE,)` that is `True` at the index (in `ordering`) of every legal
+    move on `board`. If `out` is given, the mask is written into it and returned.
+    """
+    if out is None:
+        out = np.zeros(ACTION_SPACE_SIZE, dtype=np.bool_)
+    else:
+        out[:] = False
+    out[get_legal_action_indices(board, ordering)] = True
+    return out
+
+
+@instrumented(count_rows)
+def get_legal_masks(
+    positions: Positions,
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Batched `get_legal_mask`, returning an `(N, ACTION_SPACE_SIZE)` mask. `positions` are boards or their array form
+    (see `get_boards_array` and `parse_fens`). If `out` is given, the masks are written into it and returned, so a
+    preallocated batch buffer can be reused. Positions in array form use `get_legal_masks_vectorized`.
+    """
+    if isinstance(positions, np.ndarray):
+        return get_legal_masks_vectorized(positions, out, ordering)
+    if out is None:
+        out = np.zeros((len(positions), ACTION_SPACE_SIZE), dtype=np.bool_)
+    else:
+        out[:] = False
+    rows: list[int] = []
+    keys: list[int] = []
+    for i, board in enumerate(iter_boards(positions)):
+        start = len(keys)
+        keys.extend(get_move_key(move) for move in board.legal_moves)
+        rows.extend([i] * (len(keys) - start))
+    out[rows, _get_key_to_index(ordering)[keys]] = True
+    return out
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LegalMaskCache:
+    """
+    Bounded LRU cache around `get_legal_action_indices`/`get_legal_mask` for search over transposing positions.
+
+    Entries are keyed by the piece bitboards, the side to move, the castling rights and the en passant square (if an
+    en passant capture is legal), like repetitions in python-chess, and stored either as `uint16` index arrays
+    (`storage='indices'`) or as packed bitsets of `PACKED_MASK_SIZE` bytes (`storage='bitset'`). Unlike a Zobrist
+    hash, the key is exact and cheap to compute, so a hit costs little more than a dictionary lookup. Indices and
+    masks are in `ordering`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1 << 16,
+        storage: Literal['indices', 'bitset'] = 'indices',
+        ordering: Ordering = DEFAULT_ORDERING,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, got {maxsize}')
+        if storage not in ('indices', 'bitset'):
+            raise ValueError(f'Unknown storage {storage!r}')
+        _check_ordering(ordering)
+        self.maxsize = maxsize
+        self.storage = storage
+        self.ordering = ordering
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, npt.NDArray] = OrderedDict()
+
+    @staticmethod
+    def get_key(board: chess.Board) -> Hashable:
+        return board._transposition_key()
+
+    def _get_entry(self, board: chess.Board) -> npt.NDArray:
+        key = self.get_key(board)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        indices = get_legal_action_indices(board, self.ordering)
+        if self.storage == 'bitset':
+            mask = np.zeros(ACTION_SPACE_SIZE, dtype=np.bool_)
+            mask[indices] = True
+            entry = np.packbits(mask)
+        else:
+            entry = indices
+        entry.flags.writeable = False
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def get_legal_action_indices(self, board: chess.Board) -> npt.NDArray[np.uint16]:
+        """Cached `get_legal_action_indices`. The returned array is read-only when stored as indices."""
+        entry = self._get_entry(board)
+        if self.storage == 'bitset':
+            mask = np.unpackbits(entry, count=ACTION_SPACE_SIZE).view(np.bool_)
+            return np.flatnonzero(mask).astype(np.uint16)
+        return entry
+
+    def get_legal_mask(
+        self, board: chess.Board, out: npt.NDArray[np.bool_] | None = None
+    ) -> npt.NDArray[np.bool_]:
+        """Cached `get_legal_mask`."""
+        entry = self._get_entry(board)
+        if self.storage == 'bitset':
+            mask = np.unpackbits(entry, count=ACTION_SPACE_SIZE).view(np.bool_)
+            if out is None:
+                return mask
+            out[:] = mask
+            return out
+
+        if out is None:
+            out = np.zeros(ACTION_SPACE_SIZE, dtype=np.bool_)
+        else:
+            out[:] = False
+        out[entry] = True
+        return out
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = [
+    'PACKED_MASK_SIZE',
+    'CacheInfo',
+    'LegalMaskCache',
+    'get_legal_action_indices',
+    'get_legal_mask',
+    'get_legal_masks',
+]
@@ -0,0 +1,678 @@
+import functools
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import NO_EP_SQUARE, BoardColumn
+from chess_action_space.encoding import ACTION_KEYS, _get_key_to_index
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.instrumentation import count_rows, instrumented
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, get_permutation
+from chess_action_space.tables import load_table
+
+ACTION_BETWEEN: npt.NDArray[np.uint64] = load_table('action_between')
+"""
+The bitboard of the squares strictly between the from-square and the to-square of every move in `ACTION_SPACE`
+(`0` for knight moves), see `chess.between`.
+"""
+
+ACTION_CATEGORY: npt.NDArray[np.uint8] = load_table('action_category')
+"""The `ActionCategory` of every move in `ACTION_SPACE`."""
+
+PIECE_ACTION_MASKS: npt.NDArray[np.bool_] = load_table('piece_action_masks')
+"""
+The `(2, 7, ACTION_SPACE_SIZE)` masks of the actions a piece could ever take from any square on an empty board,
+indexed by `[color, piece_type]` (row `0` is empty). Pawn masks hold pushes, double pushes, captures and
+promotions (including underpromotions) in the direction of `color`, from the second to the seventh rank only, and
+king masks hold castling. See
+`get_piece_action_mask` and `get_candidate_masks`.
+"""
+
+
+def _table(values: Iterable[object]) -> npt.NDArray[np.uint64]:
+    table = np.array(values, dtype=np.uint64)
+    table.flags.writeable = False
+    return table
+
+
+_ALL = np.uint64(chess.BB_ALL)
+_ZERO = np.uint64(0)
+_NOT_FILE_A = np.uint64(chess.BB_ALL & ~chess.BB_FILE_A)
+_NOT_FILE_H = np.uint64(chess.BB_ALL & ~chess.BB_FILE_H)
+_NOT_FILES_AB = np.uint64(chess.BB_ALL & ~(chess.BB_FILE_A | chess.BB_FILE_B))
+_NOT_FILES_GH = np.uint64(chess.BB_ALL & ~(chess.BB_FILE_G | chess.BB_FILE_H))
+
+_SQUARE_BB = _table(chess.BB_SQUARES)
+_KNIGHT_ATTACKS = _table(chess.BB_KNIGHT_ATTACKS)
+_KING_ATTACKS = _table(chess.BB_KING_ATTACKS)
+_PAWN_ATTACKS = _table(chess.BB_PAWN_ATTACKS)
+"""Indexed by `[color, square]`."""
+_RAYS = _table(chess.BB_RAYS)
+"""The full line through two squares (edge to edge), or `0` if they are not aligned, indexed by `[square, square]`."""
+_BETWEEN = _table([[chess.between(a, b) for b in chess.SQUARES] for a in chess.SQUARES])
+
+# Directions as `(shift, squares reachable by that shift without wrapping around the board)`
+_Direction = tuple[int, np.uint64]
+_RANK_DIRECTIONS: tuple[_Direction, ...] = ((1, _NOT_FILE_A), (-1, _NOT_FILE_H))
+_FILE_DIRECTIONS: tuple[_Direction, ...] = ((8, _ALL), (-8, _ALL))
+_ORTHOGONAL_DIRECTIONS = _RANK_DIRECTIONS + _FILE_DIRECTIONS
+_DIAGONAL_DIRECTIONS: tuple[_Direction, ...] = (
+    (9, _NOT_FILE_A),
+    (7, _NOT_FILE_H),
+    (-7, _NOT_FILE_A),
+    (-9, _NOT_FILE_H),
+)
+
+# Every action tests one bit of the destination bitboards of its from-square, see `_destinations_to_masks`.
+# Underpromotions read a second set of destination bitboards that only holds pawn moves
+_ACTION_FROM = (ACTION_KEYS & 63).astype(np.intp)
+_ACTION_TO = (ACTION_KEYS >> 6 & 63).astype(np.intp)
+_ACTION_BYTE = (
+    (_ACTION_FROM + 64 * (ACTION_KEYS >> 12 != 0)) * 8 + (_ACTION_TO >> 3)
+).astype(np.intp)
+_ACTION_BIT = (1 << (_ACTION_TO & 7)).astype(np.uint8)
+for _array in (_ACTION_FROM, _ACTION_TO, _ACTION_BYTE, _ACTION_BIT):
+    _array.flags.writeable = False
+del _array
+
+
+@functools.cache
+def _get_action_bits(
+    ordering: Ordering,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.uint8]]:
+    """`_ACTION_BYTE` and `_ACTION_BIT` in `ordering`, so that masks are built directly in that order."""
+    if ordering == DEFAULT_ORDERING:
+        return _ACTION_BYTE, _ACTION_BIT
+    permutation = get_permutation(ordering)
+    action_byte = _ACTION_BYTE[permutation]
+    action_bit = _ACTION_BIT[permutation]
+    action_byte.flags.writeable = False
+    action_bit.flags.writeable = False
+    return action_byte, action_bit
+
+
+# The to-squares of `PIECE_ACTION_MASKS` as bitboards, indexed by `[color, piece_type, from_square]`. Underpromotions
+# are implied by the destinations of pawns, like in `_destinations_to_masks`
+_PIECE_DESTINATIONS = np.zeros((2, 7, 64), dtype=np.uint64)
+np.bitwise_or.at(
+    _PIECE_DESTINATIONS.transpose(2, 0, 1),
+    _ACTION_FROM,
+    np.where(PIECE_ACTION_MASKS, _SQUARE_BB[_ACTION_TO], _ZERO).transpose(2, 0, 1),
+)
+_PIECE_DESTINATIONS.flags.writeable = False
+
+_DE_BRUIJN = np.uint64(0x03F79D71B4CB0A89)
+_DE_BRUIJN_SQUARES = np.zeros(64, dtype=np.intp)
+_DE_BRUIJN_SQUARES[
+    [(1 << square) * 0x03F79D71B4CB0A89 % (1 << 64) >> 58 for square in chess.SQUARES]
+] = chess.SQUARES
+_DE_BRUIJN_SQUARES.flags.writeable = False
+
+
+def _shift(b: npt.NDArray[np.uint64], shift: int) -> npt.NDArray[np.uint64]:
+    if shift > 0:
+        return b << np.uint64(shift)
+    return b >> np.uint64(-shift)
+
+
+def _lsb_square(b: npt.NDArray[np.uint64]) -> npt.NDArray[np.intp]:
+    """The square of the least significant bit of every bitboard (`0` for empty bitboards)."""
+    with np.errstate(over='ignore'):
+        return _DE_BRUIJN_SQUARES[
+            ((b & (~b + np.uint64(1))) * _DE_BRUIJN) >> np.uint64(58)
+        ]
+
+
+def _msb(b: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """The most significant bit of every bitboard."""
+    for shift in (1, 2, 4, 8, 16, 32):
+        b = b | b >> np.uint64(shift)
+    return b ^ b >> np.uint64(1)
+
+
+def _slider_attacks(
+    generators: npt.NDArray[np.uint64],
+    empty: npt.NDArray[np.uint64],
+    directions: tuple[_Direction, ...],
+) -> npt.NDArray[np.uint64]:
+    """
+    Attacks of sliders on `generators` along `directions` up to and including the first occupied square, computed
+    with Kogge-Stone occluded fills.
+    """
+    attacks = np.zeros_like(generators)
+    for shift, wrap in directions:
+        propagators = empty & wrap
+        fill = generators | propagators & _shift(generators, shift)
+        propagators = propagators & _shift(propagators, shift)
+        fill |= propagators & _shift(fill, 2 * shift)
+        propagators = propagators & _shift(propagators, 2 * shift)
+        fill |= propagators & _shift(fill, 4 * shift)
+        attacks |= _shift(fill, shift) & wrap
+    return attacks
+
+
+def _knight_attacks(b: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    one = _shift(b, 1) & _NOT_FILE_A | _shift(b, -1) & _NOT_FILE_H
+    two = _shift(b, 2) & _NOT_FILES_AB | _shift(b, -2) & _NOT_FILES_GH
+    return _shift(one, 16) | _shift(one, -16) | _shift(two, 8) | _shift(two, -8)
+
+
+def _king_attacks(b: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    sideways = _shift(b, 1) & _NOT_FILE_A | _shift(b, -1) & _NOT_FILE_H
+    row = b | sideways
+    return sideways | _shift(row, 8) | _shift(row, -8)
+
+
+def _pawn_attacks(
+    b: npt.NDArray[np.uint64], white: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.uint64]:
+    """Squares attacked by white pawns on `b` where `white`, else by black pawns."""
+    up = _shift(b, 9) & _NOT_FILE_A | _shift(b, 7) & _NOT_FILE_H
+    down = _shift(b, -7) & _NOT_FILE_A | _shift(b, -9) & _NOT_FILE_H
+    return np.where(white, up, down)
+
+
+class _Positions(NamedTuple):
+    """The columns of positions in array form, from the point of view of the side to move."""
+
+    pawns: npt.NDArray[np.uint64]
+    knights: npt.NDArray[np.uint64]
+    bishops: npt.NDArray[np.uint64]
+    rooks: npt.NDArray[np.uint64]
+    queens: npt.NDArray[np.uint64]
+    kings: npt.NDArray[np.uint64]
+    ours: npt.NDArray[np.uint64]
+    theirs: npt.NDArray[np.uint64]
+    occupied: npt.NDArray[np.uint64]
+    white: npt.NDArray[np.bool_]
+    """Whether white is to move."""
+    castling_rights: npt.NDArray[np.uint64]
+    ep_square: npt.NDArray[np.intp]
+
+    @classmethod
+    def from_array(cls, positions: npt.NDArray[np.uint64]) -> '_Positions':
+        columns = np.ascontiguousarray(positions.T)
+        white = columns[BoardColumn.TURN] != 0
+        ours = np.where(white, columns[BoardColumn.WHITE], columns[BoardColumn.BLACK])
+        theirs = np.where(white, columns[BoardColumn.BLACK], columns[BoardColumn.WHITE])
+        return cls(
+            columns[BoardColumn.PAWNS],
+            columns[BoardColumn.KNIGHTS],
+            columns[BoardColumn.BISHOPS],
+            columns[BoardColumn.ROOKS],
+            columns[BoardColumn.QUEENS],
+            columns[BoardColumn.KINGS],
+            ours,
+            theirs,
+            ours | theirs,
+            white,
+            columns[BoardColumn.CASTLING_RIGHTS],
+            columns[BoardColumn.EP_SQUARE].astype(np.intp),
+        )
+
+    def piece_bitboard(self, piece_type: chess.PieceType) -> npt.NDArray[np.uint64]:
+        pieces = (self.pawns, self.knights, self.bishops, self.rooks, self.queens)
+        return (*pieces, self.kings)[piece_type - 1]
+
+    def take(self, rows: npt.NDArray[np.intp]) -> '_Positions':
+        return _Positions(
+            **{name: column[rows] for name, column in self._asdict().items()}
+        )
+
+    def attackers(
+        self, squares: npt.NDArray[np.uint64], occupied: npt.NDArray[np.uint64]
+    ) -> npt.NDArray[np.uint64]:
+        """
+        Their pieces attacking the square of every bitboard in `squares` with the given occupancy, like
+        `chess.Board.attackers_mask`.
+        """
+        rooks_and_queens = (self.rooks | self.queens) & self.theirs
+        bishops_and_queens = (self.bishops | self.queens) & self.theirs
+        empty = ~occupied
+        return (
+            _slider_attacks(squares, empty, _ORTHOGONAL_DIRECTIONS) & rooks_and_queens
+            | _slider_attacks(squares, empty, _DIAGONAL_DIRECTIONS) & bishops_and_queens
+            | _knight_attacks(squares) & self.knights & self.theirs
+            | _king_attacks(squares) & self.kings & self.theirs
+            | _pawn_attacks(squares, self.white) & self.pawns & self.theirs
+        )
+
+    def attacks(self, occupied: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+        """All squares attacked by their pieces with the given occupancy."""
+        empty = ~occupied
+        return (
+            _slider_attacks(
+                (self.rooks | self.queens) & self.theirs, empty, _ORTHOGONAL_DIRECTIONS
+            )
+            | _slider_attacks(
+                (self.bishops | self.queens) & self.theirs, empty, _DIAGONAL_DIRECTIONS
+            )
+            | _knight_attacks(self.knights & self.theirs)
+            | _king_attacks(self.kings & self.theirs)
+            | _pawn_attacks(self.pawns & self.theirs, ~self.white)
+        )
+
+
+class _Pieces(NamedTuple):
+    """Our pieces of one type, one entry per piece."""
+
+    piece_type: chess.PieceType
+    rows: npt.NDArray[np.intp]
+    """The position of every piece."""
+    squares: npt.NDArray[np.intp]
+    destinations: npt.NDArray[np.uint64]
+    """The bitboard of the destinations of every piece."""
+
+
+def _get_squares(
+    bitboards: npt.NDArray[np.uint64],
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """The row and square of every set bit of `bitboards`."""
+    bits = np.unpackbits(
+        bitboards.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1, bitorder='little'
+    )
+    rows, squares = np.nonzero(bits)
+    return rows, squares
+
+
+def _get_pseudo_legal_destinations(p: _Positions) -> list[_Pieces]:
+    """
+    The pseudo-legal destinations of all our pieces like `chess.Board.generate_pseudo_legal_moves`, except for
+    castling and en passant.
+    """
+    pieces = []
+    for piece_type in chess.PIECE_TYPES:
+        rows, squares = _get_squares(p.piece_bitboard(piece_type) & p.ours)
+        if piece_type == chess.PAWN:
+            white = p.white[rows]
+            empty = ~p.occupied[rows]
+            square_bb = _SQUARE_BB[squares]
+            single = (
+                np.where(white, _shift(square_bb, 8), _shift(square_bb, -8)) & empty
+            )
+            double = (
+                np.where(
+                    white,
+                    _shift(single, 8) & np.uint64(chess.BB_RANK_4),
+                    _shift(single, -8) & np.uint64(chess.BB_RANK_5),
+                )
+                & empty
+            )
+            captures = _PAWN_ATTACKS[white.astype(np.intp), squares] & p.theirs[rows]
+            destinations = single | double | captures
+        else:
+            if piece_type == chess.KNIGHT:
+                destinations = _KNIGHT_ATTACKS[squares]
+            elif piece_type == chess.KING:
+                destinations = _KING_ATTACKS[squares]
+            else:
+                directions: tuple[_Direction, ...] = ()
+                if piece_type != chess.ROOK:
+                    directions += _DIAGONAL_DIRECTIONS
+                if piece_type != chess.BISHOP:
+                    directions += _ORTHOGONAL_DIRECTIONS
+                destinations = _slider_attacks(
+                    _SQUARE_BB[squares], ~p.occupied[rows], directions
+                )
+            destinations &= ~p.ours[rows]
+        pieces.append(_Pieces(piece_type, rows, squares, destinations))
+    return pieces
+
+
+class _KingSafety(NamedTuple):
+    has_king: npt.NDArray[np.bool_]
+    king: npt.NDArray[np.uint64]
+    """Our king (the most significant one, like `chess.Board.king`), or `0`."""
+    king_square: npt.NDArray[np.intp]
+    checkers: npt.NDArray[np.uint64]
+    evasions: npt.NDArray[np.uint64]
+    """Destinations allowed for pieces other than the king: all squares, the squares that resolve a single check, or
+    none in double check."""
+    pinned: npt.NDArray[np.uint64]
+
+
+def _get_king_safety(p: _Positions) -> _KingSafety:
+    king = _msb(p.kings & p.ours)
+    has_king = king != 0
+    king_square = _lsb_square(king)
+    checkers = np.where(has_king, p.attackers(king, p.occupied), _ZERO)
+    single_checker_square = _lsb_square(checkers)
+    evasions = np.where(
+        checkers == 0,
+        _ALL,
+        np.where(
+            checkers & (checkers - np.uint64(1)),
+            _ZERO,
+            _BETWEEN[king_square, single_checker_square] | checkers,
+        ),
+    )
+
+    # A piece is pinned if it is the only piece between our king and one of their sliders on the same line
+    pinned = np.zeros_like(king)
+    for directions, snipers in (
+        (_ORTHOGONAL_DIRECTIONS, (p.rooks | p.queens) & p.theirs),
+        (_DIAGONAL_DIRECTIONS, (p.bishops | p.queens) & p.theirs),
+    ):
+        for direction in directions:
+            first = _slider_attacks(king, ~p.occupied, (direction,))
+            blocker = first & p.ours
+            second = _slider_attacks(king, ~(p.occupied ^ blocker), (direction,))
+            pinned |= np.where(second & snipers, blocker, _ZERO)
+    return _KingSafety(has_king, king, king_square, checkers, evasions, pinned)
+
+
+def _filter_legal_destinations(
+    p: _Positions, safety: _KingSafety, pieces: list[_Pieces]
+) -> list[_Pieces]:
+    """
+    Remove the destinations of `pieces` that leave our king in check, like `chess.Board.generate_legal_moves`: pinned
+    pieces stay on the line through the king, in check only evasions remain, and the king only moves to squares that
+    are not attacked (with the king itself removed, so it cannot retreat along the line of a checking slider).
+    """
+    in_check = safety.checkers != 0
+    king_safe = ~p.attacks(p.occupied & ~safety.king)
+    filtered = []
+    for piece in pieces:
+        rows, squares = piece.rows, piece.squares
+        king_square = safety.king_square[rows]
+        pinned = (safety.pinned[rows] >> squares.astype(np.uint64)) & np.uint64(1) != 0
+        allowed = np.where(pinned, _RAYS[king_square, squares], _ALL)
+        if piece.piece_type == chess.KING:
+            # Kings other than `safety.king` are ordinary pieces, but cannot move at all in check
+            is_king = squares == king_square
+            allowed &= np.where(
+                is_king, king_safe[rows], np.where(in_check[rows], _ZERO, _ALL)
+            )
+        else:
+            allowed &= safety.evasions[rows]
+        filtered.append(piece._replace(destinations=piece.destinations & allowed))
+    return filtered
+
+
+def _destinations_to_masks(
+    num_positions: int,
+    pieces: list[_Pieces],
+    out: npt.NDArray[np.bool_],
+    ordering: Ordering,
+) -> None:
+    # Destination bitboards per from-square, followed by the destinations of pawns only (for underpromotions)
+    destinations = np.zeros((num_positions, 128), dtype='<u8')
+    for piece in pieces:
+        destinations[piece.rows, piece.squares] = piece.destinations
+        if piece.piece_type == chess.PAWN:
+            destinations[piece.rows, piece.squares + 64] = piece.destinations
+    _destination_bits_to_masks(destinations, out, ordering)
+
+
+def _destination_bits_to_masks(
+    destinations: npt.NDArray[np.uint64],
+    out: npt.NDArray[np.bool_],
+    ordering: Ordering,
+) -> None:
+    action_byte, action_bit = _get_action_bits(ordering)
+    bits = np.take(destinations.view(np.uint8), action_byte, axis=1)
+    np.bitwise_and(bits, action_bit, out=bits)
+    np.not_equal(bits, 0, out=out)
+
+
+def _get_action_indices(
+    from_squares: npt.NDArray[np.intp],
+    to_squares: npt.NDArray[np.intp],
+    ordering: Ordering,
+) -> npt.NDArray[np.intp]:
+    key_to_index = _get_key_to_index(ordering)
+    return key_to_index[from_squares | to_squares << 6].astype(np.intp)
+
+
+def _add_castling(
+    p: _Positions, out: npt.NDArray[np.bool_], ordering: Ordering
+) -> None:
+    """Add the castling moves (which are always legal when generated), like `chess.Board.generate_castling_moves`."""
+    for color, rank in ((chess.WHITE, 0), (chess.BLACK, 7)):
+        king_from = chess.square(4, rank)
+        king_bb = _SQUARE_BB[king_from]
+        backrank = np.uint64(chess.BB_RANKS[rank])
+        kings = p.kings & p.ours & backrank
+        # Castling rights are clean, so the king must be on the e-file and the rook in the corner
+        can_castle = (p.white == color) & ((kings & (~kings + np.uint64(1))) == king_bb)
+        for rook_file, king_to_file, rook_to_file in ((7, 6, 5), (0, 2, 3)):
+            rook = chess.square(rook_file, rank)
+            king_to = chess.square(king_to_file, rank)
+            rook_to = chess.square(rook_to_file, rank)
+            rook_bb = _SQUARE_BB[rook]
+            king_path = chess.between(king_from, king_to)
+            path = (
+                king_path
+                | chess.between(rook, rook_to)
+                | chess.BB_SQUARES[king_to]
+                | chess.BB_SQUARES[rook_to]
+            )
+            rows = np.flatnonzero(can_castle & (p.castling_rights & rook_bb != 0))
+            if not len(rows):
+                continue
+            q = p.take(rows)
+            occupied = q.occupied ^ king_bb ^ rook_bb
+            legal = occupied & np.uint64(path) == 0
+            for square in chess.scan_forward(king_path | chess.BB_SQUARES[king_from]):
+                legal &= (
+                    q.attackers(
+                        np.full_like(occupied, _SQUARE_BB[square]), q.occupied ^ king_bb
+                    )
+                    == 0
+                )
+            legal &= (
+                q.attackers(
+                    np.full_like(occupied, _SQUARE_BB[king_to]),
+                    occupied ^ _SQUARE_BB[rook_to],
+                )
+                == 0
+            )
+            index = int(_get_key_to_index(ordering)[king_from | king_to << 6])
+            out[rows, index] |= legal
+
+
+def _get_en_passant(
+    p: _Positions,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """
+    The pseudo-legal en passant captures as `(rows, capturer squares, ep squares)`, like
+    `chess.Board.generate_pseudo_legal_ep`.
+    """
+    # `chess.Board` ignores an en passant square of `0`
+    has_ep = (p.ep_square != NO_EP_SQUARE) & (p.ep_square != 0)
+    ep_square = np.where(has_ep, p.ep_square, 0)
+    ep_bb = np.where(has_ep, _SQUARE_BB[ep_square], _ZERO)
+    capture_rank = np.where(
+        p.white, np.uint64(chess.BB_RANK_5), np.uint64(chess.BB_RANK_4)
+    )
+    capturers = np.where(
+        ep_bb & p.occupied,
+        _ZERO,
+        p.pawns
+        & p.ours
+        & _PAWN_ATTACKS[(~p.white).astype(np.intp), ep_square]
+        & capture_rank,
+    )
+    capturers &= np.where(has_ep, _ALL, _ZERO)
+    rows, capturer_squares = _get_squares(capturers)
+    return rows, capturer_squares, ep_square[rows]
+
+
+def _add_legal_en_passant(
+    p: _Positions,
+    safety: _KingSafety,
+    out: npt.NDArray[np.bool_],
+    ordering: Ordering,
+) -> None:
+    """Add the legal en passant captures, like `chess.Board._is_safe` and `chess.Board._generate_evasions`."""
+    rows, capturers, ep_squares = _get_en_passant(p)
+    if not len(rows):
+        return
+    q = p.take(rows)
+    king = safety.king[rows]
+    king_square = safety.king_square[rows]
+    checkers = safety.checkers[rows]
+    ep_bb = _SQUARE_BB[ep_squares]
+    captured = _SQUARE_BB[np.where(q.white, ep_squares - 8, ep_squares + 8)]
+    capturer_bb = _SQUARE_BB[capturers]
+
+    # In check, the capture must block the check or take the checking pawn
+    evasion = (safety.evasions[rows] & ep_bb != 0) | (
+        (checkers == captured) & (safety.evasions[rows] != 0)
+    )
+    pin = np.where(
+        safety.pinned[rows] & capturer_bb, _RAYS[king_square, capturers], _ALL
+    )
+    # Removing both pawns must not expose the king along its rank (or a diagonal)
+    occupied = q.occupied & ~captured & ~capturer_bb | ep_bb
+    skewered = (
+        _slider_attacks(king, ~occupied, _RANK_DIRECTIONS)
+        & (q.rooks | q.queens)
+        & q.theirs
+        | _slider_attacks(king, ~occupied, _DIAGONAL_DIRECTIONS)
+        & (q.bishops | q.queens)
+        & q.theirs
+    ) != 0
+    legal = ~safety.has_king[rows] | (evasion & (pin & ep_bb != 0) & ~skewered)
+    out[rows, _get_action_indices(capturers, ep_squares, ordering)] |= legal
+
+
+@instrumented(count_rows)
+def get_unobstructed_masks(
+    occupied: npt.ArrayLike,
+    targets: npt.ArrayLike | None = None,
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return the `(N, ACTION_SPACE_SIZE)` masks of the actions with no occupied square between their from-square and
+    their to-square (`(ACTION_BETWEEN & occupied) == 0`), for `N` occupancy bitboards. If `targets` bitboards are
+    given (ex. the squares not occupied by the side to move), the to-square must also be in `targets`.
+
+    Combined with `ACTION_CATEGORY`, this gives the moves of sliders and knights on each from-square without move
+    generation. In another `ordering`, `ACTION_CATEGORY` must be reordered too, see `to_ordering`.
+    """
+    occupied = np.asarray(occupied, dtype=np.uint64).reshape(-1, 1)
+    if out is None:
+        out = np.empty((len(occupied), ACTION_SPACE_SIZE), dtype=np.bool_)
+    between, to_squares = ACTION_BETWEEN, _ACTION_TO
+    if ordering != DEFAULT_ORDERING:
+        permutation = get_permutation(ordering)
+        between, to_squares = between[permutation], to_squares[permutation]
+    blocked = between & occupied
+    np.equal(blocked, 0, out=out)
+    if targets is not None:
+        targets = np.asarray(targets, dtype=np.uint64).reshape(-1, 1)
+        np.bitwise_and(
+            targets >> to_squares.astype(np.uint64), np.uint64(1), out=blocked
+        )
+        out &= blocked != 0
+    return out
+
+
+def get_piece_action_mask(
+    piece_type: chess.PieceType,
+    color: chess.Color,
+    from_square: chess.Square | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return the `(ACTION_SPACE_SIZE,)` mask (in `ordering`) of the actions a piece of `piece_type` and `color` could
+    ever take, from `from_square` or from any square, see `PIECE_ACTION_MASKS`. Policies can be filtered by piece type
+    with it.
+    """
+    mask = PIECE_ACTION_MASKS[int(color), piece_type]
+    if from_square is not None:
+        mask = mask & (_ACTION_FROM == from_square)
+    if ordering != DEFAULT_ORDERING:
+        mask = mask[get_permutation(ordering)]
+    return mask
+
+
+@instrumented(count_rows)
+def get_candidate_masks(
+    positions: npt.NDArray[np.uint64],
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return the `(N, ACTION_SPACE_SIZE)` masks of the actions that the pieces of the side to move could take on an
+    empty board, from the piece on the from-square of every action (see `PIECE_ACTION_MASKS`), for positions in array
+    form. This is a superset of `get_pseudo_legal_masks` computed with a single table gather, without move
+    generation.
+    """
+    p = _Positions.from_array(np.asarray(positions, dtype=np.uint64))
+    if out is None:
+        out = np.empty((len(p.ours), ACTION_SPACE_SIZE), dtype=np.bool_)
+    colors = p.white.astype(np.intp)
+    destinations = np.zeros((len(p.ours), 128), dtype='<u8')
+    for piece_type in chess.PIECE_TYPES:
+        rows, squares = _get_squares(p.piece_bitboard(piece_type) & p.ours)
+        piece_destinations = _PIECE_DESTINATIONS[colors[rows], piece_type, squares]
+        destinations[rows, squares] = piece_destinations
+        if piece_type == chess.PAWN:
+            destinations[rows, squares + 64] = piece_destinations
+    _destination_bits_to_masks(destinations, out, ordering)
+    return out
+
+
+@instrumented(count_rows)
+def get_pseudo_legal_masks(
+    positions: npt.NDArray[np.uint64],
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return the `(N, ACTION_SPACE_SIZE)` masks of the pseudo-legal moves (see `chess.Board.pseudo_legal_moves`) of
+    positions in array form (see `get_boards_array` and `parse_fens`), computed with vectorized bitboard operations
+    over the whole batch, without a loop over positions. Castling rights must be clean. The masks are built
+    directly in `ordering`.
+    """
+    positions = np.asarray(positions, dtype=np.uint64)
+    if out is None:
+        out = np.empty((len(positions), ACTION_SPACE_SIZE), dtype=np.bool_)
+    p = _Positions.from_array(positions)
+    _destinations_to_masks(
+        len(positions), _get_pseudo_legal_destinations(p), out, ordering
+    )
+    _add_castling(p, out, ordering)
+    rows, capturers, ep_squares = _get_en_passant(p)
+    out[rows, _get_action_indices(capturers, ep_squares, ordering)] = True
+    return out
+
+
+@instrumented(count_rows)
+def get_legal_masks_vectorized(
+    positions: npt.NDArray[np.uint64],
+    out: npt.NDArray[np.bool_] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    Like `get_pseudo_legal_masks`, followed by a vectorized legality pass (pins, checks and attacked squares), so the
+    result matches `get_legal_masks` on the same positions.
+    """
+    positions = np.asarray(positions, dtype=np.uint64)
+    if out is None:
+        out = np.empty((len(positions), ACTION_SPACE_SIZE), dtype=np.bool_)
+    p = _Positions.from_array(positions)
+    safety = _get_king_safety(p)
+    pieces = _filter_legal_destinations(p, safety, _get_pseudo_legal_destinations(p))
+    _destinations_to_masks(len(positions), pieces, out, ordering)
+    _add_castling(p, out, ordering)
+    _add_legal_en_passant(p, safety, out, ordering)
+    return out
+
+
+__all__ = [
+    'ACTION_BETWEEN',
+    'ACTION_CATEGORY',
+    'PIECE_ACTION_MASKS',
+    'get_candidate_masks',
+    'get_legal_masks_vectorized',
+    'get_piece_action_mask',
+    'get_pseudo_legal_masks',
+    'get_unobstructed_masks',
+]
@@ -0,0 +1,104 @@
+import functools
+from typing import Literal, get_args
+
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.tables import load_table
+
+Ordering = Literal['from_square', 'to_square', 'direction', 'underpromotions_last']
+"""
+The name of an order of the actions:
+
+- `'from_square'`: the order of `ACTION_SPACE` (from-square-major)
+- `'to_square'`: to-square-major, then in the order of `ACTION_SPACE`
+- `'direction'`: like the planes of AlphaZero, grouped by the 8 queen directions (north first, then clockwise), then
+  the 8 knight directions, and by distance within a direction, then by from-square. Underpromotions come last,
+  grouped by promotion piece type, then direction
+- `'underpromotions_last'`: the order of `ACTION_SPACE` with all underpromotions moved to the end
+"""
+
+ORDERINGS: tuple[Ordering, ...] = get_args(Ordering)
+
+DEFAULT_ORDERING: Ordering = 'from_square'
+
+
+@functools.cache
+def _get_permutations() -> npt.NDArray[np.int16]:
+    """
+    The permutation of every ordering, in the order of `ORDERINGS`, see `get_permutation`. Loaded on first use, so
+    that `chess_action_space.generate` can import `ORDERINGS` before the table exists.
+    """
+    return load_table('action_orderings')
+
+
+def _check_ordering(ordering: str) -> int:
+    try:
+        return ORDERINGS.index(ordering)  # type: ignore[arg-type]
+    except ValueError:
+        raise ValueError(
+            f'Unknown ordering {ordering!r}, expected one of {ORDERINGS}'
+        ) from None
+
+
+def get_permutation(ordering: Ordering) -> npt.NDArray[np.int16]:
+    """
+    Return the read-only permutation of `ordering`: the action at position `i` in `ordering` is
+    `ACTION_SPACE[permutation[i]]`. Indexing the last axis of a mask or policy with it converts it to `ordering`, see
+    `to_ordering`. Raises `ValueError` for unknown orderings.
+    """
+    return _get_permutations()[_check_ordering(ordering)]
+
+
+@functools.cache
+def get_inverse_permutation(ordering: Ordering) -> npt.NDArray[np.int16]:
+    """
+    Return the read-only inverse of `get_permutation(ordering)`: the position in `ordering` of every action of
+    `ACTION_SPACE`. Raises `ValueError` for unknown orderings.
+    """
+    permutation = get_permutation(ordering)
+    inverse = np.empty_like(permutation)
+    inverse[permutation] = np.arange(len(permutation), dtype=np.int16)
+    inverse.flags.writeable = False
+    return inverse
+
+
+@functools.cache
+def _get_permutation_tuples(
+    ordering: Ordering,
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """The permutation and its inverse as tuples, for fast scalar lookups (see `_KEY_TO_ACTION_INDEX`)."""
+    return (
+        tuple(get_permutation(ordering).tolist()),
+        tuple(get_inverse_permutation(ordering).tolist()),
+    )
+
+
+def to_ordering(
+    values: npt.ArrayLike, ordering: Ordering, out: npt.NDArray | None = None
+) -> npt.NDArray:
+    """
+    Reorder the last axis of `values` (ex. masks or policies of shape `(..., ACTION_SPACE_SIZE)`) from the order of
+    `ACTION_SPACE` to `ordering`. If `out` is given, the result is written into it and returned.
+    """
+    return np.take(values, get_permutation(ordering), axis=-1, out=out)
+
+
+def from_ordering(
+    values: npt.ArrayLike, ordering: Ordering, out: npt.NDArray | None = None
+) -> npt.NDArray:
+    """
+    Reorder the last axis of `values` from `ordering` back to the order of `ACTION_SPACE`, see `to_ordering`.
+    """
+    return np.take(values, get_inverse_permutation(ordering), axis=-1, out=out)
+
+
+__all__ = [
+    'DEFAULT_ORDERING',
+    'ORDERINGS',
+    'Ordering',
+    'from_ordering',
+    'get_inverse_permutation',
+    'get_permutation',
+    'to_ordering',
+]
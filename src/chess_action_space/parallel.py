@@ -0,0 +1,278 @@
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.bitboards import Positions
+from chess_action_space.encoding import UciStrings, uci_to_index
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.masks import PACKED_MASK_SIZE, get_legal_masks
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering
+from chess_action_space.tables import attach_shared_memory
+
+DEFAULT_CHUNK_SIZE = 256
+"""The default number of items handled by one task of the thread pool."""
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool shared by the parallel batch functions when no executor is given, with one thread per
+    CPU. It is created on first use.
+    """
+    global _default_executor
+
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                os.cpu_count(), thread_name_prefix='chess_action_space'
+            )
+        return _default_executor
+
+
+def map_chunks(
+    fn: Callable[[Any, npt.NDArray[Any]], object],
+    items: Sequence[Any] | npt.NDArray[Any],
+    out: npt.NDArray[Any],
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> npt.NDArray[Any]:
+    """
+    Split `items` into chunks of `chunk_size` and call `fn(items[i:j], out[i:j])` for every chunk on `executor`
+    (the shared thread pool by default), then return `out`. Each call writes into its own slice of `out`, so no
+    result crosses threads. Batches of a single chunk run on the calling thread.
+
+    All global tables of this package are immutable, so `fn` may use them from any thread, including on
+    free-threaded builds. The items of a chunk must not be shared with another chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+    if len(out) != len(items):
+        raise ValueError(f'Got an output of length {len(out)} for {len(items)} items')
+    if len(items) <= chunk_size:
+        fn(items, out)
+        return out
+
+    if executor is None:
+        executor = get_default_executor()
+    futures = [
+        executor.submit(
+            fn, items[start : start + chunk_size], out[start : start + chunk_size]
+        )
+        for start in range(0, len(items), chunk_size)
+    ]
+    for future in futures:
+        future.result()
+    return out
+
+
+def get_legal_masks_parallel(
+    positions: Positions,
+    out: npt.NDArray[np.bool_] | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_]:
+    """
+    `get_legal_masks` split across the threads of `executor`, see `map_chunks`. Scales with the number of cores on
+    free-threaded builds; with the GIL, move generation is serialized.
+    """
+    if out is None:
+        out = np.empty((len(positions), ACTION_SPACE_SIZE), dtype=np.bool_)
+
+    def fn(chunk: Positions, out: npt.NDArray[np.bool_]) -> None:
+        get_legal_masks(chunk, out=out, ordering=ordering)
+
+    return map_chunks(fn, positions, out, executor, chunk_size)
+
+
+def uci_to_index_parallel(
+    ucis: UciStrings,
+    executor: Executor | None = None,
+    chunk_size: int = 1 << 16,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.int16]:
+    """
+    `uci_to_index` of a 1-D batch split across the threads of `executor`, see `map_chunks`. NumPy releases the GIL
+    for most of the work, so this scales on GIL builds too.
+    """
+    ucis = np.asarray(ucis)
+    out = np.empty(len(ucis), dtype=np.int16)
+
+    def fn(chunk: UciStrings, out: npt.NDArray[np.int16]) -> None:
+        out[:] = uci_to_index(chunk, ordering)
+
+    return map_chunks(fn, ucis, out, executor, chunk_size)
+
+
+class SharedMaskBuffer:
+    """
+    Legal masks of `num_positions` positions in a shared memory block that worker processes write into, see
+    `get_legal_masks_multiprocess`. `masks` is an `(N, ACTION_SPACE_SIZE)` boolean array, or with `packed=True` an
+    `(N, PACKED_MASK_SIZE)` `uint8` array of `np.packbits` rows.
+
+    The creating process owns the block: use the buffer as a context manager, or call `close` and `unlink`.
+    """
+
+    def __init__(self, num_positions: int, packed: bool = False) -> None:
+        self.packed = packed
+        shape = (num_positions, PACKED_MASK_SIZE if packed else ACTION_SPACE_SIZE)
+        # Empty shared memory blocks are not allowed
+        self.shm = SharedMemory(create=True, size=max(shape[0] * shape[1], 1))
+        self.masks: npt.NDArray[np.bool_] | npt.NDArray[np.uint8] = _get_masks_view(
+            self.shm, num_positions, packed
+        )
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        """Close this process's handle to the block. This fails while views of `masks` are still alive."""
+        del self.masks
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedMaskBuffer':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+        self.unlink()
+
+
+def _get_masks_view(
+    shm: SharedMemory, num_positions: int, packed: bool
+) -> npt.NDArray[Any]:
+    if packed:
+        return np.ndarray(
+            (num_positions, PACKED_MASK_SIZE), dtype=np.uint8, buffer=shm.buf
+        )
+    return np.ndarray(
+        (num_positions, ACTION_SPACE_SIZE), dtype=np.bool_, buffer=shm.buf
+    )
+
+
+def _write_legal_masks(
+    name: str,
+    num_positions: int,
+    packed: bool,
+    start: int,
+    positions: list[str] | npt.NDArray[np.uint64],
+    ordering: Ordering,
+) -> None:
+    """
+    Worker task: write the masks of `positions` (FENs or array form) into rows `start:` of the `SharedMaskBuffer`
+    named `name`.
+    """
+    boards: Positions = (
+        positions
+        if isinstance(positions, np.ndarray)
+        else [chess.Board(fen) for fen in positions]
+    )
+    shm = attach_shared_memory(name)
+    try:
+        masks = _get_masks_view(shm, num_positions, packed)
+        rows = masks[start : start + len(boards)]
+        if packed:
+            rows[:] = np.packbits(get_legal_masks(boards, ordering=ordering), axis=1)
+        else:
+            get_legal_masks(boards, out=rows, ordering=ordering)
+        del masks, rows
+    finally:
+        shm.close()
+
+
+def get_legal_masks_multiprocess(
+    positions: Sequence[chess.Board | str] | npt.NDArray[np.uint64],
+    out: SharedMaskBuffer | None = None,
+    executor: ProcessPoolExecutor | None = None,
+    chunk_size: int = 1024,
+    packed: bool = False,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> npt.NDArray[np.bool_] | npt.NDArray[np.uint8]:
+    """
+    `get_legal_masks` split across the processes of `executor` (a temporary pool of up to one process per CPU by
+    default), for builds with the GIL. Positions are sent to workers in array form (see `parse_fens`) or as FEN
+    strings (boards are converted, dropping their move stacks), and workers write their masks directly into a
+    `SharedMaskBuffer`, so no mask is pickled.
+
+    If `out` is given, the masks are written into it and `out.masks` is returned without copying; otherwise a
+    temporary buffer is used and the masks are copied out of it. With `packed=True` (ignored if `out` is given),
+    rows are packed with `np.packbits`.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+    if out is not None and len(out.masks) != len(positions):
+        raise ValueError(
+            f'Got a buffer of {len(out.masks)} masks for {len(positions)} positions'
+        )
+    items: list[str] | npt.NDArray[np.uint64] = (
+        positions
+        if isinstance(positions, np.ndarray)
+        else [
+            position if isinstance(position, str) else position.fen()
+            for position in positions
+        ]
+    )
+
+    if out is None:
+        with SharedMaskBuffer(len(items), packed) as buffer:
+            masks = get_legal_masks_multiprocess(
+                items, buffer, executor, chunk_size, ordering=ordering
+            )
+            result = masks.copy()
+            del masks
+        return result
+
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(
+            min(os.cpu_count() or 1, -(-len(items) // chunk_size) or 1)
+        )
+    try:
+        futures = [
+            executor.submit(
+                _write_legal_masks,
+                out.name,
+                len(items),
+                out.packed,
+                start,
+                items[start : start + chunk_size],
+                ordering,
+            )
+            for start in range(0, len(items), chunk_size)
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return out.masks
+
+
+__all__ = [
+    'DEFAULT_CHUNK_SIZE',
+    'SharedMaskBuffer',
+    'get_default_executor',
+    'get_legal_masks_multiprocess',
+    'get_legal_masks_parallel',
+    'map_chunks',
+    'uci_to_index_parallel',
+]
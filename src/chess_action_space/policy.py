@@ -0,0 +1,369 @@
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Literal, NamedTuple
+
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.encoding import (
+    TO_SQUARE_ACTIONS,
+    TO_SQUARE_OFFSETS,
+    _get_key_to_index,
+    get_board_move,
+)
+from chess_action_space.explicit import ACTION_SPACE_SIZE
+from chess_action_space.instrumentation import count_rows, instrumented
+from chess_action_space.orderings import (
+    DEFAULT_ORDERING,
+    Ordering,
+    get_inverse_permutation,
+)
+from chess_action_space.utils import get_move_key
+
+SPARSE_POLICY_DTYPE = np.dtype([('index', '<u2'), ('probability', '<f2')])
+"""
+The dtype of sparse policies: `(N, K)` arrays of `(action index, probability)` pairs of 4 bytes, sorted by
+decreasing probability and padded with `(0, 0)`. With explicit little-endian fields and a fixed width, a batch of
+sparse policies is a plain `.npy` file that can be memory-mapped, see `open_sparse_policies`.
+"""
+
+Visits = Mapping[chess.Move, float] | Iterable[tuple[chess.Move, float]]
+"""The visit count of every child of a search root, as a `Move -> count` mapping or `(move, count)` pairs."""
+
+
+def visits_to_arrays(
+    visits: Sequence[Visits], ordering: Ordering = DEFAULT_ORDERING
+) -> tuple[npt.NDArray[np.int16], npt.NDArray[np.float32], npt.NDArray[np.intp]]:
+    """
+    Convert the visit counts of `N` search roots to the `(indices, counts, offsets)` arrays taken by
+    `get_policy_targets`: the children of root `i` are `indices[offsets[i]:offsets[i + 1]]` (action indices, in
+    `ordering`) with visit counts `counts[offsets[i]:offsets[i + 1]]`.
+    """
+    lengths = np.zeros(len(visits) + 1, dtype=np.intp)
+    keys: list[int] = []
+    counts: list[float] = []
+    for i, root in enumerate(visits):
+        items = root.items() if isinstance(root, Mapping) else root
+        start = len(keys)
+        for move, count in items:
+            keys.append(get_move_key(move))
+            counts.append(count)
+        lengths[i + 1] = len(keys) - start
+    indices = _get_key_to_index(ordering)[keys]
+    if (indices < 0).any():
+        raise ValueError('Got visits of moves outside the action space')
+    return indices, np.array(counts, dtype=np.float32), np.cumsum(lengths)
+
+
+def _check_arrays(
+    indices: npt.NDArray[np.intp],
+    counts: npt.NDArray[np.float64],
+    offsets: npt.NDArray[np.intp],
+    temperature: float,
+) -> None:
+    if temperature < 0:
+        raise ValueError(f'temperature must be non-negative, got {temperature}')
+    if indices.shape != counts.shape or indices.ndim != 1:
+        raise ValueError(
+            f'Expected 1-D indices and counts of the same shape, got {indices.shape} and {counts.shape}'
+        )
+    if (
+        offsets.ndim != 1
+        or not len(offsets)
+        or offsets[0] != 0
+        or offsets[-1] != len(indices)
+        or (np.diff(offsets) < 0).any()
+    ):
+        raise ValueError(
+            f'offsets must increase from 0 to the number of children ({len(indices)})'
+        )
+    if len(indices) and (indices.min() < 0 or indices.max() >= ACTION_SPACE_SIZE):
+        raise ValueError('Got indices outside the action space')
+    if (counts < 0).any():
+        raise ValueError('Got negative visit counts')
+
+
+def _get_probabilities(
+    indices: npt.ArrayLike,
+    counts: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    temperature: float,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Return the root of every child, its action index, and its probability."""
+    indices = np.asarray(indices, dtype=np.intp)
+    counts = np.asarray(counts, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    _check_arrays(indices, counts, offsets, temperature)
+
+    num_roots = len(offsets) - 1
+    rows = np.repeat(np.arange(num_roots), np.diff(offsets))
+    # Scale by the largest count of each root, so that `counts ** (1 / temperature)` cannot overflow
+    row_max = np.zeros(num_roots)
+    np.maximum.at(row_max, rows, counts)
+    scaled = np.divide(
+        counts, row_max[rows], out=np.zeros_like(counts), where=row_max[rows] > 0
+    )
+    if temperature == 0:
+        # The most visited children, sharing the probability on ties
+        weights = (scaled == 1).astype(np.float64)
+    else:
+        weights = scaled ** (1 / temperature)
+    totals = np.bincount(rows, weights, minlength=num_roots)
+    probabilities = np.divide(
+        weights, totals[rows], out=np.zeros_like(weights), where=totals[rows] > 0
+    )
+    return rows, indices, probabilities
+
+
+@instrumented(count_rows)
+def get_policy_targets(
+    indices: npt.ArrayLike,
+    counts: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    temperature: float = 1.0,
+    out: npt.NDArray[np.float32] | None = None,
+) -> npt.NDArray[np.float32]:
+    """
+    Return the `(N, ACTION_SPACE_SIZE)` policy targets of `N` search roots from the visit counts of their children
+    (see `visits_to_arrays`): the probability of each child is proportional to `count ** (1 / temperature)`, and
+    with `temperature=0` the most visited children share all the probability. Roots without visits get all-zero
+    rows. The action indices of the children of a root must be distinct, and the policies are in their ordering.
+
+    If `out` is given, the targets are written into it and returned.
+    """
+    rows, indices, probabilities = _get_probabilities(
+        indices, counts, offsets, temperature
+    )
+    num_roots = len(np.asarray(offsets)) - 1
+    if out is None:
+        out = np.zeros((num_roots, ACTION_SPACE_SIZE), dtype=np.float32)
+    else:
+        out[:] = 0
+    out[rows, indices] = probabilities
+    return out
+
+
+@instrumented(count_rows)
+def get_top_k_policy_targets(
+    indices: npt.ArrayLike,
+    counts: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    k: int,
+    temperature: float = 1.0,
+) -> tuple[npt.NDArray[np.uint16], npt.NDArray[np.float32]]:
+    """
+    Like `get_policy_targets`, but keep only the `k` most probable children of each root and renormalize them.
+    Return `(N, k)` action indices and probabilities, sorted by decreasing probability. Roots with fewer than `k`
+    children of non-zero probability are padded with index `0` and probability `0`.
+    """
+    if k < 1:
+        raise ValueError(f'k must be positive, got {k}')
+    rows, indices, probabilities = _get_probabilities(
+        indices, counts, offsets, temperature
+    )
+    num_roots = len(np.asarray(offsets)) - 1
+
+    # Rank the children of each root by decreasing probability
+    order = np.lexsort((-probabilities, rows))
+    rows, indices, probabilities = rows[order], indices[order], probabilities[order]
+    ranks = np.arange(len(rows)) - np.asarray(offsets, dtype=np.intp)[rows]
+    kept = (ranks < k) & (probabilities > 0)
+    rows, ranks = rows[kept], ranks[kept]
+    totals = np.bincount(rows, probabilities[kept], minlength=num_roots)
+
+    top_indices = np.zeros((num_roots, k), dtype=np.uint16)
+    top_probabilities = np.zeros((num_roots, k), dtype=np.float32)
+    top_indices[rows, ranks] = indices[kept]
+    top_probabilities[rows, ranks] = np.divide(
+        probabilities[kept],
+        totals[rows],
+        out=np.zeros(len(rows)),
+        where=totals[rows] > 0,
+    )
+    return top_indices, top_probabilities
+
+
+def pack_sparse_policies(
+    indices: npt.ArrayLike, probabilities: npt.ArrayLike
+) -> npt.NDArray[np.void]:
+    """Pack `(N, K)` action indices and probabilities (see `get_top_k_policy_targets`) into sparse policies."""
+    indices = np.asarray(indices)
+    probabilities = np.asarray(probabilities)
+    if indices.shape != probabilities.shape or indices.ndim != 2:
+        raise ValueError(
+            f'Expected 2-D indices and probabilities of the same shape, got {indices.shape} and '
+            f'{probabilities.shape}'
+        )
+    sparse = np.empty(indices.shape, dtype=SPARSE_POLICY_DTYPE)
+    sparse['index'] = indices
+    sparse['probability'] = probabilities
+    return sparse
+
+
+@instrumented(count_rows)
+def dense_to_sparse_policies(
+    policies: npt.ArrayLike, k: int, normalize: bool = True
+) -> npt.NDArray[np.void]:
+    """
+    Convert `(N, ACTION_SPACE_SIZE)` dense policies to `(N, k)` sparse policies holding the `k` most probable
+    actions of each policy (actions of probability `0` are left out). With `normalize=True`, the kept probabilities
+    are rescaled to sum to `1`.
+    """
+    policies = np.asarray(policies, dtype=np.float32)
+    if policies.ndim != 2 or policies.shape[1] != ACTION_SPACE_SIZE:
+        raise ValueError(
+            f'Expected policies of shape (N, {ACTION_SPACE_SIZE}), got {policies.shape}'
+        )
+    if not 1 <= k <= ACTION_SPACE_SIZE:
+        raise ValueError(f'k must be between 1 and {ACTION_SPACE_SIZE}, got {k}')
+
+    top = np.argpartition(-policies, k - 1, axis=1)[:, :k]
+    probabilities = np.take_along_axis(policies, top, axis=1)
+    order = np.argsort(-probabilities, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1)
+    probabilities = np.take_along_axis(probabilities, order, axis=1)
+    if normalize:
+        totals = probabilities.sum(axis=1, keepdims=True)
+        np.divide(probabilities, totals, out=probabilities, where=totals > 0)
+    kept = probabilities > 0
+    return pack_sparse_policies(
+        np.where(kept, top, 0), np.where(kept, probabilities, 0)
+    )
+
+
+@instrumented(count_rows)
+def sparse_to_dense_policies(
+    sparse: npt.NDArray[np.void], out: npt.NDArray[np.float32] | None = None
+) -> npt.NDArray[np.float32]:
+    """
+    Convert `(N, K)` sparse policies to `(N, ACTION_SPACE_SIZE)` dense `float32` policies. If `out` is given, the
+    policies are written into it and returned.
+    """
+    if out is None:
+        out = np.zeros((len(sparse), ACTION_SPACE_SIZE), dtype=np.float32)
+    else:
+        out[:] = 0
+    probabilities = sparse['probability']
+    # Padding entries share index 0, so only scatter the actions that carry probability
+    rows, columns = np.nonzero(probabilities)
+    out[rows, sparse['index'][rows, columns]] = probabilities[rows, columns]
+    return out
+
+
+def open_sparse_policies(
+    path: str | os.PathLike[str],
+    mode: Literal['r', 'r+', 'w+'] = 'r',
+    shape: tuple[int, int] | None = None,
+) -> np.memmap:
+    """
+    Memory-map a `.npy` file of sparse policies, for example a replay buffer. With `mode='w+'`, a new file of
+    `shape` `(N, K)` is created, filled with padding.
+    """
+    if mode == 'w+':
+        if shape is None:
+            raise ValueError(
+                "A shape is required to create sparse policies with mode='w+'"
+            )
+        return np.lib.format.open_memmap(
+            path, mode='w+', dtype=SPARSE_POLICY_DTYPE, shape=shape
+        )
+    sparse = np.load(path, mmap_mode=mode, allow_pickle=False)
+    if sparse.dtype != SPARSE_POLICY_DTYPE or sparse.ndim != 2:
+        raise ValueError(f'"{path}" does not hold sparse policies')
+    return sparse
+
+
+class TopK(NamedTuple):
+    indices: npt.NDArray[np.int16]
+    """`(N, k)` action indices sorted by decreasing score, `-1` past the last legal action of a position."""
+    scores: npt.NDArray[np.floating]
+    """`(N, k)` scores of the actions, `-inf` past the last legal action of a position."""
+    moves: list[list[chess.Move]] | None
+    """The legal moves of the actions on each board, if boards were given."""
+
+
+@instrumented(count_rows)
+def topk_legal(
+    logits: npt.ArrayLike,
+    mask: npt.ArrayLike,
+    k: int,
+    boards: Sequence[chess.Board] | None = None,
+    ordering: Ordering = DEFAULT_ORDERING,
+) -> TopK:
+    """
+    Return the `k` legal actions with the highest `logits` (or probabilities) of each of `N` positions, given their
+    `(N, ACTION_SPACE_SIZE)` legal masks (see `get_legal_masks`). The selection uses `np.argpartition`, so only the
+    `k` selected actions of each position are sorted.
+
+    If `boards` are given, the actions are also decoded to their legal moves on the boards (see `get_board_move`),
+    with the logits and masks in `ordering`.
+    """
+    logits = np.asarray(logits)
+    mask = np.asarray(mask, dtype=np.bool_)
+    if logits.ndim != 2 or logits.shape[1] != ACTION_SPACE_SIZE:
+        raise ValueError(
+            f'Expected logits of shape (N, {ACTION_SPACE_SIZE}), got {logits.shape}'
+        )
+    if mask.shape != logits.shape:
+        raise ValueError(
+            f'Got a mask of shape {mask.shape} for logits of shape {logits.shape}'
+        )
+    if not 1 <= k <= ACTION_SPACE_SIZE:
+        raise ValueError(f'k must be between 1 and {ACTION_SPACE_SIZE}, got {k}')
+    if boards is not None and len(boards) != len(logits):
+        raise ValueError(f'Got {len(boards)} boards for {len(logits)} positions')
+
+    scores = np.where(mask, logits, -np.inf)
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+    legal = np.take_along_axis(mask, top, axis=1)
+    indices = np.where(legal, top, -1).astype(np.int16)
+
+    moves = None
+    if boards is not None:
+        moves = [
+            [get_board_move(board, index, ordering) for index in row if index >= 0]
+            for board, row in zip(boards, indices.tolist())
+        ]
+    return TopK(indices, top_scores, moves)
+
+
+def get_to_square_totals(
+    policies: npt.ArrayLike, ordering: Ordering = DEFAULT_ORDERING
+) -> npt.NDArray:
+    """
+    Sum `(..., ACTION_SPACE_SIZE)` policies (or any per-action values in `ordering`, ex. legal masks) over the
+    actions landing on every square, returning `(..., 64)` totals indexed by to-square. Boolean masks are counted.
+    """
+    values = np.asarray(policies)
+    if values.shape[-1:] != (ACTION_SPACE_SIZE,):
+        raise ValueError(
+            f'Expected policies of shape (..., {ACTION_SPACE_SIZE}), got {values.shape}'
+        )
+    if values.dtype == np.bool_:
+        values = values.astype(np.intp)
+    actions = TO_SQUARE_ACTIONS
+    if ordering != DEFAULT_ORDERING:
+        actions = get_inverse_permutation(ordering)[actions]
+    # Every square is reached by some action, so no segment of the grouped values is empty
+    return np.add.reduceat(values[..., actions], TO_SQUARE_OFFSETS[:-1], axis=-1)
+
+
+__all__ = [
+    'SPARSE_POLICY_DTYPE',
+    'TopK',
+    'Visits',
+    'dense_to_sparse_policies',
+    'get_policy_targets',
+    'get_to_square_totals',
+    'get_top_k_policy_targets',
+    'open_sparse_policies',
+    'pack_sparse_policies',
+    'sparse_to_dense_policies',
+    'topk_legal',
+    'visits_to_arrays',
+]
@@ -0,0 +1,182 @@
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.encoding import push_index
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, _check_ordering
+
+
+class SearchTree:
+    """
+    A search tree (ex. for MCTS) stored in preallocated pools of nodes and edges, as struct-of-arrays instead of
+    Python objects. Node `0` is the root.
+
+    Each expanded node owns a contiguous run of edges, one per legal move: `edge_action` holds the action index of
+    the move (see `ACTION_SPACE`), in `ordering`, and `edge_prior`, `edge_visits`, `edge_value_sum` its statistics. The value of an
+    edge is from the point of view of the player making the move. `edge_child` is the node reached by the edge, or
+    `-1` until it is first visited.
+
+    An edge takes 18 bytes and a node 10 bytes, so pools of millions of nodes fit in little memory. Raises
+    `IndexError` when a pool is full.
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = 1 << 16,
+        max_edges: int | None = None,
+        ordering: Ordering = DEFAULT_ORDERING,
+    ) -> None:
+        _check_ordering(ordering)
+        if max_nodes < 1:
+            raise ValueError(f'max_nodes must be positive, got {max_nodes}')
+        if max_edges is None:
+            max_edges = 32 * max_nodes
+
+        self.node_first_edge = np.zeros(max_nodes, dtype=np.int64)
+        self.node_num_edges = np.zeros(max_nodes, dtype=np.int16)
+        """The number of edges of every node, or `-1` if it is not expanded yet."""
+
+        self.edge_action = np.zeros(max_edges, dtype=np.uint16)
+        self.edge_prior = np.zeros(max_edges, dtype=np.float32)
+        self.edge_visits = np.zeros(max_edges, dtype=np.float32)
+        self.edge_value_sum = np.zeros(max_edges, dtype=np.float32)
+        self.edge_child = np.zeros(max_edges, dtype=np.int32)
+
+        self.ordering = ordering
+        self.num_nodes = 0
+        self.num_edges = 0
+        self.reset()
+
+    @property
+    def max_nodes(self) -> int:
+        return len(self.node_first_edge)
+
+    @property
+    def max_edges(self) -> int:
+        return len(self.edge_action)
+
+    def reset(self) -> None:
+        """Drop every node but a new unexpanded root. The pools are reused."""
+        self.num_nodes = 1
+        self.num_edges = 0
+        self.node_num_edges[0] = -1
+
+    def is_expanded(self, node: int) -> bool:
+        return bool(self.node_num_edges[node] >= 0)
+
+    def get_edges(self, node: int) -> slice:
+        """Return the slice of the edge arrays holding the edges of `node`."""
+        start = int(self.node_first_edge[node])
+        return slice(start, start + max(int(self.node_num_edges[node]), 0))
+
+    def expand(self, node: int, actions: npt.ArrayLike, priors: npt.ArrayLike) -> None:
+        """Add one edge per action index in `actions` to `node`, with the given prior probabilities."""
+        if self.is_expanded(node):
+            raise ValueError(f'Node {node} is already expanded')
+        actions = np.asarray(actions)
+        priors = np.asarray(priors)
+        if actions.shape != priors.shape or actions.ndim != 1:
+            raise ValueError(
+                f'Expected 1-D actions and priors of the same shape, got {actions.shape} and {priors.shape}'
+            )
+        start = self.num_edges
+        end = start + len(actions)
+        if end > self.max_edges:
+            raise IndexError(f'The edge pool is full ({self.max_edges} edges)')
+
+        self.edge_action[start:end] = actions
+        self.edge_prior[start:end] = priors
+        self.edge_visits[start:end] = 0
+        self.edge_value_sum[start:end] = 0
+        self.edge_child[start:end] = -1
+        self.node_first_edge[node] = start
+        self.node_num_edges[node] = len(actions)
+        self.num_edges = end
+
+    def expand_legal(
+        self, node: int, mask: npt.NDArray[np.bool_], policy: npt.NDArray[np.floating]
+    ) -> None:
+        """
+        Expand `node` with the legal actions of `mask` (see `get_legal_mask`), with priors taken from the
+        `(ACTION_SPACE_SIZE,)` `policy` and renormalized over the legal actions (uniform if they sum to `0`). `mask`
+        and `policy` must be in the `ordering` of the tree.
+        """
+        actions = np.flatnonzero(mask)
+        priors = np.asarray(policy, dtype=np.float32)[actions]
+        total = priors.sum()
+        if total > 0:
+            priors /= total
+        elif len(actions):
+            priors[:] = 1 / len(actions)
+        self.expand(node, actions, priors)
+
+    def select(self, node: int, c_puct: float = 1.5) -> int:
+        """Return the edge of the expanded `node` maximizing the PUCT score, unvisited edges having a value of `0`."""
+        edges = self.get_edges(node)
+        if edges.start == edges.stop:
+            raise ValueError(f'Node {node} has no edges')
+        visits = self.edge_visits[edges]
+        values = np.divide(
+            self.edge_value_sum[edges],
+            visits,
+            out=np.zeros_like(visits),
+            where=visits > 0,
+        )
+        exploration = (
+            c_puct * self.edge_prior[edges] * np.sqrt(visits.sum() + 1) / (1 + visits)
+        )
+        return edges.start + int(np.argmax(values + exploration))
+
+    def get_child(self, edge: int) -> int:
+        """Return the node reached by `edge`, adding an unexpanded node on first use."""
+        child = int(self.edge_child[edge])
+        if child >= 0:
+            return child
+        if self.num_nodes >= self.max_nodes:
+            raise IndexError(f'The node pool is full ({self.max_nodes} nodes)')
+        child = self.num_nodes
+        self.num_nodes += 1
+        self.node_num_edges[child] = -1
+        self.edge_child[edge] = child
+        return child
+
+    def descend(
+        self, board: chess.Board, c_puct: float = 1.5
+    ) -> tuple[int, npt.NDArray[np.int64]]:
+        """
+        Select edges from the root (whose position is `board`) down to an unexpanded node or a node without edges,
+        pushing their moves onto `board`. Return the leaf node and the edges of the path.
+        """
+        node = 0
+        path: list[int] = []
+        while self.node_num_edges[node] > 0:
+            edge = self.select(node, c_puct)
+            push_index(board, int(self.edge_action[edge]), self.ordering)
+            path.append(edge)
+            node = self.get_child(edge)
+        return node, np.array(path, dtype=np.int64)
+
+    def backup(self, path: npt.NDArray[np.int64], value: float) -> None:
+        """
+        Add a visit and `value` (from the point of view of the player to move at the end of `path`) to the edges of
+        `path`, flipping the sign of the value at every ply.
+        """
+        # The last edge was played by the opponent of the player to move at the leaf
+        signs = np.where(np.arange(len(path))[::-1] % 2 == 0, -1.0, 1.0)
+        self.edge_visits[path] += 1
+        self.edge_value_sum[path] += value * signs
+
+    def get_visit_counts(
+        self, node: int = 0
+    ) -> tuple[npt.NDArray[np.uint16], npt.NDArray[np.float32]]:
+        """
+        Return the action indices (in the `ordering` of the tree) and visit counts of the edges of `node`, as taken
+        by `get_policy_targets` (with `offsets = [0, len(actions)]`).
+        """
+        edges = self.get_edges(node)
+        return self.edge_action[edges].copy(), self.edge_visits[edges].copy()
+
+
+__all__ = [
+    'SearchTree',
+]
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+_PACKAGE_DIR = Path(__file__).parent
+
+DATA_DIR = _PACKAGE_DIR / 'data'
+"""The directory holding the prebuilt tables, see `chess_action_space.generate`."""
+
+MANIFEST_PATH = DATA_DIR / 'manifest.json'
+"""Map from the path of every generated artifact (relative to the package) to the SHA-256 of its content."""
+
+SHARED_MEMORY_ENV_VAR = 'CHESS_ACTION_SPACE_SHM'
+"""
+If set to the name of a block created by `publish_tables`, every table is loaded from that shared memory block
+instead of from the package data. `publish_tables` sets it, so worker processes started afterwards attach
+automatically.
+
+Only the prebuilt NumPy tables (`data/*.npy`) are shared. The Python objects derived from them are still built in
+every process: the `chess.Move` tuple `ACTION_SPACE`, the tuples behind the scalar lookups (interned moves, move key
+to action index) and the tables of non-default orderings.
+"""
+
+MMAP_ENV_VAR = 'CHESS_ACTION_SPACE_MMAP'
+"""
+If set to a non-empty value, tables are memory-mapped read-only from the package data instead of copied into each
+process, so all processes share the same pages of the OS page cache. Like with `SHARED_MEMORY_ENV_VAR`, only the
+prebuilt NumPy tables are shared.
+"""
+
+_ALIGNMENT = 64
+
+_attached_tables: 'SharedTables | None' = None
+_attach_lock = threading.Lock()
+_register_lock = threading.Lock()
+
+
+def get_checksum(content: bytes) -> str:
+    """Return the checksum recorded in the manifest for an artifact with the given content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_table_names() -> list[str]:
+    """Return the names of all prebuilt tables, see `load_table`."""
+    return sorted(
+        Path(path).stem
+        for path in load_manifest()
+        if path.startswith('data/') and path.endswith('.npy')
+    )
+
+
+def _load_table_file(name: str) -> npt.NDArray:
+    mmap_mode: Literal['r'] | None = 'r' if os.environ.get(MMAP_ENV_VAR) else None
+    table = np.load(DATA_DIR / f'{name}.npy', mmap_mode=mmap_mode, allow_pickle=False)
+    table.flags.writeable = False
+    return table
+
+
+def load_table(name: str) -> npt.NDArray:
+    """
+    Load the prebuilt table `data/<name>.npy` as a read-only array. See `SHARED_MEMORY_ENV_VAR` and `MMAP_ENV_VAR`
+    to share tables between processes.
+    """
+    global _attached_tables
+
+    shared_memory_name = os.environ.get(SHARED_MEMORY_ENV_VAR)
+    if not shared_memory_name:
+        return _load_table_file(name)
+
+    with _attach_lock:
+        if _attached_tables is None or _attached_tables.name != shared_memory_name:
+            _attached_tables = attach_tables(shared_memory_name)
+        return _attached_tables.tables[name]
+
+
+def load_manifest() -> dict[str, str]:
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def get_stale_artifacts() -> list[str]:
+    """
+    Return the paths of generated artifacts whose content does not match the checksum in the manifest (or which are
+    missing). Regenerate them with `python -m chess_action_space.generate`.
+    """
+    stale = []
+    for path, checksum in load_manifest().items():
+        artifact_path = _PACKAGE_DIR / path
+        if (
+            not artifact_path.exists()
+            or get_checksum(artifact_path.read_bytes()) != checksum
+        ):
+            stale.append(path)
+    return stale
+
+
+def _align(n: int) -> int:
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+class SharedTables:
+    """
+    All prebuilt tables stored in a single shared memory block, see `publish_tables` and `attach_tables`.
+
+    The block starts with an 8-byte little-endian header length and a JSON header mapping each table name to its
+    offset (relative to the aligned end of the header), dtype and shape, followed by the table data.
+    """
+
+    def __init__(self, shm: SharedMemory) -> None:
+        self.shm = shm
+
+        buf = shm.buf
+        assert buf is not None
+        header_size = int.from_bytes(buf[:8], 'little')
+        header = json.loads(bytes(buf[8 : 8 + header_size]))
+        data_start = _align(8 + header_size)
+
+        self.tables: dict[str, npt.NDArray] = {}
+        """Read-only views into the shared memory block, keyed by table name."""
+        for name, (offset, dtype, shape) in header.items():
+            table: npt.NDArray = np.ndarray(
+                shape, dtype=np.dtype(dtype), buffer=buf, offset=data_start + offset
+            )
+            table.flags.writeable = False
+            self.tables[name] = table
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        """
+        Close this process's handle to the block. This fails while arrays viewing the block are still alive.
+        """
+        self.tables = {}
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block once every process has closed it. Only the publishing process should call this."""
+        self.shm.unlink()
+
+
+def publish_tables(name: str | None = None, export: bool = True) -> SharedTables:
+    """
+    Copy every prebuilt table into a new shared memory block named `name` (or a random name), and return it.
+    If `export` is `True`, set `SHARED_MEMORY_ENV_VAR` so that worker processes started from now on load their
+    tables from the block instead of the package data. The Python objects derived from the tables are still built by
+    every worker, see `SHARED_MEMORY_ENV_VAR`.
+
+    The caller owns the block and must `unlink` it once the workers are done.
+    """
+    tables = {
+        table_name: _load_table_file(table_name) for table_name in get_table_names()
+    }
+
+    header: dict[str, tuple[int, str, tuple[int, ...]]] = {}
+    data_size = 0
+    for table_name, table in tables.items():
+        header[table_name] = (data_size, table.dtype.str, table.shape)
+        data_size += _align(table.nbytes)
+    header_bytes = json.dumps(header).encode()
+    data_start = _align(8 + len(header_bytes))
+
+    shm = SharedMemory(name=name, create=True, size=data_start + data_size)
+    buf = shm.buf
+    assert buf is not None
+    buf[:8] = len(header_bytes).to_bytes(8, 'little')
+    buf[8 : 8 + len(header_bytes)] = header_bytes
+    for table_name, table in tables.items():
+        start = data_start + header[table_name][0]
+        buf[start : start + table.nbytes] = np.ascontiguousarray(table).tobytes()
+
+    if export:
+        os.environ[SHARED_MEMORY_ENV_VAR] = shm.name
+    return SharedTables(shm)
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attach to the existing shared memory block `name` without taking ownership of it: the block survives this
+    process and must be unlinked by its creator. The block is not registered with the resource tracker, whatever the
+    start method of this process.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Before Python 3.13, attaching registers the block with the resource tracker, which destroys it when this
+    # process exits. Unregistering it afterwards is not an option: processes started by the creator (with any start
+    # method on POSIX) share its tracker, and would drop the registration of the creator. So the registration is
+    # skipped, like `track=False` does
+    with _register_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def attach_tables(name: str) -> SharedTables:
+    """
+    Attach to the shared memory block published by `publish_tables` under `name`.
+    """
+    return SharedTables(attach_shared_memory(name))
+
+
+__all__ = [
+    'DATA_DIR',
+    'MANIFEST_PATH',
+    'MMAP_ENV_VAR',
+    'SHARED_MEMORY_ENV_VAR',
+    'SharedTables',
+    'attach_shared_memory',
+    'attach_tables',
+    'get_checksum',
+    'get_stale_artifacts',
+    'get_table_names',
+    'load_manifest',
+    'load_table',
+    'publish_tables',
+]
@@ -0,0 +1,58 @@
+import chess
+import numpy as np
+import numpy.typing as npt
+
+from chess_action_space.encoding import push_index
+from chess_action_space.masks import get_legal_mask
+from chess_action_space.orderings import DEFAULT_ORDERING, Ordering, _check_ordering
+
+
+class LegalMaskTracker:
+    """
+    Cache the legal masks of a `chess.Board` across `push`/`pop` of action indices, for search and self-play code
+    that walks a game one move at a time.
+
+    Masks are computed with `get_legal_mask` when `mask` is first read for a position and remembered per ply, so
+    `pop` restores the previous mask without recomputing it, and positions whose mask is never read cost nothing.
+
+    Pushed action indices and masks are in `ordering`. The wrapped board must only be modified through the tracker.
+    """
+
+    def __init__(
+        self, board: chess.Board | None = None, ordering: Ordering = DEFAULT_ORDERING
+    ) -> None:
+        _check_ordering(ordering)
+        self.board = chess.Board() if board is None else board
+        self.ordering = ordering
+        self._masks: list[npt.NDArray[np.bool_] | None] = [None]
+        """The mask of every ply, `None` until it is read."""
+
+    @property
+    def mask(self) -> npt.NDArray[np.bool_]:
+        """The read-only legal mask of the current position, see `get_legal_mask`."""
+        mask = self._masks[-1]
+        if mask is None:
+            mask = self._masks[-1] = get_legal_mask(self.board, ordering=self.ordering)
+            mask.flags.writeable = False
+        return mask
+
+    def push(self, index: int) -> chess.Move:
+        """
+        Push the action `index` (a non-promotion pawn move to the back rank is a queen promotion) and return the
+        pushed move. Legality is not checked.
+        """
+        move = push_index(self.board, index, self.ordering)
+        self._masks.append(None)
+        return move
+
+    def pop(self) -> chess.Move:
+        """Undo the last pushed action, restoring the previous mask, and return the popped move."""
+        if len(self._masks) == 1:
+            raise IndexError('pop from a tracker without pushed actions')
+        self._masks.pop()
+        return self.board.pop()
+
+
+__all__ = [
+    'LegalMaskTracker',
+]
@@ -1,5 +1,25 @@
+from enum import IntEnum
+
 import chess
 
+from chess_action_space.instrumentation import instrumented
+
+MOVE_KEY_SPACE_SIZE = 1 << 15
+"""
+The number of distinct move keys, see `get_move_key`. Keys use 6 bits for each square and 3 bits for the promotion
+piece type.
+"""
+
+
+@instrumented()
+def get_move_key(move: chess.Move) -> int:
+    """
+    Return the canonical integer key `from_square | to_square << 6 | promotion << 12` of `move`, where `promotion`
+    is `0` for non-promotions. Unlike the action index, the key of a queen promotion differs from the key of the
+    corresponding non-promotion move. Drops are not supported.
+    """
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
 
 def get_possible_to_squares_mask(from_square: chess.Square) -> chess.Bitboard:
     b = chess.BaseBoard.empty()
@@ -21,6 +41,30 @@ def get_possible_to_squares_mask(from_square: chess.Square) -> chess.Bitboard:
     return all_moves
 
 
+class ActionCategory(IntEnum):
+    """How the from-square and the to-square of an action are aligned, see `get_action_category`."""
+
+    KNIGHT = 0
+    ORTHOGONAL = 1
+    DIAGONAL = 2
+
+
+def get_action_category(
+    from_square: chess.Square, to_square: chess.Square
+) -> ActionCategory:
+    """
+    Return whether a move from `from_square` to `to_square` is a knight move, or a slide along a rank or file or
+    along a diagonal. Only the squares of a slide can be blocked, see `chess.between`.
+    """
+    file_distance = abs(chess.square_file(from_square) - chess.square_file(to_square))
+    rank_distance = abs(chess.square_rank(from_square) - chess.square_rank(to_square))
+    if file_distance == rank_distance:
+        return ActionCategory.DIAGONAL
+    if not file_distance or not rank_distance:
+        return ActionCategory.ORTHOGONAL
+    return ActionCategory.KNIGHT
+
+
 def can_be_pawn_promotion(from_square: chess.Square, to_square: chess.Square) -> bool:
     from_rank = chess.square_rank(from_square)
     to_rank = chess.square_rank(to_square)
@@ -0,0 +1,16 @@
+from collections.abc import Callable
+
+import chess
+import pytest
+
+from chess_action_space import _testing
+
+
+@pytest.fixture(scope='session')
+def random_boards() -> Callable[..., list[chess.Board]]:
+    return _testing.random_boards
+
+
+@pytest.fixture(scope='session')
+def random_games() -> Callable[..., list[chess.Board]]:
+    return _testing.random_games
@@ -0,0 +1,87 @@
+import pickle
+
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE_SIZE,
+    ActionStatistics,
+    get_action_index,
+    get_legal_masks,
+)
+
+
+def _get_expected(games: list[chess.Board]) -> ActionStatistics:
+    """Count everything one position at a time, with Python loops."""
+    expected = ActionStatistics()
+    for game in games:
+        board = game.root()
+        for move in game.move_stack:
+            action = get_action_index(move)
+            legal = {get_action_index(legal_move) for legal_move in board.legal_moves}
+            expected.num_positions += 1
+            expected.play_counts[action] += 1
+            expected.legal_move_counts[len(legal)] += 1
+            for index in legal:
+                expected.legal_counts[index] += 1
+                if index != action:
+                    expected.not_chosen_counts[index] += 1
+            board.push(move)
+    return expected
+
+
+def _assert_equal(stats: ActionStatistics, expected: ActionStatistics) -> None:
+    assert stats.num_positions == expected.num_positions
+    assert np.array_equal(stats.play_counts, expected.play_counts)
+    assert np.array_equal(stats.legal_counts, expected.legal_counts)
+    assert np.array_equal(stats.not_chosen_counts, expected.not_chosen_counts)
+    assert np.array_equal(stats.legal_move_counts, expected.legal_move_counts)
+
+
+class TestActionStatistics:
+    @pytest.mark.parametrize('batch_size', [1, 7, 4096])
+    def test_update_games(self, batch_size, random_games):
+        games = random_games(20)
+        stats = ActionStatistics()
+        stats.update_games(games, batch_size)
+        _assert_equal(stats, _get_expected(games))
+        assert stats.num_positions == sum(len(game.move_stack) for game in games)
+
+    def test_merge(self, random_games):
+        games = random_games(20)
+        first, second = ActionStatistics(), ActionStatistics()
+        first.update_games(games[:8])
+        second.update_games(games[8:])
+        _assert_equal(first + second, _get_expected(games))
+        merged = pickle.loads(pickle.dumps(first))
+        merged.merge(second)
+        _assert_equal(merged, _get_expected(games))
+
+    def test_update(self):
+        board = chess.Board()
+        masks = get_legal_masks([board, board])
+        e4 = get_action_index(chess.Move.from_uci('e2e4'))
+        stats = ActionStatistics()
+        stats.update([e4, e4], masks)
+        assert stats.play_counts[e4] == 2 and stats.not_chosen_counts[e4] == 0
+        assert stats.legal_move_counts[20] == 2
+        rates = stats.get_play_rates()
+        assert rates[e4] == 1
+        assert rates.sum() == 1
+
+        # An action outside the mask is counted as played but not as legal
+        stats.update([0], np.zeros((1, ACTION_SPACE_SIZE), dtype=np.bool_))
+        assert stats.play_counts[0] == 1 and stats.legal_counts[0] == 0
+        assert stats.legal_move_counts[0] == 1
+
+    def test_invalid(self):
+        stats = ActionStatistics()
+        with pytest.raises(ValueError, match='Expected'):
+            stats.update([0, 1], np.zeros((1, ACTION_SPACE_SIZE), dtype=np.bool_))
+        with pytest.raises(ValueError, match='Action indices'):
+            stats.update(
+                [ACTION_SPACE_SIZE], np.zeros((1, ACTION_SPACE_SIZE), dtype=np.bool_)
+            )
+        with pytest.raises(ValueError, match='batch_size'):
+            stats.update_games([], 0)
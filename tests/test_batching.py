@@ -0,0 +1,78 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    AsyncBatcher,
+    AsyncLegalMaskBatcher,
+    get_board_move,
+    get_legal_mask,
+    get_legal_masks,
+)
+
+
+def _stand_in_model(boards: list[chess.Board]) -> list[chess.Move]:
+    """Pick the legal action with the highest fake logit for every board."""
+    masks = get_legal_masks(boards)
+    logits = np.arange(masks.shape[1], dtype=np.float32)
+    indices = np.where(masks, logits, -np.inf).argmax(axis=1)
+    return [get_board_move(board, int(i)) for board, i in zip(boards, indices)]
+
+
+class TestAsyncBatcher:
+    def test_batches_concurrent_requests(self, random_boards):
+        boards = random_boards(50)
+        batch_sizes = []
+
+        def model(batch: list[chess.Board]) -> list[chess.Move]:
+            batch_sizes.append(len(batch))
+            return _stand_in_model(batch)
+
+        async def main() -> list[chess.Move]:
+            batcher = AsyncBatcher(model, max_batch_size=16, max_delay_us=10_000)
+            return await asyncio.gather(*(batcher.submit(board) for board in boards))
+
+        moves = asyncio.run(main())
+        assert moves == _stand_in_model(boards)
+        assert batch_sizes == [16, 16, 16, 2]
+
+    def test_exception_propagates(self):
+        def model(batch: list[int]) -> list[int]:
+            raise RuntimeError('model failed')
+
+        async def main() -> None:
+            batcher = AsyncBatcher(model)
+            await asyncio.gather(batcher.submit(1), batcher.submit(2))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
+
+    def test_legal_mask_batcher_with_executor(self, random_boards):
+        boards = random_boards(20)
+
+        async def main() -> list[np.ndarray]:
+            with ThreadPoolExecutor(1) as executor:
+                batcher = AsyncLegalMaskBatcher(max_batch_size=8, executor=executor)
+                return await asyncio.gather(
+                    *(batcher.get_legal_mask(board) for board in boards)
+                )
+
+        masks = asyncio.run(main())
+        for board, mask in zip(boards, masks):
+            assert np.array_equal(mask, get_legal_mask(board))
+
+    def test_legal_mask_batcher_ordering(self, random_boards):
+        boards = random_boards(20)
+
+        async def main() -> list[np.ndarray]:
+            batcher = AsyncLegalMaskBatcher(max_batch_size=8, ordering='to_square')
+            return await asyncio.gather(
+                *(batcher.get_legal_mask(board) for board in boards)
+            )
+
+        masks = asyncio.run(main())
+        for board, mask in zip(boards, masks):
+            assert np.array_equal(mask, get_legal_mask(board, ordering='to_square'))
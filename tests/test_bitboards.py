@@ -0,0 +1,88 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    get_board_array,
+    get_board_from_array,
+    get_board_move,
+    get_boards_array,
+    get_legal_mask,
+    get_legal_masks,
+    parse_epds,
+    parse_fens,
+)
+
+
+class TestParseFens:
+    def test_matches_boards(self, random_boards):
+        fens = [board.fen() for board in random_boards(500)]
+        boards = [chess.Board(fen) for fen in fens]
+        assert np.array_equal(parse_fens(fens), get_boards_array(boards))
+
+    @pytest.mark.parametrize(
+        'fen',
+        [
+            # Castling rights without the rooks or the king in place are cleaned
+            '4k3/8/8/8/8/8/8/R3K1R1 w KQkq - 3 40',
+            'r3k2r/8/8/8/8/8/8/R4K1R w KQkq - 0 1',
+            # Shredder-FEN castling rights
+            'r3k2r/8/8/8/8/8/8/R3K2R b HAha - 0 1',
+            # Missing parts and a fullmove number of 0
+            '4k3/8/8/8/8/8/8/4K3',
+            'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3',
+            '4k3/8/8/8/8/8/8/4K3 w - - 0 0',
+        ],
+    )
+    def test_edge_cases(self, fen):
+        assert np.array_equal(parse_fens([fen])[0], get_board_array(chess.Board(fen)))
+
+    @pytest.mark.parametrize(
+        'fen',
+        [
+            '',
+            '4k3/8/8/8/8/8/8/4K2',
+            '4k3/8/8/8/8/8/8/4K4',
+            '4k3/8/8/8/8/8/8//4K3',
+            '4k3/8/8/8/8/8/4K3',
+            '4k3/8/8/8/8/8/8/4X3 w - - 0 1',
+            '4k3/8/8/8/8/8/8/4K3 x - - 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w KX - 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - e9 0 1',
+            '4k3/8/8/8/8/8/8/4K3 w - - -1 1',
+            '4k3/8/8/8/8/8/8/4K3 w - - 0 x',
+            '4k3/8/8/8/8/8/8/4K3 w - - 0 1 extra',
+        ],
+    )
+    def test_invalid(self, fen):
+        with pytest.raises(ValueError):
+            chess.Board(fen)
+        with pytest.raises(ValueError):
+            parse_fens([chess.STARTING_FEN, fen])
+
+    def test_epds(self):
+        epds = [
+            'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 bm e5; id "x";',
+            '4k3/8/8/8/8/8/8/4K3 w - - hmvc 12; fmvn 40;',
+        ]
+        expected = get_boards_array([chess.Board.from_epd(epd)[0] for epd in epds])
+        assert np.array_equal(parse_epds(epds), expected)
+
+
+class TestArrayPositions:
+    def test_round_trip(self, random_boards):
+        for board in random_boards(100):
+            copy = get_board_from_array(get_board_array(board))
+            assert copy.fen() == board.fen()
+
+    def test_legal_masks_from_arrays(self, random_boards):
+        boards = random_boards(300)
+        positions = parse_fens([board.fen() for board in boards])
+        assert np.array_equal(get_legal_masks(positions), get_legal_masks(boards))
+
+    def test_board_move_from_array(self):
+        board = chess.Board('8/4P3/8/8/8/8/8/k6K w - - 0 1')
+        mask = get_legal_mask(board)
+        array = get_board_array(board)
+        for index in np.flatnonzero(mask).tolist():
+            assert get_board_move(array, index) == get_board_move(board, index)
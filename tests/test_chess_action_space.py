@@ -1,7 +1,12 @@
+import importlib
+import subprocess
+import sys
 from copy import copy
 
 import chess
+import pytest
 
+import chess_action_space
 from chess_action_space import (
     get_action_space_size,
     iter_action_space,
@@ -124,3 +129,24 @@ class TestUtils:
                 assert move_knight_promo not in action_space_moves
                 assert move_bishop_promo not in action_space_moves
                 assert move_rook_promo not in action_space_moves
+
+
+class TestPackage:
+    def test_public_names(self):
+        for name in chess_action_space.__all__:
+            assert hasattr(chess_action_space, name), name
+        assert set(chess_action_space.__all__) <= set(dir(chess_action_space))
+        for name, module in chess_action_space._LAZY_ATTRIBUTES.items():
+            submodule = importlib.import_module(f'chess_action_space.{module}')
+            assert getattr(chess_action_space, name) is getattr(submodule, name)
+        with pytest.raises(AttributeError):
+            chess_action_space.does_not_exist  # noqa: B018
+
+    def test_import_loads_no_table(self):
+        code = (
+            'import sys, chess_action_space; '
+            'assert "chess_action_space.encoding" not in sys.modules; '
+            'chess_action_space.ACTION_UCI; '
+            'assert "chess_action_space.encoding" in sys.modules'
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,201 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE,
+    MOVE_KEY_SPACE_SIZE,
+    TO_SQUARE_ACTIONS,
+    TO_SQUARE_OFFSETS,
+    get_action,
+    get_action_index,
+    get_board_move,
+    get_incoming_actions,
+    get_interned_move,
+    get_move_from_key,
+    get_move_key,
+    index_to_uci,
+    indices_to_keys,
+    intern_move,
+    keys_to_indices,
+    keys_to_uci,
+    pop_index,
+    pop_indices,
+    push_index,
+    push_indices,
+    uci_to_index,
+    uci_to_keys,
+)
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        for i, move in enumerate(ACTION_SPACE):
+            assert get_action_index(move) == i
+            assert get_action(i) is move
+
+    def test_queen_promotion_shares_index(self):
+        assert get_action_index(chess.Move.from_uci('e7e8q')) == get_action_index(
+            chess.Move.from_uci('e7e8')
+        )
+
+    def test_not_in_action_space(self):
+        with pytest.raises(ValueError):
+            get_action_index(chess.Move.from_uci('e2e2'))
+        with pytest.raises(ValueError):
+            get_action_index(chess.Move.from_uci('e2e4n'))
+
+
+class TestInterning:
+    def test_returns_shared_instances(self):
+        for move in ACTION_SPACE:
+            fresh = chess.Move(move.from_square, move.to_square, move.promotion)
+            assert intern_move(fresh) is move
+
+    def test_queen_promotions_are_interned(self):
+        move = get_interned_move(chess.E7, chess.E8, chess.QUEEN)
+        assert move == chess.Move.from_uci('e7e8q')
+        assert get_interned_move(chess.E7, chess.E8, chess.QUEEN) is move
+
+    def test_not_in_action_space(self):
+        with pytest.raises(ValueError):
+            get_interned_move(chess.E4, chess.E5, chess.QUEEN)
+
+    @pytest.mark.parametrize(
+        'from_square, to_square, promotion',
+        [(0, 1, 9), (0, 1, chess.KING), (0, 1, 0), (64, 1, None), (0, -1, None)],
+    )
+    def test_invalid_arguments(self, from_square, to_square, promotion):
+        with pytest.raises(ValueError, match='Invalid move'):
+            get_interned_move(from_square, to_square, promotion)
+
+
+class TestMoveKeys:
+    def test_round_trip(self):
+        indices = np.arange(len(ACTION_SPACE))
+        keys = indices_to_keys(indices)
+        assert np.array_equal(keys_to_indices(keys), indices)
+        for key, move in zip(keys.tolist(), ACTION_SPACE):
+            assert key == get_move_key(move)
+            assert get_move_from_key(key) is move
+
+    def test_queen_promotion_key(self):
+        move = chess.Move.from_uci('b2a1q')
+        key = get_move_key(move)
+        assert key != get_move_key(chess.Move.from_uci('b2a1'))
+        assert keys_to_indices([key])[0] == get_action_index(move)
+        assert get_move_from_key(key) == move
+
+    def test_outside_action_space(self):
+        keys = [0, -1, MOVE_KEY_SPACE_SIZE, get_move_key(chess.Move.from_uci('e2e4q'))]
+        assert np.array_equal(keys_to_indices(keys), [-1, -1, -1, -1])
+        with pytest.raises(ValueError):
+            get_move_from_key(0)
+
+    def test_uci_keys(self):
+        ucis = [move.uci() for move in ACTION_SPACE] + ['e7e8q']
+        keys = uci_to_keys(ucis)
+        assert keys.tolist() == [get_move_key(chess.Move.from_uci(u)) for u in ucis]
+        assert keys_to_uci(keys).tolist() == [u.encode() for u in ucis]
+        assert np.array_equal(uci_to_keys(np.array(ucis, dtype='S5')), keys)
+
+    def test_malformed_uci(self):
+        ucis = ['', 'e2', 'e2e9', 'i2e4', 'e2e4x', 'e2e4qq', '0000', 'e7e8Q']
+        assert uci_to_keys(ucis).tolist() == [-1] * len(ucis)
+
+
+class TestUciCodec:
+    def test_round_trip(self):
+        indices = np.arange(len(ACTION_SPACE))
+        ucis = index_to_uci(indices)
+        assert ucis.tolist() == [move.uci().encode() for move in ACTION_SPACE]
+        assert np.array_equal(uci_to_index(ucis), indices)
+        assert np.array_equal(uci_to_index(ucis.astype(str).tolist()), indices)
+
+    def test_queen_promotion_alias(self):
+        assert (
+            uci_to_index(['a2a1q', 'a2a1']).tolist()
+            == [get_action_index(chess.Move.from_uci('a2a1'))] * 2
+        )
+
+    def test_invalid(self):
+        assert uci_to_index(['a1b4', 'e2e4q', 'xyz']).tolist() == [-1, -1, -1]
+
+    @pytest.mark.parametrize('index', [-1, -len(ACTION_SPACE), len(ACTION_SPACE)])
+    def test_out_of_range_indices(self, index):
+        with pytest.raises(IndexError):
+            index_to_uci([0, index])
+        with pytest.raises(IndexError):
+            indices_to_keys([index])
+        with pytest.raises(IndexError):
+            get_action(index)
+        with pytest.raises(IndexError):
+            get_board_move(chess.Board(), index)
+        with pytest.raises(IndexError):
+            push_indices([chess.Board()], [index])
+        with pytest.raises(IndexError):
+            index_to_uci(uci_to_index(['xyz']))
+
+
+class TestIncomingActions:
+    def test_csr_tables(self):
+        assert TO_SQUARE_OFFSETS[0] == 0 and TO_SQUARE_OFFSETS[-1] == len(ACTION_SPACE)
+        assert np.array_equal(np.sort(TO_SQUARE_ACTIONS), np.arange(len(ACTION_SPACE)))
+        for square in chess.SQUARES:
+            actions = get_incoming_actions(square)
+            assert not actions.flags.writeable
+            assert actions.tolist() == [
+                index
+                for index, move in enumerate(ACTION_SPACE)
+                if move.to_square == square
+            ]
+
+    def test_ordering(self):
+        moves = [
+            get_action(index, 'to_square')
+            for index in get_incoming_actions(chess.E4, 'to_square')
+        ]
+        assert moves == [get_action(index) for index in get_incoming_actions(chess.E4)]
+
+
+class TestPushIndex:
+    def test_push_pop(self):
+        board = chess.Board()
+        index = get_action_index(chess.Move.from_uci('g1f3'))
+        move = push_index(board, index)
+        assert move is get_action(index)
+        assert board.peek() == move
+        assert pop_index(board) == index
+        assert board == chess.Board()
+
+    def test_pop_outside_action_space(self):
+        board = chess.Board()
+        board.push(chess.Move.null())
+        with pytest.raises(ValueError):
+            pop_index(board)
+        assert board.move_stack == [chess.Move.null()]
+
+        board = chess.Board()
+        board.push_uci('e2e4')
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            pop_index(board, 'nope')  # type: ignore[arg-type]
+        assert len(board.move_stack) == 1
+
+    def test_implied_queen_promotion(self):
+        board = chess.Board('8/8/8/8/8/8/1p6/k1K5 b - - 0 1')
+        move = push_index(board, get_action_index(chess.Move.from_uci('b2b1')))
+        assert move is get_interned_move(chess.B2, chess.B1, chess.QUEEN)
+        assert get_board_move(board, get_action_index(chess.Move.from_uci('c1b1'))) == (
+            chess.Move.from_uci('c1b1')
+        )
+        assert pop_index(board) == get_action_index(chess.Move.from_uci('b2b1'))
+
+    def test_batched(self):
+        boards = [chess.Board() for _ in range(3)]
+        ucis = ['e2e4', 'd2d4', 'g1f3']
+        indices = uci_to_index(ucis)
+        moves = push_indices(boards, indices)
+        assert [move.uci() for move in moves] == ucis
+        assert np.array_equal(pop_indices(boards), indices)
+        with pytest.raises(ValueError):
+            push_indices(boards, indices[:2])
@@ -0,0 +1,65 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    BoardColumn,
+    VectorEnv,
+    get_action_index,
+    get_board_array,
+    get_legal_mask,
+)
+
+
+class TestVectorEnv:
+    def test_reset(self):
+        env = VectorEnv()
+        result = env.reset(4)
+        assert result.observations.shape == (4, len(BoardColumn))
+        assert np.array_equal(result.observations[0], get_board_array(chess.Board()))
+        assert np.array_equal(result.masks[3], get_legal_mask(chess.Board()))
+        assert not result.dones.any()
+
+    @pytest.mark.parametrize(('num_envs', 'num_steps'), [(8, 200), (64, 70)])
+    def test_random_games(self, num_envs, num_steps):
+        # 64 games use the vectorized move generator
+        rng = np.random.default_rng(0)
+        env = VectorEnv(max_plies=60)
+        result = env.reset(num_envs)
+        num_dones = 0
+        for _ in range(num_steps):
+            scores = np.where(result.masks, rng.random(result.masks.shape), -1.0)
+            result = env.step(scores.argmax(axis=1))
+            num_dones += int(result.dones.sum())
+            for board, observation, mask in zip(
+                env.boards, result.observations, result.masks
+            ):
+                assert np.array_equal(observation, get_board_array(board))
+                assert np.array_equal(mask, get_legal_mask(board))
+        assert num_dones >= num_envs
+
+    def test_checkmate(self):
+        env = VectorEnv()
+        env.reset(2)
+        for uci in ('f2f3', 'e7e5', 'g2g4'):
+            result = env.step([get_action_index(chess.Move.from_uci(uci))] * 2)
+        result = env.step([get_action_index(chess.Move.from_uci('d8h4'))] * 2)
+        assert result.dones.all()
+        assert result.rewards.tolist() == [1, 1]
+        assert all(board == chess.Board() for board in env.boards)
+
+    def test_illegal_action(self):
+        env = VectorEnv()
+        env.reset(1)
+        with pytest.raises(ValueError):
+            env.step([get_action_index(chess.Move.from_uci('e2e5'))])
+
+    def test_ordering(self):
+        rng = np.random.default_rng(0)
+        env = VectorEnv(max_plies=30, ordering='direction')
+        result = env.reset(4)
+        for _ in range(40):
+            scores = np.where(result.masks, rng.random(result.masks.shape), -1.0)
+            result = env.step(scores.argmax(axis=1))
+            for board, mask in zip(env.boards, result.masks):
+                assert np.array_equal(mask, get_legal_mask(board, ordering='direction'))
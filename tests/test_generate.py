@@ -0,0 +1,59 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+
+from chess_action_space import ACTION_KEYS, ACTION_SPACE, get_move_key
+from chess_action_space.generate import build_artifacts, build_manifest
+from chess_action_space.tables import (
+    _PACKAGE_DIR,
+    MANIFEST_PATH,
+    get_stale_artifacts,
+    load_manifest,
+)
+
+
+class TestGeneratedArtifacts:
+    def test_manifest_matches_files(self):
+        assert get_stale_artifacts() == []
+
+    def test_artifacts_up_to_date(self):
+        artifacts = build_artifacts()
+        assert sorted(artifacts) == sorted(load_manifest())
+        for path, content in artifacts.items():
+            assert (_PACKAGE_DIR / path).read_bytes() == content, (
+                f'{path} is stale, run `python -m chess_action_space.generate`'
+            )
+        assert MANIFEST_PATH.read_bytes() == build_manifest(artifacts)
+
+    def test_loaded_tables_match_action_space(self):
+        assert not ACTION_KEYS.flags.writeable
+        assert np.array_equal(
+            ACTION_KEYS, [get_move_key(move) for move in ACTION_SPACE]
+        )
+
+    def test_generate_without_artifacts(self, tmp_path):
+        package_dir = tmp_path / 'chess_action_space'
+        shutil.copytree(
+            _PACKAGE_DIR, package_dir, ignore=shutil.ignore_patterns('__pycache__')
+        )
+        artifacts = sorted(load_manifest())
+        for path in [*artifacts, 'data/manifest.json']:
+            (package_dir / path).unlink()
+
+        env = {**os.environ, 'PYTHONPATH': str(tmp_path)}
+        for name in ('CHESS_ACTION_SPACE_SHM', 'CHESS_ACTION_SPACE_MMAP'):
+            env.pop(name, None)
+        subprocess.run(
+            [sys.executable, '-m', 'chess_action_space.generate'],
+            cwd=tmp_path,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        for path in [*artifacts, 'data/manifest.json']:
+            assert (package_dir / path).read_bytes() == (
+                _PACKAGE_DIR / path
+            ).read_bytes()
@@ -0,0 +1,113 @@
+import multiprocessing
+import time
+
+import chess
+import pytest
+
+import chess_action_space
+from chess_action_space import get_action, get_legal_masks, masks
+from chess_action_space.instrumentation import (
+    INSTRUMENTATION_ENV_VAR,
+    CallStats,
+    count_rows,
+    disable,
+    enable,
+    instrumented,
+    is_enabled,
+    reset,
+    snapshot,
+)
+
+
+def _get_worker_snapshot(queue: multiprocessing.Queue) -> None:
+    from chess_action_space import get_action_index, get_legal_masks, uci_to_index
+    from chess_action_space.instrumentation import snapshot
+
+    board = chess.Board()
+    get_legal_masks([board, board, board])
+    for move in board.legal_moves:
+        get_action_index(move)
+    uci_to_index(['e2e4', 'g1f3'])
+    queue.put(snapshot())
+
+
+@pytest.fixture
+def enabled():
+    reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+        reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        assert not is_enabled()
+        reset()
+        get_action(0)
+        get_legal_masks([chess.Board()])
+        assert snapshot() == {}
+
+    def test_instrumented(self, enabled):
+        @instrumented(count_rows)
+        def _double_all(values: list[int]) -> list[int]:
+            return [2 * value for value in values]
+
+        assert _double_all([1, 2, 3]) == [2, 4, 6]
+        _double_all([4])
+        stats = snapshot()[f'{__name__}.{_double_all.__qualname__}']
+        assert (stats.calls, stats.items) == (2, 4)
+        assert stats.seconds >= 0
+        reset()
+        assert snapshot() == {}
+
+    def test_enable_disable(self, enabled):
+        chess_action_space.get_action(0)
+        disable()
+        assert not hasattr(chess_action_space.get_action, '__wrapped__')
+        assert not hasattr(masks.get_move_key, '__wrapped__')
+        chess_action_space.get_action(0)
+        enable()
+        chess_action_space.get_legal_masks([chess.Board()])
+        stats = snapshot()
+        assert stats['chess_action_space.encoding.get_action'].calls == 1
+        assert stats['chess_action_space.masks.get_legal_masks'].calls == 1
+        # References imported by other modules of the package are replaced too
+        assert stats['chess_action_space.utils.get_move_key'].calls == 20
+
+    def test_nested_self_time(self, enabled):
+        @instrumented()
+        def _inner(fail: bool) -> None:
+            time.sleep(0.05)
+            if fail:
+                raise ValueError
+
+        @instrumented()
+        def _outer() -> None:
+            _inner(False)
+            with pytest.raises(ValueError):
+                _inner(True)
+
+        _outer()
+        stats = {name.rsplit('.', 1)[-1]: value for name, value in snapshot().items()}
+        assert stats['_inner'].calls == 1
+        assert stats['_inner'].seconds >= 0.05
+        assert stats['_outer'].calls == 1
+        assert stats['_outer'].seconds < 0.05
+
+    def test_spawned_process(self, monkeypatch):
+        monkeypatch.setenv(INSTRUMENTATION_ENV_VAR, '1')
+        ctx = multiprocessing.get_context('spawn')
+        queue = ctx.Queue()
+        process = ctx.Process(target=_get_worker_snapshot, args=(queue,))
+        process.start()
+        stats = queue.get(timeout=60)
+        process.join()
+        assert process.exitcode == 0
+        get_legal_masks_stats = stats['chess_action_space.masks.get_legal_masks']
+        assert (get_legal_masks_stats.calls, get_legal_masks_stats.items) == (1, 3)
+        assert stats['chess_action_space.encoding.get_action_index'].calls == 20
+        uci_to_index_stats = stats['chess_action_space.encoding.uci_to_index']
+        assert uci_to_index_stats == CallStats(1, uci_to_index_stats.seconds, 2)
@@ -0,0 +1,101 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE,
+    LegalMaskCache,
+    get_action_index,
+    get_legal_action_indices,
+    get_legal_mask,
+)
+
+
+class TestLegalMask:
+    def test_matches_legal_moves(self, random_boards):
+        for board in random_boards(200):
+            expected = sorted({get_action_index(move) for move in board.legal_moves})
+            assert get_legal_action_indices(board).tolist() == expected
+            mask = get_legal_mask(board)
+            assert np.flatnonzero(mask).tolist() == expected
+
+    def test_promotions(self):
+        board = chess.Board('8/4P3/8/8/8/8/8/k6K w - - 0 1')
+        ucis = {ACTION_SPACE[i].uci() for i in get_legal_action_indices(board)}
+        assert {'e7e8', 'e7e8n', 'e7e8b', 'e7e8r'} <= ucis
+
+    def test_out(self):
+        out = np.ones(len(ACTION_SPACE), dtype=np.bool_)
+        board = chess.Board()
+        assert get_legal_mask(board, out=out) is out
+        assert out.sum() == 20
+
+
+class TestLegalMaskCache:
+    @pytest.mark.parametrize('storage', ['indices', 'bitset'])
+    def test_matches_uncached(self, storage, random_boards):
+        cache = LegalMaskCache(storage=storage)
+        for board in random_boards(100) * 2:
+            assert np.array_equal(
+                cache.get_legal_action_indices(board), get_legal_action_indices(board)
+            )
+            assert np.array_equal(cache.get_legal_mask(board), get_legal_mask(board))
+        info = cache.cache_info()
+        assert info.misses == len(cache)
+        assert info.hits == 400 - info.misses
+
+    def test_transpositions_hit(self):
+        cache = LegalMaskCache()
+        a = chess.Board()
+        for uci in ('g1f3', 'g8f6', 'b1c3'):
+            a.push_uci(uci)
+        b = chess.Board()
+        for uci in ('b1c3', 'g8f6', 'g1f3'):
+            b.push_uci(uci)
+        cache.get_legal_mask(a)
+        cache.get_legal_mask(b)
+        assert cache.cache_info().hits == 1
+
+    def test_key(self):
+        cache = LegalMaskCache()
+        board = chess.Board('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1')
+        variants = [
+            board,
+            chess.Board('r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1'),
+            chess.Board('r3k2r/8/8/8/8/8/8/R3K2R w kq - 0 1'),
+        ]
+        for variant in variants:
+            assert np.array_equal(
+                cache.get_legal_mask(variant), get_legal_mask(variant)
+            )
+        assert cache.cache_info().misses == 3
+        # The move counters are not part of the key
+        cache.get_legal_mask(chess.Board('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 7 20'))
+        assert cache.cache_info().hits == 1
+
+    @pytest.mark.parametrize('storage', ['indices', 'bitset'])
+    def test_ordering(self, storage, random_boards):
+        cache = LegalMaskCache(storage=storage, ordering='direction')
+        for board in random_boards(20) * 2:
+            assert np.array_equal(
+                cache.get_legal_action_indices(board),
+                get_legal_action_indices(board, 'direction'),
+            )
+            assert np.array_equal(
+                cache.get_legal_mask(board), get_legal_mask(board, ordering='direction')
+            )
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            LegalMaskCache(ordering='nope')
+
+    def test_lru_eviction(self, random_boards):
+        cache = LegalMaskCache(maxsize=2)
+        a, b, c = random_boards(3)
+        cache.get_legal_mask(a)
+        cache.get_legal_mask(b)
+        cache.get_legal_mask(a)
+        cache.get_legal_mask(c)
+        assert len(cache) == 2
+        cache.get_legal_mask(a)
+        assert cache.hits == 2
+        cache.get_legal_mask(b)
+        assert cache.misses == 4
@@ -0,0 +1,212 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_BETWEEN,
+    ACTION_CATEGORY,
+    ACTION_SPACE,
+    ACTION_SPACE_SIZE,
+    PIECE_ACTION_MASKS,
+    ActionCategory,
+    get_action_index,
+    get_boards_array,
+    get_candidate_masks,
+    get_legal_masks,
+    get_legal_masks_vectorized,
+    get_piece_action_mask,
+    get_pseudo_legal_masks,
+    get_unobstructed_masks,
+    parse_fens,
+    to_ordering,
+)
+
+EDGE_CASE_FENS = [
+    # En passant: legal, discovered check along the rank, pinned capturer, capturing a checking pawn
+    '4k3/8/8/2pP4/8/8/8/4K2B w - c6 0 1',
+    '8/8/8/KPp4r/8/8/8/7k w - c6 0 1',
+    '8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1',
+    '8/8/3k4/8/2pP4/8/8/3K4 b - d3 0 1',
+    '8/8/8/1k6/2pP4/8/8/7K b - d3 0 1',
+    # Castling: free, through attacked squares, in check, and Shredder-FEN rights
+    'r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1',
+    'r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1',
+    'r3k2r/8/8/8/8/5n2/8/R3K2R w KQkq - 0 1',
+    'r3k2r/8/8/8/4r3/8/8/R3K2R w KQkq - 0 1',
+    '1r2k2r/8/8/8/8/8/8/R3K2R b HAh - 0 1',
+    # Promotions, pins and double check
+    '4k3/1P6/8/8/8/8/6p1/4K2R w K - 0 1',
+    '4k3/1P6/8/8/8/8/6p1/4K2R b K - 0 1',
+    '4k3/8/8/8/1b6/8/3P4/4K3 w - - 0 1',
+    'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+    'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+    '4k3/8/8/8/8/5n2/8/4K2r w - - 0 1',
+    # Checkmate, stalemate, a missing king and several kings
+    'r1bqkbnr/pppp1ppp/2n5/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 0 1',
+    'k7/8/1Q6/8/8/8/8/7K b - - 0 1',
+    '4k3/8/8/8/8/8/8/8 w - - 0 1',
+    'K7/8/8/8/8/8/8/KQ5k w - - 0 1',
+]
+
+
+def _get_expected_masks(boards: list[chess.Board], pseudo_legal: bool) -> np.ndarray:
+    masks = np.zeros((len(boards), ACTION_SPACE_SIZE), dtype=np.bool_)
+    for i, board in enumerate(boards):
+        moves = board.pseudo_legal_moves if pseudo_legal else board.legal_moves
+        masks[i, [get_action_index(move) for move in moves]] = True
+    return masks
+
+
+class TestMovegen:
+    @pytest.mark.parametrize('pseudo_legal', [False, True])
+    def test_random_positions(self, pseudo_legal, random_boards):
+        boards = random_boards(2000)
+        fn = get_pseudo_legal_masks if pseudo_legal else get_legal_masks_vectorized
+        masks = fn(get_boards_array(boards))
+        assert np.array_equal(masks, _get_expected_masks(boards, pseudo_legal))
+
+    @pytest.mark.parametrize('pseudo_legal', [False, True])
+    @pytest.mark.parametrize('fen', EDGE_CASE_FENS)
+    def test_edge_cases(self, fen, pseudo_legal):
+        board = chess.Board(fen)
+        fn = get_pseudo_legal_masks if pseudo_legal else get_legal_masks_vectorized
+        masks = fn(parse_fens([fen]))
+        assert np.array_equal(masks, _get_expected_masks([board], pseudo_legal))
+
+    def test_out(self, random_boards):
+        boards = random_boards(10)
+        out = np.ones((len(boards), ACTION_SPACE_SIZE), dtype=np.bool_)
+        result = get_legal_masks_vectorized(get_boards_array(boards), out=out)
+        assert result is out
+        assert np.array_equal(out, get_legal_masks(boards))
+
+    def test_empty(self):
+        positions = parse_fens([])
+        assert get_legal_masks_vectorized(positions).shape == (0, ACTION_SPACE_SIZE)
+        assert get_pseudo_legal_masks(positions).shape == (0, ACTION_SPACE_SIZE)
+
+
+class TestUnobstructedMasks:
+    def test_tables(self):
+        assert not ACTION_BETWEEN.flags.writeable
+        for i, move in enumerate(ACTION_SPACE):
+            between = chess.between(move.from_square, move.to_square)
+            assert ACTION_BETWEEN[i] == between
+            if ACTION_CATEGORY[i] == ActionCategory.KNIGHT:
+                assert between == 0
+                assert chess.square_distance(move.from_square, move.to_square) == 2
+
+    def test_matches_piece_moves(self, random_boards):
+        # The unobstructed actions with free to-squares matching the category of the piece on the from-square are
+        # exactly the pseudo-legal moves of knights and sliders
+        boards = random_boards(200)
+        occupied = [board.occupied for board in boards]
+        targets = [~board.occupied_co[board.turn] & chess.BB_ALL for board in boards]
+        masks = get_unobstructed_masks(occupied, targets)
+        expected = np.zeros_like(masks)
+        for i, board in enumerate(boards):
+            pieces = board.knights | board.bishops | board.rooks | board.queens
+            for move in board.generate_pseudo_legal_moves(pieces):
+                expected[i, get_action_index(move)] = True
+            categories = {
+                chess.KNIGHT: [ActionCategory.KNIGHT],
+                chess.BISHOP: [ActionCategory.DIAGONAL],
+                chess.ROOK: [ActionCategory.ORTHOGONAL],
+                chess.QUEEN: [ActionCategory.DIAGONAL, ActionCategory.ORTHOGONAL],
+            }
+            for square in chess.SquareSet(pieces & board.occupied_co[board.turn]):
+                piece_type = board.piece_type_at(square)
+                for action in np.flatnonzero(masks[i]):
+                    move = ACTION_SPACE[action]
+                    if move.from_square == square and move.promotion is None:
+                        if ACTION_CATEGORY[action] in categories[piece_type]:
+                            assert expected[i, action], move
+                            expected[i, action] = False
+            assert not expected[i].any()
+
+
+def _get_ucis(mask: np.ndarray) -> set[str]:
+    return {ACTION_SPACE[action].uci() for action in np.flatnonzero(mask)}
+
+
+class TestPieceActionMasks:
+    def test_tables(self):
+        assert PIECE_ACTION_MASKS.shape == (2, 7, ACTION_SPACE_SIZE)
+        assert not PIECE_ACTION_MASKS.flags.writeable
+        assert not PIECE_ACTION_MASKS[:, 0].any()
+        # Every action is a move of some piece, and only pawns underpromote
+        assert PIECE_ACTION_MASKS.any(axis=(0, 1)).all()
+        underpromotions = [move.promotion is not None for move in ACTION_SPACE]
+        assert np.array_equal(
+            PIECE_ACTION_MASKS[:, chess.PAWN].any(axis=0) & underpromotions,
+            underpromotions,
+        )
+        assert not PIECE_ACTION_MASKS[:, chess.KNIGHT :, underpromotions].any()
+
+    def test_pieces(self):
+        assert _get_ucis(get_piece_action_mask(chess.PAWN, chess.WHITE, chess.E2)) == {
+            'e2e3',
+            'e2e4',
+            'e2d3',
+            'e2f3',
+        }
+        assert _get_ucis(get_piece_action_mask(chess.PAWN, chess.BLACK, chess.E2)) == {
+            'e2e1',
+            'e2d1',
+            'e2f1',
+            *(f'e2{to}{piece}' for to in ('e1', 'd1', 'f1') for piece in 'nbr'),
+        }
+        for square in chess.SquareSet(chess.BB_BACKRANKS):
+            for color in chess.COLORS:
+                assert not get_piece_action_mask(chess.PAWN, color, square).any()
+        assert _get_ucis(
+            get_piece_action_mask(chess.KNIGHT, chess.BLACK, chess.G1)
+        ) == {
+            'g1e2',
+            'g1f3',
+            'g1h3',
+        }
+        assert 'e1g1' in _get_ucis(
+            get_piece_action_mask(chess.KING, chess.WHITE, chess.E1)
+        )
+        assert 'e1g1' not in _get_ucis(
+            get_piece_action_mask(chess.KING, chess.BLACK, chess.E1)
+        )
+        rook = get_piece_action_mask(chess.ROOK, chess.WHITE)
+        assert all(ACTION_CATEGORY[np.flatnonzero(rook)] == ActionCategory.ORTHOGONAL)
+        assert np.array_equal(
+            get_piece_action_mask(chess.QUEEN, chess.WHITE, chess.D1, 'direction'),
+            to_ordering(
+                get_piece_action_mask(chess.QUEEN, chess.WHITE, chess.D1), 'direction'
+            ),
+        )
+
+    def test_no_double_push_from_back_rank(self):
+        # Pawns never stand on the back ranks, but positions in array form can still hold them
+        board = chess.Board('4k3/8/8/8/8/8/8/3KP3 w - - 0 1')
+        mask = get_pseudo_legal_masks(get_boards_array([board]))[0]
+        assert 'e1e2' in _get_ucis(mask)
+        assert 'e1e3' not in _get_ucis(mask)
+
+    def test_candidate_masks(self, random_boards):
+        boards = random_boards(512) + [chess.Board(fen) for fen in EDGE_CASE_FENS]
+        positions = get_boards_array(boards)
+        candidates = get_candidate_masks(positions)
+        pseudo_legal = get_pseudo_legal_masks(positions)
+        assert not (pseudo_legal & ~candidates).any()
+
+        for board, mask in zip(boards[:32], candidates):
+            expected = np.zeros(ACTION_SPACE_SIZE, dtype=np.bool_)
+            for square, piece in board.piece_map(
+                mask=board.occupied_co[board.turn]
+            ).items():
+                expected |= get_piece_action_mask(piece.piece_type, piece.color, square)
+            assert np.array_equal(mask, expected)
+
+        out = np.ones_like(candidates)
+        assert get_candidate_masks(positions, out) is out
+        assert np.array_equal(out, candidates)
+        assert np.array_equal(
+            get_candidate_masks(positions, ordering='to_square'),
+            to_ordering(candidates, 'to_square'),
+        )
@@ -0,0 +1,132 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE,
+    ACTION_SPACE_SIZE,
+    ACTION_UCI,
+    ORDERINGS,
+    from_ordering,
+    get_action,
+    get_action_index,
+    get_board_move,
+    get_boards_array,
+    get_inverse_permutation,
+    get_legal_action_indices,
+    get_legal_mask,
+    get_legal_masks,
+    get_permutation,
+    get_pseudo_legal_masks,
+    get_unobstructed_masks,
+    index_to_uci,
+    indices_to_keys,
+    keys_to_indices,
+    pop_index,
+    push_index,
+    to_ordering,
+    topk_legal,
+    uci_to_index,
+)
+
+
+class TestOrderings:
+    @pytest.mark.parametrize('ordering', ORDERINGS)
+    def test_permutations(self, ordering):
+        permutation = get_permutation(ordering)
+        inverse = get_inverse_permutation(ordering)
+        assert not permutation.flags.writeable and not inverse.flags.writeable
+        assert np.array_equal(np.sort(permutation), np.arange(ACTION_SPACE_SIZE))
+        assert np.array_equal(inverse[permutation], np.arange(ACTION_SPACE_SIZE))
+
+    def test_layouts(self):
+        assert np.array_equal(
+            get_permutation('from_square'), np.arange(ACTION_SPACE_SIZE)
+        )
+
+        to_squares = [ACTION_SPACE[i].to_square for i in get_permutation('to_square')]
+        assert to_squares == sorted(to_squares)
+
+        promotions = [
+            ACTION_SPACE[i].promotion for i in get_permutation('underpromotions_last')
+        ]
+        assert promotions.index(chess.KNIGHT) == ACTION_SPACE_SIZE - 132
+        assert None not in promotions[-132:]
+
+        direction = [ACTION_SPACE[i].uci() for i in get_permutation('direction')]
+        assert direction[:8] == [f'{file}1{file}2' for file in 'abcdefgh']
+        assert direction[-1] == 'h7g8r'
+
+    def test_unknown_ordering(self):
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            get_permutation('nope')
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            get_action_index(ACTION_SPACE[0], 'nope')
+
+    @pytest.mark.parametrize('ordering', ORDERINGS)
+    def test_reorder(self, ordering):
+        values = np.random.default_rng(0).random((3, ACTION_SPACE_SIZE))
+        reordered = to_ordering(values, ordering)
+        assert np.array_equal(reordered, values[:, get_permutation(ordering)])
+        assert np.array_equal(from_ordering(reordered, ordering), values)
+
+
+class TestOrderedEncoding:
+    @pytest.mark.parametrize('ordering', ORDERINGS)
+    def test_scalar(self, ordering):
+        inverse = get_inverse_permutation(ordering)
+        for index, move in enumerate(ACTION_SPACE):
+            position = get_action_index(move, ordering)
+            assert position == inverse[index]
+            assert get_action(position, ordering) is move
+
+        board = chess.Board('4k3/1P6/8/8/8/8/8/4K3 w - - 0 1')
+        queen_promotion = chess.Move.from_uci('b7b8q')
+        position = get_action_index(queen_promotion, ordering)
+        assert get_board_move(board, position, ordering) == queen_promotion
+        assert push_index(board, position, ordering) == queen_promotion
+        assert pop_index(board, ordering) == position
+
+    @pytest.mark.parametrize('ordering', ORDERINGS)
+    def test_vectorized(self, ordering):
+        positions = get_inverse_permutation(ordering)
+        assert np.array_equal(uci_to_index(ACTION_UCI, ordering), positions)
+        assert np.array_equal(index_to_uci(positions, ordering), ACTION_UCI)
+        keys = indices_to_keys(positions, ordering)
+        assert np.array_equal(keys_to_indices(keys, ordering), positions)
+        assert np.array_equal(keys_to_indices([-1, 0, 1 << 15], ordering), [-1, -1, -1])
+
+
+class TestOrderedMasks:
+    @pytest.mark.parametrize('ordering', ORDERINGS)
+    def test_masks(self, ordering, random_boards):
+        boards = random_boards(256)
+        positions = get_boards_array(boards)
+        expected = to_ordering(get_legal_masks(boards), ordering)
+        assert np.array_equal(get_legal_masks(boards, ordering=ordering), expected)
+        assert np.array_equal(get_legal_masks(positions, ordering=ordering), expected)
+        assert np.array_equal(get_legal_mask(boards[0], ordering=ordering), expected[0])
+        assert np.array_equal(
+            get_legal_action_indices(boards[0], ordering), np.flatnonzero(expected[0])
+        )
+        assert np.array_equal(
+            get_pseudo_legal_masks(positions, ordering=ordering),
+            to_ordering(get_pseudo_legal_masks(positions), ordering),
+        )
+        occupied = [board.occupied for board in boards]
+        assert np.array_equal(
+            get_unobstructed_masks(occupied, ordering=ordering),
+            to_ordering(get_unobstructed_masks(occupied), ordering),
+        )
+
+    def test_topk_legal(self, random_boards):
+        boards = random_boards(16)
+        mask = get_legal_masks(boards, ordering='direction')
+        logits = np.random.default_rng(0).random(mask.shape)
+        top = topk_legal(logits, mask, 4, boards, ordering='direction')
+        assert top.moves is not None
+        for board, row, moves in zip(boards, top.indices, top.moves):
+            assert moves == [
+                get_board_move(board, index, 'direction') for index in row if index >= 0
+            ]
+            assert all(board.is_legal(move) for move in moves)
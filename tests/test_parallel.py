@@ -0,0 +1,128 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_UCI,
+    SharedMaskBuffer,
+    get_legal_masks,
+    get_legal_masks_multiprocess,
+    get_legal_masks_parallel,
+    parse_fens,
+    to_ordering,
+    uci_to_index,
+    uci_to_index_parallel,
+)
+from chess_action_space.encoding import ACTION_KEYS, KEY_TO_ACTION_INDEX
+from chess_action_space.parallel import map_chunks
+
+
+class TestParallel:
+    @pytest.mark.parametrize('num_threads', [1, 4])
+    def test_legal_masks_match_serial(self, num_threads, random_boards):
+        boards = random_boards(300)
+        with ThreadPoolExecutor(num_threads) as executor:
+            masks = get_legal_masks_parallel(boards, executor=executor, chunk_size=32)
+        assert np.array_equal(masks, get_legal_masks(boards))
+
+    def test_default_executor_and_out(self, random_boards):
+        boards = random_boards(100)
+        out = np.ones((100, len(ACTION_UCI)), dtype=np.bool_)
+        assert get_legal_masks_parallel(boards, out=out, chunk_size=7) is out
+        assert np.array_equal(out, get_legal_masks(boards))
+
+    def test_uci_to_index(self):
+        ucis = np.concatenate([ACTION_UCI, [b'e7e8q', b'xx', b'a1b4']] * 10)
+        indices = uci_to_index_parallel(ucis, chunk_size=100)
+        assert np.array_equal(indices, uci_to_index(ucis))
+
+    def test_ordering(self, random_boards):
+        boards = random_boards(100)
+        masks = get_legal_masks_parallel(boards, chunk_size=16, ordering='direction')
+        assert np.array_equal(masks, to_ordering(get_legal_masks(boards), 'direction'))
+        indices = uci_to_index_parallel(
+            ACTION_UCI, chunk_size=100, ordering='to_square'
+        )
+        assert np.array_equal(indices, uci_to_index(ACTION_UCI, 'to_square'))
+
+    def test_map_chunks_errors(self):
+        with pytest.raises(ValueError):
+            map_chunks(lambda items, out: None, [1, 2], np.empty(3))
+        with pytest.raises(ValueError):
+            map_chunks(lambda items, out: None, [1, 2], np.empty(2), chunk_size=0)
+
+    def test_tables_are_read_only(self):
+        for table in (ACTION_KEYS, ACTION_UCI, KEY_TO_ACTION_INDEX):
+            with pytest.raises(ValueError):
+                table[0] = 0
+
+
+class TestMultiprocess:
+    def test_masks_match_serial(self, random_boards):
+        boards = random_boards(300)
+        expected = get_legal_masks(boards)
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(2, mp_context=ctx) as executor:
+            masks = get_legal_masks_multiprocess(
+                boards, executor=executor, chunk_size=64
+            )
+            assert np.array_equal(masks, expected)
+
+            fens = [board.fen() for board in boards]
+            packed = get_legal_masks_multiprocess(
+                fens, executor=executor, chunk_size=64, packed=True
+            )
+            assert np.array_equal(packed, np.packbits(expected, axis=1))
+
+            with SharedMaskBuffer(len(boards)) as buffer:
+                masks = get_legal_masks_multiprocess(
+                    fens, out=buffer, executor=executor, chunk_size=100
+                )
+                assert masks is buffer.masks
+                assert np.array_equal(masks, expected)
+                del masks
+
+            positions = parse_fens(fens)
+            masks = get_legal_masks_multiprocess(
+                positions, executor=executor, chunk_size=64
+            )
+            assert np.array_equal(masks, expected)
+
+            packed = get_legal_masks_multiprocess(
+                positions,
+                executor=executor,
+                chunk_size=64,
+                packed=True,
+                ordering='underpromotions_last',
+            )
+            assert np.array_equal(
+                packed,
+                np.packbits(to_ordering(expected, 'underpromotions_last'), axis=1),
+            )
+
+    @pytest.mark.skipif(
+        'fork' not in multiprocessing.get_all_start_methods(),
+        reason='requires the fork start method',
+    )
+    @pytest.mark.filterwarnings(
+        'ignore:This process .* is multi-threaded:DeprecationWarning'
+    )
+    def test_fork_start_method(self, random_boards):
+        boards = random_boards(100)
+        ctx = multiprocessing.get_context('fork')
+        with (
+            ProcessPoolExecutor(2, mp_context=ctx) as executor,
+            SharedMaskBuffer(len(boards)) as buffer,
+        ):
+            masks = get_legal_masks_multiprocess(
+                boards, out=buffer, executor=executor, chunk_size=32
+            )
+            assert np.array_equal(masks, get_legal_masks(boards))
+            del masks
+
+    def test_buffer_length_mismatch(self):
+        with SharedMaskBuffer(2) as buffer, pytest.raises(ValueError):
+            get_legal_masks_multiprocess([chess.STARTING_FEN], out=buffer)
@@ -0,0 +1,276 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE,
+    ACTION_SPACE_SIZE,
+    SPARSE_POLICY_DTYPE,
+    dense_to_sparse_policies,
+    get_action_index,
+    get_legal_masks,
+    get_policy_targets,
+    get_to_square_totals,
+    get_top_k_policy_targets,
+    open_sparse_policies,
+    pack_sparse_policies,
+    sparse_to_dense_policies,
+    to_ordering,
+    topk_legal,
+    visits_to_arrays,
+)
+
+
+def _get_visits() -> list[dict[chess.Move, int]]:
+    board = chess.Board()
+    moves = list(board.legal_moves)
+    return [
+        {move: i + 1 for i, move in enumerate(moves)},
+        {},
+        {moves[0]: 0, moves[1]: 0},
+        {moves[3]: 5, moves[4]: 5, moves[5]: 1},
+    ]
+
+
+def _get_expected(visits: dict[chess.Move, int], temperature: float) -> np.ndarray:
+    policy = np.zeros(ACTION_SPACE_SIZE)
+    counts = np.array(list(visits.values()), dtype=np.float64)
+    if counts.sum() == 0:
+        return policy
+    if temperature == 0:
+        weights = (counts == counts.max()).astype(np.float64)
+    else:
+        weights = counts ** (1 / temperature)
+    for move, weight in zip(visits, weights):
+        policy[get_action_index(move)] = weight / weights.sum()
+    return policy
+
+
+class TestPolicyTargets:
+    def test_visits_to_arrays(self):
+        visits = _get_visits()
+        indices, counts, offsets = visits_to_arrays(visits)
+        assert offsets.tolist() == [0, 20, 20, 22, 25]
+        assert indices[20:22].tolist() == [get_action_index(move) for move in visits[2]]
+        assert counts[22:].tolist() == [5, 5, 1]
+        # Pairs work like mappings
+        pairs = [list(root.items()) for root in visits]
+        for a, b in zip(visits_to_arrays(pairs), (indices, counts, offsets)):
+            assert np.array_equal(a, b)
+
+    def test_visits_to_arrays_ordering(self):
+        visits = _get_visits()
+        indices, counts, offsets = visits_to_arrays(visits, 'to_square')
+        moves = [move for root in visits for move in root]
+        assert indices.tolist() == [
+            get_action_index(move, 'to_square') for move in moves
+        ]
+        policies = get_policy_targets(indices, counts, offsets)
+        assert np.array_equal(
+            policies,
+            to_ordering(get_policy_targets(*visits_to_arrays(visits)), 'to_square'),
+        )
+
+    @pytest.mark.parametrize('temperature', [1.0, 0.5, 2.0, 0.0, 0.01])
+    def test_dense(self, temperature):
+        visits = _get_visits()
+        policies = get_policy_targets(*visits_to_arrays(visits), temperature)
+        assert policies.shape == (len(visits), ACTION_SPACE_SIZE)
+        assert policies.dtype == np.float32
+        for policy, root in zip(policies, visits):
+            assert np.allclose(policy, _get_expected(root, temperature), atol=1e-6)
+
+    def test_low_temperature_does_not_overflow(self):
+        indices, counts, offsets = visits_to_arrays(
+            [{chess.Move.from_uci('e2e4'): 1e6}]
+        )
+        policy = get_policy_targets(indices, counts, offsets, temperature=1e-3)
+        assert policy.sum() == 1
+
+    @pytest.mark.parametrize('k', [1, 3, 40])
+    def test_top_k(self, k):
+        visits = _get_visits()
+        arrays = visits_to_arrays(visits)
+        top_indices, top_probabilities = get_top_k_policy_targets(*arrays, k)
+        assert top_indices.shape == top_probabilities.shape == (len(visits), k)
+        assert top_indices.dtype == np.uint16
+        for root, indices, probabilities in zip(visits, top_indices, top_probabilities):
+            expected = _get_expected(root, 1.0)
+            num_kept = min(k, int((expected > 0).sum()))
+            assert (np.diff(probabilities) <= 0).all()
+            assert (probabilities[num_kept:] == 0).all()
+            assert (indices[num_kept:] == 0).all()
+            kept = np.sort(expected)[::-1][:num_kept]
+            assert np.allclose(
+                probabilities[:num_kept], kept / kept.sum() if num_kept else kept
+            )
+            assert (expected[indices[:num_kept]] > 0).all()
+
+    def test_out(self):
+        arrays = visits_to_arrays(_get_visits())
+        out = np.ones((4, ACTION_SPACE_SIZE), dtype=np.float32)
+        assert get_policy_targets(*arrays, out=out) is out
+        assert np.array_equal(out, get_policy_targets(*arrays))
+
+    def test_invalid(self):
+        indices, counts, offsets = visits_to_arrays(_get_visits())
+        with pytest.raises(ValueError):
+            get_policy_targets(indices, counts, offsets, temperature=-1)
+        with pytest.raises(ValueError):
+            get_policy_targets(indices, counts[:-1], offsets)
+        with pytest.raises(ValueError):
+            get_policy_targets(indices, counts, offsets[:-1])
+        with pytest.raises(ValueError):
+            get_policy_targets(indices, -counts, offsets)
+        with pytest.raises(ValueError):
+            get_policy_targets(indices + ACTION_SPACE_SIZE, counts, offsets)
+        with pytest.raises(ValueError):
+            get_top_k_policy_targets(indices, counts, offsets, 0)
+        with pytest.raises(ValueError):
+            visits_to_arrays([{chess.Move.from_uci('a1h7'): 1}])
+
+
+class TestSparsePolicies:
+    def test_round_trip(self):
+        rng = np.random.default_rng(0)
+        dense = np.zeros((50, ACTION_SPACE_SIZE), dtype=np.float32)
+        for row in dense:
+            actions = rng.choice(
+                ACTION_SPACE_SIZE, size=rng.integers(0, 8), replace=False
+            )
+            row[actions] = rng.dirichlet(np.ones(len(actions))) if len(actions) else 0
+        # Action 0 must survive the padding
+        dense[0, :2] = [0.25, 0.75]
+        dense[0, 2:] = 0
+
+        sparse = dense_to_sparse_policies(dense, 8)
+        assert sparse.shape == (50, 8)
+        assert sparse.dtype == SPARSE_POLICY_DTYPE
+        assert sparse.itemsize == 4
+        assert (np.diff(sparse['probability'].astype(np.float32), axis=1) <= 0).all()
+        assert np.allclose(sparse_to_dense_policies(sparse), dense, atol=1e-3)
+
+    def test_truncation(self):
+        dense = np.zeros((1, ACTION_SPACE_SIZE), dtype=np.float32)
+        dense[0, [5, 9, 700]] = [0.2, 0.5, 0.3]
+        sparse = dense_to_sparse_policies(dense, 2)
+        assert sparse['index'].tolist() == [[9, 700]]
+        assert np.allclose(sparse['probability'].astype(np.float32), [[0.625, 0.375]])
+        raw = dense_to_sparse_policies(dense, 2, normalize=False)
+        assert np.allclose(
+            raw['probability'].astype(np.float32), [[0.5, 0.3]], atol=1e-3
+        )
+
+    def test_top_k_targets(self):
+        arrays = visits_to_arrays(_get_visits())
+        sparse = pack_sparse_policies(*get_top_k_policy_targets(*arrays, 64))
+        dense = get_policy_targets(*arrays)
+        assert np.allclose(sparse_to_dense_policies(sparse), dense, atol=1e-3)
+
+    def test_memmap(self, tmp_path):
+        path = tmp_path / 'policies.npy'
+        dense = get_policy_targets(*visits_to_arrays(_get_visits()))
+        buffer = open_sparse_policies(path, 'w+', shape=(4, 16))
+        sparse = dense_to_sparse_policies(dense, 16)
+        buffer[:] = sparse
+        buffer.flush()
+        del buffer
+        assert path.stat().st_size < 4 * 16 * 4 + 256
+
+        loaded = open_sparse_policies(path)
+        assert isinstance(loaded, np.memmap)
+        assert np.array_equal(loaded, sparse)
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ValueError):
+            dense_to_sparse_policies(np.zeros((2, 10)), 2)
+        with pytest.raises(ValueError):
+            dense_to_sparse_policies(np.zeros((2, ACTION_SPACE_SIZE)), 0)
+        with pytest.raises(ValueError):
+            pack_sparse_policies(np.zeros((2, 3)), np.zeros((2, 4)))
+        with pytest.raises(ValueError):
+            open_sparse_policies(tmp_path / 'policies.npy', 'w+')
+        np.save(tmp_path / 'other.npy', np.zeros((2, 3)))
+        with pytest.raises(ValueError):
+            open_sparse_policies(tmp_path / 'other.npy')
+
+
+class TestTopkLegal:
+    def test_matches_sort(self, random_boards):
+        boards = random_boards(64)
+        masks = get_legal_masks(boards)
+        logits = np.random.default_rng(0).normal(size=masks.shape).astype(np.float32)
+        result = topk_legal(logits, masks, 5, boards)
+        assert result.indices.shape == result.scores.shape == (64, 5)
+        assert result.moves is not None
+        for board, mask, row, indices, scores, moves in zip(
+            boards, masks, logits, result.indices, result.scores, result.moves
+        ):
+            legal = np.flatnonzero(mask)
+            expected = legal[np.argsort(-row[legal])][:5]
+            num_legal = len(expected)
+            assert indices[:num_legal].tolist() == expected.tolist()
+            assert (indices[num_legal:] == -1).all()
+            assert np.array_equal(scores[:num_legal], row[expected])
+            assert len(moves) == num_legal
+            assert all(move in board.legal_moves for move in moves)
+
+    def test_padding_and_promotions(self):
+        # Only the four promotions of one pawn are legal
+        board = chess.Board('k7/2Q5/1K6/8/8/8/4p3/8 b - - 0 1')
+        mask = get_legal_masks([board])
+        assert mask.sum() == 4
+        result = topk_legal(np.zeros_like(mask, dtype=np.float32), mask, 6, [board])
+        assert (result.indices[0, 4:] == -1).all()
+        assert np.isneginf(result.scores[0, 4:]).all()
+        assert result.moves is not None
+        assert {move.uci() for move in result.moves[0]} == {
+            'e2e1q',
+            'e2e1r',
+            'e2e1b',
+            'e2e1n',
+        }
+        assert topk_legal(mask, mask, 1).moves is None
+
+    def test_invalid(self):
+        mask = np.ones((2, ACTION_SPACE_SIZE), dtype=np.bool_)
+        with pytest.raises(ValueError):
+            topk_legal(np.zeros((2, 10)), mask, 1)
+        with pytest.raises(ValueError):
+            topk_legal(np.zeros((3, ACTION_SPACE_SIZE)), mask, 1)
+        with pytest.raises(ValueError):
+            topk_legal(np.zeros((2, ACTION_SPACE_SIZE)), mask, 0)
+        with pytest.raises(ValueError):
+            topk_legal(np.zeros((2, ACTION_SPACE_SIZE)), mask, 1, [chess.Board()])
+
+
+class TestToSquareTotals:
+    def test_totals(self):
+        policies = np.random.default_rng(0).random(
+            (3, ACTION_SPACE_SIZE), dtype=np.float32
+        )
+        expected = np.zeros((3, 64))
+        for index, move in enumerate(ACTION_SPACE):
+            expected[:, move.to_square] += policies[:, index]
+        totals = get_to_square_totals(policies)
+        assert totals.shape == (3, 64) and totals.dtype == np.float32
+        assert np.allclose(totals, expected)
+        assert np.allclose(get_to_square_totals(policies[0]), expected[0])
+        assert np.allclose(
+            get_to_square_totals(to_ordering(policies, 'direction'), 'direction'),
+            expected,
+        )
+
+    def test_legal_mask_counts(self, random_boards):
+        boards = random_boards(8)
+        totals = get_to_square_totals(get_legal_masks(boards))
+        for board, counts in zip(boards, totals):
+            expected = np.zeros(64, dtype=np.intp)
+            for move in board.legal_moves:
+                if move.promotion != chess.QUEEN:
+                    expected[move.to_square] += 1
+            assert np.array_equal(counts, expected)
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match='Expected policies'):
+            get_to_square_totals(np.zeros((2, 64)))
@@ -0,0 +1,113 @@
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    ACTION_SPACE_SIZE,
+    SearchTree,
+    get_action_index,
+    get_legal_mask,
+    get_policy_targets,
+    to_ordering,
+)
+
+UNIFORM_POLICY = np.ones(ACTION_SPACE_SIZE, dtype=np.float32)
+
+
+def _run_search(tree: SearchTree, fen: str, num_simulations: int) -> None:
+    for _ in range(num_simulations):
+        board = chess.Board(fen)
+        node, path = tree.descend(board)
+        # The player to move at a checkmate lost, everything else is a draw
+        value = -1.0 if board.is_checkmate() else 0.0
+        if not tree.is_expanded(node):
+            tree.expand_legal(node, get_legal_mask(board), UNIFORM_POLICY)
+        tree.backup(path, value)
+
+
+class TestSearchTree:
+    def test_expand(self):
+        board = chess.Board()
+        tree = SearchTree(max_nodes=16)
+        assert not tree.is_expanded(0)
+        tree.expand_legal(0, get_legal_mask(board), UNIFORM_POLICY)
+        edges = tree.get_edges(0)
+        assert tree.num_edges == edges.stop == 20
+        assert sorted(tree.edge_action[edges].tolist()) == sorted(
+            get_action_index(move) for move in board.legal_moves
+        )
+        assert np.allclose(tree.edge_prior[edges], 1 / 20)
+        assert (tree.edge_child[edges] == -1).all()
+        with pytest.raises(ValueError):
+            tree.expand_legal(0, get_legal_mask(board), UNIFORM_POLICY)
+
+    def test_descend_and_backup(self):
+        tree = SearchTree()
+        board = chess.Board()
+        tree.expand_legal(0, get_legal_mask(board), UNIFORM_POLICY)
+        node, path = tree.descend(board)
+        assert len(path) == 1 and len(board.move_stack) == 1
+        tree.expand_legal(node, get_legal_mask(board), UNIFORM_POLICY)
+
+        board = chess.Board()
+        leaf, path = tree.descend(board)
+        assert len(path) == 2 and len(board.move_stack) == 2
+        assert tree.num_nodes == 3
+        tree.backup(path, 1.0)
+        # The leaf's player to move is the one who made the first move
+        assert tree.edge_value_sum[path].tolist() == [1.0, -1.0]
+        assert tree.edge_visits[path].tolist() == [1.0, 1.0]
+
+    def test_finds_mate_in_one(self):
+        fen = '6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1'
+        tree = SearchTree()
+        _run_search(tree, fen, 300)
+        actions, visits = tree.get_visit_counts()
+        best = chess.Move.from_uci('a1a8')
+        assert actions[np.argmax(visits)] == get_action_index(best)
+
+        policy = get_policy_targets(actions, visits, [0, len(actions)])
+        assert policy.shape == (1, ACTION_SPACE_SIZE)
+        assert np.isclose(policy.sum(), 1)
+
+    def test_ordering(self):
+        board = chess.Board()
+        tree = SearchTree(ordering='direction')
+        policy = np.random.default_rng(0).random(ACTION_SPACE_SIZE)
+        tree.expand_legal(
+            0,
+            get_legal_mask(board, ordering='direction'),
+            to_ordering(policy, 'direction'),
+        )
+        edges = tree.get_edges(0)
+        expected = {
+            get_action_index(move, 'direction'): policy[get_action_index(move)]
+            for move in board.legal_moves
+        }
+        assert sorted(tree.edge_action[edges].tolist()) == sorted(expected)
+        total = sum(expected.values())
+        for action, prior in zip(tree.edge_action[edges], tree.edge_prior[edges]):
+            assert np.isclose(prior, expected[action] / total)
+
+        _, path = tree.descend(board)
+        move = board.peek()
+        assert tree.edge_action[path[0]] == get_action_index(move, 'direction')
+        assert move in chess.Board().legal_moves
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            SearchTree(ordering='nope')
+
+    def test_pools(self):
+        tree = SearchTree(max_nodes=2, max_edges=30)
+        board = chess.Board()
+        tree.expand_legal(0, get_legal_mask(board), UNIFORM_POLICY)
+        child = tree.get_child(0)
+        with pytest.raises(IndexError):
+            tree.expand_legal(child, get_legal_mask(board), UNIFORM_POLICY)
+        with pytest.raises(IndexError):
+            tree.get_child(1)
+
+        tree.reset()
+        assert (tree.num_nodes, tree.num_edges) == (1, 0)
+        assert not tree.is_expanded(0)
+        with pytest.raises(ValueError):
+            SearchTree(max_nodes=0)
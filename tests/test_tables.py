@@ -0,0 +1,96 @@
+import multiprocessing
+from multiprocessing import resource_tracker
+
+import numpy as np
+import pytest
+
+from chess_action_space.tables import (
+    MMAP_ENV_VAR,
+    SHARED_MEMORY_ENV_VAR,
+    attach_tables,
+    get_table_names,
+    load_table,
+    publish_tables,
+)
+
+
+def _check_worker_tables(queue: multiprocessing.Queue) -> None:
+    from chess_action_space import tables
+    from chess_action_space.encoding import ACTION_KEYS
+
+    assert tables._attached_tables is not None
+    queue.put(ACTION_KEYS.tolist())
+
+
+def _attach_worker_tables(name: str, queue: multiprocessing.Queue) -> None:
+    calls = []
+    resource_tracker.register = lambda *args: calls.append(('register', *args))
+    resource_tracker.unregister = lambda *args: calls.append(('unregister', *args))
+    shared = attach_tables(name)
+    keys = shared.tables['action_keys'].tolist()
+    shared.close()
+    queue.put((calls, keys))
+
+
+class TestSharedTables:
+    def test_publish_and_attach(self):
+        published = publish_tables(export=False)
+        try:
+            attached = attach_tables(published.name)
+            assert sorted(attached.tables) == get_table_names()
+            for name, table in attached.tables.items():
+                assert not table.flags.writeable
+                assert np.array_equal(table, load_table(name))
+        finally:
+            published.unlink()
+
+    def test_spawned_worker_attaches(self, monkeypatch):
+        published = publish_tables(export=False)
+        monkeypatch.setenv(SHARED_MEMORY_ENV_VAR, published.name)
+        try:
+            ctx = multiprocessing.get_context('spawn')
+            queue = ctx.Queue()
+            process = ctx.Process(target=_check_worker_tables, args=(queue,))
+            process.start()
+            keys = queue.get(timeout=60)
+            process.join()
+            assert process.exitcode == 0
+            assert keys == load_table('action_keys').tolist()
+        finally:
+            published.unlink()
+
+    @pytest.mark.skipif(
+        'fork' not in multiprocessing.get_all_start_methods(),
+        reason='requires the fork start method',
+    )
+    @pytest.mark.filterwarnings(
+        'ignore:This process .* is multi-threaded:DeprecationWarning'
+    )
+    def test_forked_worker_attaches(self):
+        # Forked workers share the resource tracker of their parent, so attaching must neither register nor
+        # unregister the block, which would drop the registration of the publisher
+        published = publish_tables(export=False)
+        try:
+            ctx = multiprocessing.get_context('fork')
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=_attach_worker_tables, args=(published.name, queue)
+            )
+            process.start()
+            calls, keys = queue.get(timeout=60)
+            process.join()
+            assert process.exitcode == 0
+            assert calls == []
+            assert keys == load_table('action_keys').tolist()
+        finally:
+            published.unlink()
+
+
+class TestMemoryMappedTables:
+    def test_load_table_mmap(self, monkeypatch):
+        monkeypatch.setenv(MMAP_ENV_VAR, '1')
+        table = load_table('key_to_action_index')
+        assert isinstance(table, np.memmap)
+        assert not table.flags.writeable
+        monkeypatch.delenv(MMAP_ENV_VAR)
+        assert np.array_equal(table, load_table('key_to_action_index'))
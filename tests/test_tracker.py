@@ -0,0 +1,71 @@
+import random
+
+import chess
+import numpy as np
+import pytest
+
+from chess_action_space import (
+    LegalMaskTracker,
+    get_action_index,
+    get_legal_mask,
+)
+
+
+class TestLegalMaskTracker:
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_full_mask(self, seed):
+        rng = random.Random(seed)
+        tracker = LegalMaskTracker()
+        for _ in range(400):
+            board = tracker.board
+            mask = tracker.mask
+            assert np.array_equal(mask, get_legal_mask(board)), board.fen()
+
+            if board.is_game_over() or (board.move_stack and rng.random() < 0.3):
+                tracker.pop()
+                continue
+            move = rng.choice(list(board.legal_moves))
+            pushed = tracker.push(get_action_index(move))
+            assert pushed == move
+
+    def test_pop_restores_mask(self):
+        tracker = LegalMaskTracker()
+        mask = tracker.mask
+        assert not mask.flags.writeable
+        tracker.push(get_action_index(chess.Move.from_uci('e2e4')))
+        assert tracker.mask is not mask
+        tracker.pop()
+        assert tracker.mask is mask
+        with pytest.raises(IndexError):
+            tracker.pop()
+
+    def test_queen_promotion(self):
+        tracker = LegalMaskTracker(chess.Board('8/4P3/8/8/8/8/8/k6K w - - 0 1'))
+        move = tracker.push(get_action_index(chess.Move.from_uci('e7e8')))
+        assert move == chess.Move.from_uci('e7e8q')
+
+    def test_random_start_positions(self, random_boards):
+        rng = random.Random(0)
+        for board in random_boards(50):
+            tracker = LegalMaskTracker(board)
+            for _ in range(40):
+                assert np.array_equal(tracker.mask, get_legal_mask(board)), board.fen()
+                if board.is_game_over():
+                    break
+                tracker.push(get_action_index(rng.choice(list(board.legal_moves))))
+
+    @pytest.mark.parametrize('ordering', ['to_square', 'direction'])
+    def test_ordering(self, ordering):
+        rng = random.Random(0)
+        tracker = LegalMaskTracker(ordering=ordering)
+        board = tracker.board
+        for _ in range(200):
+            assert np.array_equal(
+                tracker.mask, get_legal_mask(board, ordering=ordering)
+            ), board.fen()
+            if board.is_game_over():
+                break
+            move = rng.choice(list(board.legal_moves))
+            assert tracker.push(get_action_index(move, ordering)) == move
+        with pytest.raises(ValueError, match='Unknown ordering'):
+            LegalMaskTracker(ordering='nope')